@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import mmap
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.content_store import ContentStore, FileContent
+
+
+class TestFileContent(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.path = Path(self._tempdir.name) / "test.nasl"
+
+    def test_raw_and_text(self):
+        self.path.write_bytes(b"a\r\nb\rc\n\xe4")
+
+        content = FileContent(self.path)
+
+        self.assertEqual(content.raw, b"a\r\nb\rc\n\xe4")
+        self.assertEqual(content.text, self.path.read_text(encoding=CURRENT_ENCODING))
+        self.assertEqual(content.size, 8)
+
+    def test_memory_mapped(self):
+        self.path.write_bytes(b"a\r\nb\rc\n\xe4")
+
+        content = FileContent(self.path, mmap_threshold=8)
+
+        self.assertIsInstance(content.raw, mmap.mmap)
+        self.assertEqual(content.raw[:], b"a\r\nb\rc\n\xe4")
+        self.assertEqual(content.text, self.path.read_text(encoding=CURRENT_ENCODING))
+        self.assertEqual(content.size, 8)
+
+    def test_changed_file_mapping_closed(self):
+        self.path.write_bytes(b"x" * 16)
+        content = FileContent(self.path, mmap_threshold=8)
+        mapping = content.raw
+
+        self.path.write_bytes(b"x" * 4)
+
+        self.assertFalse(content.is_current())
+        self.assertTrue(mapping.closed)
+        self.assertEqual(content.size, 16)
+        # mapped again on the next access
+        self.assertEqual(content.raw, b"x" * 4)
+
+    def test_small_file_not_memory_mapped(self):
+        self.path.write_bytes(b"foo")
+
+        content = FileContent(self.path, mmap_threshold=8)
+
+        self.assertIsInstance(content.raw, bytes)
+
+    def test_empty_file(self):
+        self.path.write_bytes(b"")
+
+        content = FileContent(self.path, mmap_threshold=0)
+
+        self.assertEqual(content.raw, b"")
+        self.assertEqual(content.text, "")
+
+    def test_read_once(self):
+        self.path.write_bytes(b"foo")
+        content = FileContent(self.path)
+
+        with patch.object(Path, "read_bytes", return_value=b"foo") as read_bytes:
+            self.assertEqual(content.text, "foo")
+            self.assertEqual(content.raw, b"foo")
+
+        read_bytes.assert_called_once()
+
+
+class TestContentStore(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.tmp = Path(self._tempdir.name)
+
+    def _create_file(self, name: str, size: int) -> Path:
+        path = self.tmp / name
+        path.write_bytes(b"x" * size)
+        return path
+
+    def test_get_returns_same_content(self):
+        path = self._create_file("a.nasl", 10)
+        store = ContentStore()
+
+        self.assertIs(store.get(path), store.get(path))
+        self.assertEqual(len(store), 1)
+
+    def test_changed_file_is_read_again(self):
+        path = self._create_file("a.nasl", 10)
+        store = ContentStore()
+        content = store.get(path)
+
+        path.write_bytes(b"y" * 20)
+
+        self.assertIsNot(store.get(path), content)
+        self.assertEqual(store.get(path).raw, b"y" * 20)
+        self.assertEqual(len(store), 1)
+
+    def test_least_recently_used_is_dropped(self):
+        a = self._create_file("a.nasl", 10)
+        b = self._create_file("b.nasl", 10)
+        c = self._create_file("c.nasl", 10)
+        store = ContentStore(max_bytes=20)
+
+        store.get(a)
+        store.get(b)
+        store.get(a)
+        store.get(c)
+
+        self.assertIn(a, store)
+        self.assertNotIn(b, store)
+        self.assertIn(c, store)
+
+    def test_keeps_file_larger_than_limit(self):
+        path = self._create_file("large.nasl", 100)
+        store = ContentStore(max_bytes=10)
+
+        store.get(path)
+
+        self.assertIn(path, store)
+
+    def test_dropped_mapping_closed(self):
+        a = self._create_file("a.nasl", 10)
+        b = self._create_file("b.nasl", 10)
+        store = ContentStore(max_bytes=10, mmap_threshold=8)
+        mapping = store.get(a).raw
+
+        store.get(b)
+
+        self.assertNotIn(a, store)
+        self.assertTrue(mapping.closed)
+
+    def test_release(self):
+        path = self._create_file("a.nasl", 10)
+        store = ContentStore(mmap_threshold=8)
+        content = store.get(path)
+        mapping = content.raw
+
+        store.release(path)
+
+        self.assertTrue(mapping.closed)
+        self.assertNotIn(path, store)
+        self.assertIsNot(store.get(path), content)
+
+    def test_release_rewritten_file(self):
+        path = self._create_file("a.nasl", 4)
+        store = ContentStore()
+        self.assertEqual(store.get(path).text, "x" * 4)
+
+        # a fix rewrites the file within the same mtime and size
+        stat = path.stat()
+        path.write_text("y" * 4, encoding=CURRENT_ENCODING)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        store.release(path)
+
+        self.assertEqual(store.get(path).text, "y" * 4)
+        self.assertEqual(store._size, 4)
+
+    def test_missing_file(self):
+        with self.assertRaises(OSError):
+            ContentStore().get(self.tmp / "missing.nasl")
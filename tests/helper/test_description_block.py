@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import unittest
+
+from troubadix.helper.description_block import find_description_block
+
+
+class FindDescriptionBlockTestCase(unittest.TestCase):
+    def test_description_block(self):
+        content = (
+            "# Copyright\n"
+            "if(description)\n"
+            "{\n"
+            '  script_tag(name:"summary", value:"Braces } { in a string.");\n'
+            "  # a comment with a }\n"
+            "  exit(0);\n"
+            "}\n"
+            "\n"
+            'if (x) { display("foo"); }\n'
+        )
+
+        start, end = find_description_block(content)
+
+        self.assertEqual(content[start:end], content[12 : content.index("}\n\n") + 1])
+
+    def test_indented_and_spaces(self):
+        content = '  if ( description ) {\n  script_oid("1.2.3");\n  exit(0);\n}\nfoo();'
+
+        start, end = find_description_block(content)
+
+        self.assertEqual(content[start:end], content[: content.index("\nfoo")])
+
+    def test_no_description_block(self):
+        self.assertIsNone(find_description_block('script_tag(name:"summary", value:"foo");'))
+        self.assertIsNone(find_description_block("if(description) exit(0);"))
+        self.assertIsNone(find_description_block("if(description) {\n  exit(0);\n"))
+        self.assertIsNone(find_description_block("if(!description) {\n}"))
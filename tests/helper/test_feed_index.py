@@ -0,0 +1,316 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import os
+import pickle
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from troubadix.helper.feed_index import (
+    FEED_INDEX_FILE,
+    FeedIndex,
+    FeedIndexFile,
+    VTMetadata,
+)
+
+CONTENT = (
+    "if(description)\n"
+    "{\n"
+    '  script_oid("1.3.6.1.4.1.25623.1.0.100313");\n'
+    '  script_version("2024-01-02T10:11:12+0000");\n'
+    '  script_cve_id("CVE-2024-1234", "CVE-2024-56789");\n'
+    '  script_tag(name:"solution_type", value:"VendorFix");\n'
+    "  script_category(ACT_SETTINGS);\n"
+    '  script_family("Settings");\n'
+    '  script_dependencies("foo.nasl", "bar.nasl");\n'
+    '  if(FEED_NAME == "GSF" || FEED_NAME == "GEF" || FEED_NAME == "SCM")\n'
+    '    script_dependencies("gsf/baz.nasl");\n'
+    "  exit(0);\n"
+    "}\n"
+)
+
+DEPRECATED_CONTENT = (
+    "if(description)\n"
+    "{\n"
+    '  script_oid("1.3.6.1.4.1.25623.1.0.100314");\n'
+    '  script_tag(name:"deprecated", value:TRUE);\n'
+    "  exit(0);\n"
+    "}\n"
+    "exit(66);\n"
+)
+
+
+class TestVTMetadata(unittest.TestCase):
+    def test_from_content(self):
+        metadata = VTMetadata.from_content(Path("foo.nasl"), CONTENT)
+
+        self.assertEqual(metadata.path, Path("foo.nasl"))
+        self.assertEqual(metadata.oid, "1.3.6.1.4.1.25623.1.0.100313")
+        self.assertEqual(metadata.family, "Settings")
+        self.assertEqual(metadata.category, "ACT_SETTINGS")
+        self.assertFalse(metadata.deprecated)
+        self.assertFalse(metadata.deprecated_tag)
+        self.assertEqual(
+            metadata.dependencies,
+            (("foo.nasl", False), ("bar.nasl", False), ("gsf/baz.nasl", True)),
+        )
+        self.assertEqual(metadata.cves, ("CVE-2024-1234", "CVE-2024-56789"))
+        self.assertEqual(metadata.script_version, "2024-01-02T10:11:12+0000")
+        self.assertEqual(metadata.solution_type, "VendorFix")
+
+    def test_from_content_exit_66(self):
+        metadata = VTMetadata.from_content(Path("foo.nasl"), "exit(0);\nexit(66);\n")
+
+        self.assertTrue(metadata.deprecated)
+        self.assertFalse(metadata.deprecated_tag)
+
+    def test_from_content_deprecated(self):
+        metadata = VTMetadata.from_content(Path("foo.nasl"), DEPRECATED_CONTENT)
+
+        self.assertEqual(metadata.oid, "1.3.6.1.4.1.25623.1.0.100314")
+        self.assertIsNone(metadata.family)
+        self.assertIsNone(metadata.category)
+        self.assertTrue(metadata.deprecated)
+        self.assertTrue(metadata.deprecated_tag)
+        self.assertEqual(metadata.dependencies, ())
+        self.assertEqual(metadata.cves, ())
+        self.assertIsNone(metadata.script_version)
+        self.assertIsNone(metadata.solution_type)
+
+
+class TestFeedIndex(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.root = Path(self._tempdir.name)
+
+    def _write(self, path: Path, content: str) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="latin1")
+        return path
+
+    def test_get(self):
+        path = self._write(self.root / "common" / "foo.nasl", CONTENT)
+        index = FeedIndex(self.root)
+
+        metadata = index.get("foo.nasl")
+
+        self.assertEqual(metadata.path, path)
+        self.assertEqual(metadata.category, "ACT_SETTINGS")
+        self.assertIn("foo.nasl", index)
+
+    def test_get_missing(self):
+        index = FeedIndex(self.root)
+
+        self.assertIsNone(index.get("foo.nasl"))
+        self.assertNotIn("foo.nasl", index)
+
+        # added later, e.g. between two runs of a server
+        self._write(self.root / "foo.nasl", CONTENT)
+
+        self.assertIsNotNone(index.get("foo.nasl"))
+
+    def test_resolve_last_feed_version_wins(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+        path = self._write(self.root / "22.04" / "foo.nasl", DEPRECATED_CONTENT)
+        index = FeedIndex(self.root)
+
+        self.assertEqual(index.resolve("foo.nasl"), path)
+        self.assertTrue(index.get("foo.nasl").deprecated)
+
+    def test_parsed_once(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+        index = FeedIndex(self.root)
+
+        with patch.object(VTMetadata, "from_content", wraps=VTMetadata.from_content) as parse:
+            first = index.get("foo.nasl")
+            second = index.get("foo.nasl")
+
+        self.assertIs(first, second)
+        parse.assert_called_once()
+
+    def test_changed_file_parsed_again(self):
+        path = self._write(self.root / "common" / "foo.nasl", CONTENT)
+        index = FeedIndex(self.root)
+        self.assertFalse(index.get("foo.nasl").deprecated)
+
+        self._write(path, DEPRECATED_CONTENT)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertTrue(index.get("foo.nasl").deprecated)
+
+    def test_removed_file(self):
+        path = self._write(self.root / "common" / "foo.nasl", CONTENT)
+        index = FeedIndex(self.root)
+        self.assertIsNotNone(index.get("foo.nasl"))
+
+        path.unlink()
+
+        self.assertIsNone(index.get("foo.nasl"))
+        self.assertNotIn("foo.nasl", index)
+
+    def test_stored(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+        with FeedIndexFile(self.root / FEED_INDEX_FILE) as feed_index_file:
+            feed_index_file.refresh()
+        index = FeedIndex(self.root, index_file=self.root / FEED_INDEX_FILE)
+
+        with patch.object(VTMetadata, "from_content") as parse:
+            metadata = index.get("foo.nasl")
+
+        parse.assert_not_called()
+        self.assertEqual(metadata.path, self.root / "common" / "foo.nasl")
+        self.assertEqual(metadata.oid, "1.3.6.1.4.1.25623.1.0.100313")
+
+    def test_stored_outdated(self):
+        path = self._write(self.root / "common" / "foo.nasl", CONTENT)
+        self._write(self.root / "common" / "bar.nasl", CONTENT)
+        with FeedIndexFile(self.root / FEED_INDEX_FILE) as feed_index_file:
+            feed_index_file.refresh()
+
+        self._write(path, DEPRECATED_CONTENT)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        index = FeedIndex(self.root, index_file=self.root / FEED_INDEX_FILE)
+
+        self.assertTrue(index.get("foo.nasl").deprecated)
+        # not within the index
+        self.assertIsNone(index.get("baz.nasl"))
+
+    def test_pickle_without_connection(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+        with FeedIndexFile(self.root / FEED_INDEX_FILE) as feed_index_file:
+            feed_index_file.refresh()
+        index = FeedIndex(self.root, index_file=self.root / FEED_INDEX_FILE)
+        index.get("foo.nasl")
+
+        copy = pickle.loads(pickle.dumps(index))
+
+        self.assertEqual(copy.get("foo.nasl").oid, "1.3.6.1.4.1.25623.1.0.100313")
+
+
+class TestFeedIndexFile(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.root = Path(self._tempdir.name)
+        self.index_file = self.root / FEED_INDEX_FILE
+
+    def _write(self, path: Path, content: str) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="latin1")
+        return path
+
+    def _touch(self, path: Path) -> None:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_refresh(self):
+        foo = self._write(self.root / "common" / "foo.nasl", CONTENT)
+        bar = self._write(self.root / "common" / "bar.nasl", CONTENT)
+        baz = self._write(self.root / "22.04" / "baz.nasl", CONTENT)
+        self._write(self.root / "common" / "foo.inc", CONTENT)
+        self._write(self.root / ".git" / "foo.nasl", CONTENT)
+
+        with FeedIndexFile(self.index_file) as feed_index:
+            statistic = feed_index.refresh()
+
+            self.assertEqual((statistic.parsed, statistic.unchanged, statistic.removed), (3, 0, 0))
+            self.assertEqual(len(feed_index), 3)
+
+        self._write(foo, DEPRECATED_CONTENT)
+        self._touch(foo)
+        # touched, but not changed
+        self._touch(bar)
+        baz.unlink()
+
+        with FeedIndexFile(self.index_file) as feed_index:
+            with patch.object(VTMetadata, "from_content", wraps=VTMetadata.from_content) as parse:
+                statistic = feed_index.refresh()
+
+            parse.assert_called_once()
+            self.assertEqual((statistic.parsed, statistic.unchanged, statistic.removed), (1, 1, 1))
+            self.assertEqual(statistic.total, 2)
+            self.assertTrue(feed_index.get("common/foo.nasl").deprecated)
+            self.assertFalse(feed_index.get(Path("common/bar.nasl")).deprecated)
+            self.assertIsNone(feed_index.get("22.04/baz.nasl"))
+            self.assertEqual(
+                [vt.path for vt in feed_index],
+                [self.root / "common" / "bar.nasl", self.root / "common" / "foo.nasl"],
+            )
+
+    def test_get(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+
+        with FeedIndexFile(self.index_file) as feed_index:
+            feed_index.refresh()
+
+        with FeedIndexFile(self.index_file, read_only=True) as feed_index:
+            self.assertEqual(
+                feed_index.get("common/foo.nasl"),
+                VTMetadata.from_content(self.root / "common" / "foo.nasl", CONTENT),
+            )
+
+    def test_resolve(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+        path = self._write(self.root / "22.04" / "foo.nasl", DEPRECATED_CONTENT)
+
+        with FeedIndexFile(self.index_file) as feed_index:
+            feed_index.refresh()
+            metadata, signature = feed_index.resolve("foo.nasl")
+
+            self.assertIsNone(feed_index.resolve("bar.nasl"))
+
+        stat = path.stat()
+        self.assertEqual(metadata.path, path)
+        self.assertEqual(signature, (stat.st_mtime_ns, stat.st_size))
+
+    def test_oid_index(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+        self._write(self.root / "common" / "bar.nasl", DEPRECATED_CONTENT)
+        self._write(self.root / "common" / "foo2.nasl", CONTENT)
+
+        with FeedIndexFile(self.index_file) as feed_index:
+            feed_index.refresh()
+            oid_index = feed_index.oid_index()
+
+        self.assertEqual(oid_index.get("1.3.6.1.4.1.25623.1.0.100313"), Path("common/foo.nasl"))
+        self.assertEqual(oid_index.get("1.3.6.1.4.1.25623.1.0.100314"), Path("common/bar.nasl"))
+        self.assertEqual(len(oid_index), 2)
+
+    def test_read_only_missing(self):
+        with self.assertRaises(ValueError):
+            FeedIndexFile(self.index_file, read_only=True)
+
+        self.assertFalse(self.index_file.exists())
+
+    def test_other_version(self):
+        self._write(self.root / "common" / "foo.nasl", CONTENT)
+        with FeedIndexFile(self.index_file) as feed_index:
+            feed_index.refresh()
+
+        connection = sqlite3.connect(self.index_file)
+        connection.execute("PRAGMA user_version = 0")
+        connection.close()
+
+        with self.assertRaises(ValueError):
+            FeedIndexFile(self.index_file, read_only=True)
+
+        with FeedIndexFile(self.index_file) as feed_index:
+            self.assertEqual(len(feed_index), 0)
+            self.assertEqual(feed_index.refresh().parsed, 1)
+
+    def test_refresh_parallel(self):
+        for i in range(4):
+            self._write(self.root / "common" / f"foo{i}.nasl", CONTENT)
+
+        with patch("troubadix.helper.feed_index.PARALLEL_REFRESH_FILES", 2):
+            with FeedIndexFile(self.index_file) as feed_index:
+                statistic = feed_index.refresh(n_jobs=2)
+
+                self.assertEqual(statistic.parsed, 4)
+                self.assertEqual(len(feed_index), 4)
@@ -17,12 +17,17 @@
 
 import re
 import unittest
+from itertools import product
+from pathlib import Path
+from unittest.mock import patch
 
 from troubadix.helper.linguistic_exception_handler import (
     CompositeCheck,
     FileCheck,
     FilePatternCheck,
     FilesCheck,
+    LinguisticCheck,
+    LinguisticExceptionMatcher,
     PatternCheck,
     PatternInFileCheck,
     PatternInFilePatternCheck,
@@ -32,8 +37,82 @@ from troubadix.helper.linguistic_exception_handler import (
     PatternsInFilePatternCheck,
     TextCheck,
     TextInFileCheck,
+    _literal_prefix,
     handle_linguistic_checks,
 )
+from troubadix.helper.spell_checker import SpellChecker
+from troubadix.plugins import grammar, spelling
+
+FILES = [
+    "/feed/nasl/common/gb_foo.nasl",
+    "/feed/nasl/common/policy_file_checksums_win.nasl",
+    "/feed/nasl/common/smtp_AV_42zip_DoS.nasl",
+    "/feed/nasl/common/bad_ssh_host_keys.inc",
+    "/feed/nasl/common/wmi_misc.inc",
+    "/feed/nasl/common/ssl_funcs.inc",
+    "/feed/nasl/common/gb_huawei_espace_detect.nasl",
+    "/feed/nasl/common/2022/debian/deb_dla_2896.nasl",
+    "/feed/nasl/common/2022/debian/deb_5123_1.nasl",
+    "/feed/nasl/common/2021/ubuntu/gb_ubuntu_USN_4711_1.nasl",
+    "/feed/nasl/common/2021/suse/gb_sles_2021_3215_1.nasl",
+    "/feed/nasl/common/2018/suse/gb_opensuse_2018_1900_1.nasl",
+    "/feed/nasl/common/attic/PCIDSS/pci_foo.nasl",
+    "/feed/nasl/common/GSHB/GSHB_foo.nasl",
+    "/feed/nasl/common/Policy/ITG/itg_foo.nasl",
+    "/feed/nasl/common/gb_exchange_server_CVE-2021-26855_active.nasl",
+    "/feed/nasl/common/2021/mozilla/gb_mozilla_firefox_mfsa_2021-01_lin.nasl",
+    "/feed/nasl/common/2022/mageia/MGASA-2022-0001.nasl",
+    "/feed/nasl/common/2021/oracle/ELSA-2021-12345.nasl",
+    "/feed/nasl/common/gb_cisco_nam_detect.nasl",
+    "/feed/nasl/common/netop_infopublic.nasl",
+    "/feed/nasl/common/gb_eclipse_vertx_detect.nasl",
+    "/feed/nasl/common/Tomcat/tomcat_detect.nasl",
+    "/feed/nasl/common/gb_apache_tomcat_foo.nasl",
+    "/feed/nasl/common/gb_cisco_caf_foo.nasl",
+    "/feed/nasl/common/gb_perfact_openvpn-client_smb_login_detect.nasl",
+    "/feed/nasl/common/2012/vmware/gb_VMSA-2010-0007.nasl",
+]
+
+LINES = [
+    '  script_tag(name:"summary", value:"This allow an attacker to bypass");\n',
+    "A few issues have been fixed in this files.\n",
+    '"a few vulnerabilities were found"',
+    "The a multiple keyboard issue\n",
+    "Multiple Products prior to version 1.2 Vulnerability",
+    "  MyProduct versions prior to version 1.2.3.\n",
+    "with WITH stack unwinding",
+    "these error messages are shown (Note that this is fine)",
+    "Harald Welte discovered that if a process issues",
+    "this filesystem, these filesystems and this allow list",
+    "and Or Cohen discovered an attackers choise",
+    "these file permissions and THESE FILE NAMES",
+    "e. VMware VMnc Codec heap overflow vulnerabilities\n\n  Vulnerabilities in the",
+    "Multiple Cross-Site Request Forgery (CSRF) vulnerabilities",
+    "multiple HTTP request smuggling issues and multiple request streams",
+    "Multiple server side request forgery vulnerabilities",
+    "  when a client requests a date",
+    "is prone to a security bypass vulnerabilities",
+]
+
+
+def _texts(check: LinguisticCheck) -> list[str]:
+    """The texts and patterns of the check and its sub checks"""
+    if isinstance(check, CompositeCheck):
+        return [text for sub_check in check.checks for text in _texts(sub_check)]
+    if isinstance(check, TextCheck):
+        return [check.text]
+    if isinstance(check, PatternCheck):
+        return [check.pattern.pattern]
+    if isinstance(check, PatternsCheck):
+        return [pattern.pattern for pattern in check.patterns]
+    return []
+
+
+class ExecutedCheck(LinguisticCheck):
+    """A check looking at the file and the correction at once"""
+
+    def execute(self, file_path: str, correction: str) -> bool:
+        return correction in file_path
 
 
 class LinguisticExceptionHandlerTestCase(unittest.TestCase):
@@ -200,3 +279,139 @@ class LinguisticExceptionHandlerTestCase(unittest.TestCase):
         self.assertEqual(handle_linguistic_checks("test1", "bar1", checks), True)
         self.assertEqual(handle_linguistic_checks("hello1", "foo1", checks), True)
         self.assertEqual(handle_linguistic_checks("hello1", "bar1", checks), False)
+
+    def test_exception_matcher(self):
+        matcher = LinguisticExceptionMatcher([FileCheck("test"), TextCheck("foo")])
+
+        self.assertEqual(matcher.matches("test1", "foo1"), True)
+        self.assertEqual(matcher.matches("test1", "bar1"), True)
+        self.assertEqual(matcher.matches("hello1", "foo1"), True)
+        self.assertEqual(matcher.matches("hello1", "bar1"), False)
+
+    def test_exception_matcher_composite_checks(self):
+        matcher = LinguisticExceptionMatcher(
+            [
+                PatternsInFilePatternCheck(r"test|hello", [r"foo\d", r"bar\d"]),
+                CompositeCheck(TextInFileCheck("baz", "qux"), PatternCheck(r"q.x\d")),
+            ]
+        )
+
+        self.assertEqual(matcher.matches("test1", "foo1"), True)
+        self.assertEqual(matcher.matches("test1", "bar1"), True)
+        self.assertEqual(matcher.matches("baz1", "foo1"), False)
+        self.assertEqual(matcher.matches("baz1", "qux1"), True)
+        self.assertEqual(matcher.matches("baz1", "qux"), False)
+
+    def test_exception_matcher_not_split_checks(self):
+        matcher = LinguisticExceptionMatcher(
+            [TextCheck("foo"), CompositeCheck(FileCheck("test"), ExecutedCheck())]
+        )
+
+        self.assertEqual(matcher.matches("test1", "foo"), True)
+        self.assertEqual(matcher.matches("test1", "test"), True)
+        self.assertEqual(matcher.matches("test1", "bar"), False)
+        self.assertEqual(matcher.matches("hello", "hell"), False)
+
+    def test_exception_matcher_cached_results(self):
+        matcher = LinguisticExceptionMatcher([PatternInFileCheck("test", r"foo\d")])
+
+        with patch(
+            "troubadix.helper.linguistic_exception_handler.MAX_CACHED_RESULTS",
+            2,
+        ):
+            results = [
+                matcher.matches(file, correction)
+                for file, correction in product(["test1", "hello", "test2"], ["foo1", "bar"])
+            ]
+
+        self.assertEqual(results, [True, False, False, False, True, False])
+        self.assertLessEqual(len(matcher._file_masks), 2)
+
+    def test_exception_matcher_grouped_by_text(self):
+        foo = PatternCheck(r"foo\s+bar")
+        baz = PatternCheck(r"Baz\s+qux", re.IGNORECASE)
+        other = PatternCheck(r"(a|b)c")
+        matcher = LinguisticExceptionMatcher([foo, baz, other])
+
+        with (
+            patch.object(foo, "execute", wraps=foo.execute) as foo_execute,
+            patch.object(baz, "execute", wraps=baz.execute) as baz_execute,
+            patch.object(other, "execute", wraps=other.execute) as other_execute,
+        ):
+            self.assertEqual(matcher.matches("test", "a BAZ qux line"), True)
+            self.assertEqual(matcher.matches("test", "a line"), False)
+            self.assertEqual(matcher.matches("test", "a foo line"), False)
+
+        self.assertEqual(foo_execute.call_count, 1)
+        self.assertEqual(baz_execute.call_count, 1)
+        # patterns without a literal start are tried for every hit not
+        # passing an earlier check
+        self.assertEqual(other_execute.call_count, 2)
+
+    def test_literal_prefix(self):
+        self.assertEqual(_literal_prefix(re.compile(r"foo\s+bar")), "foo")
+        self.assertEqual(_literal_prefix(re.compile(r"Foo bar", re.IGNORECASE)), "foo bar")
+        self.assertEqual(_literal_prefix(re.compile(r"foos?")), "foo")
+        self.assertEqual(_literal_prefix(re.compile(r"foo|bar")), "")
+        self.assertEqual(_literal_prefix(re.compile(r"foo(a|b)")), "foo")
+        self.assertEqual(_literal_prefix(re.compile(r"[Ff]oo")), "")
+        self.assertEqual(_literal_prefix(re.compile(r"foo bar", re.VERBOSE)), "")
+
+    def test_exception_matcher_same_as_handler_for_spelling(self):
+        texts = [text for check in spelling.exceptions for text in _texts(check)]
+        words = {word for text in texts for word in re.findall(r"[A-Za-z]+", text)}
+        spell_checker = SpellChecker([Path(spelling.codespell_config_path) / "codespell.additions"])
+        corrections = (
+            {
+                error.text
+                for word in words
+                for variant in (word, word.lower(), word.upper(), word.capitalize())
+                for error in spell_checker.check("words", f"{variant}\n")
+            }
+            | {f"{word} ==> {word}" for word in words}
+            | {"nin ==> inn", "nIn ==> inn, min", "PerFact ==> prefect, perfect", "perfact ==> x"}
+            # the simple patterns as the corrections they match
+            | {
+                text.replace(r"\s+", " ")
+                for text in texts
+                if not re.search(r"[\[\]()|.*?]", text.replace(r"\s+", " "))
+            }
+        )
+        matcher = LinguisticExceptionMatcher(spelling.exceptions)
+
+        results = [
+            (file, correction, matcher.matches(file, correction))
+            for file, correction in product(FILES, sorted(corrections))
+        ]
+
+        self.assertEqual(
+            [
+                (file, correction, handle_linguistic_checks(file, correction, spelling.exceptions))
+                for file, correction in product(FILES, sorted(corrections))
+            ],
+            results,
+        )
+        self.assertTrue(any(matches for _, _, matches in results))
+
+    def test_exception_matcher_same_as_handler_for_grammar(self):
+        lines = LINES + [
+            f"{prefix}{check.text}{suffix}"
+            for check in grammar.exceptions
+            if isinstance(check, TextCheck)
+            for prefix, suffix in product(["", " "], ["", "\n"])
+        ]
+        matcher = LinguisticExceptionMatcher(grammar.exceptions)
+
+        results = [
+            (file, line, matcher.matches(file, line)) for file, line in product(FILES, lines)
+        ]
+
+        self.assertEqual(
+            [
+                (file, line, handle_linguistic_checks(file, line, grammar.exceptions))
+                for file, line in product(FILES, lines)
+            ],
+            results,
+        )
+        self.assertTrue(any(matches for _, _, matches in results))
+        self.assertFalse(all(matches for _, _, matches in results))
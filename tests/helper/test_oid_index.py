@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from troubadix.helper.oid_index import OIDIndex
+
+ROOT = Path("/feed/nasl/common")
+
+
+class TestOIDIndex(unittest.TestCase):
+    def test_from_facts(self):
+        index = OIDIndex.from_facts(
+            [
+                (ROOT / "foo.nasl", "1.3.6.1.4.1.25623.1.0.1"),
+                (ROOT / "bar" / "bar.nasl", "1.3.6.1.4.1.25623.1.0.2"),
+                (ROOT / "no_oid.nasl", None),
+            ],
+            ROOT,
+        )
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.get("1.3.6.1.4.1.25623.1.0.1"), Path("foo.nasl"))
+        self.assertEqual(index.get("1.3.6.1.4.1.25623.1.0.2"), Path("bar/bar.nasl"))
+        self.assertIsNone(index.get("1.3.6.1.4.1.25623.1.0.3"))
+        self.assertIn("1.3.6.1.4.1.25623.1.0.2", index)
+
+    def test_from_facts_duplicate_oid(self):
+        index = OIDIndex.from_facts(
+            [
+                (ROOT / "foo.nasl", "1.3.6.1.4.1.25623.1.0.1"),
+                (ROOT / "bar.nasl", "1.3.6.1.4.1.25623.1.0.1"),
+            ],
+            ROOT,
+        )
+
+        self.assertEqual(list(index), ["1.3.6.1.4.1.25623.1.0.1"])
+        self.assertEqual(index.get("1.3.6.1.4.1.25623.1.0.1"), Path("foo.nasl"))
+
+    def test_write_and_read(self):
+        index = OIDIndex(
+            {
+                "1.3.6.1.4.1.25623.1.0.2": Path("bar/bar.nasl"),
+                "1.3.6.1.4.1.25623.1.0.1": Path("foo.nasl"),
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            index_file = Path(tempdir) / "oids.json"
+            index.write(index_file)
+
+            read_index = OIDIndex.read(index_file)
+
+        self.assertEqual(list(read_index), ["1.3.6.1.4.1.25623.1.0.1", "1.3.6.1.4.1.25623.1.0.2"])
+        self.assertEqual(read_index.get("1.3.6.1.4.1.25623.1.0.2"), Path("bar/bar.nasl"))
+
+    def test_read_invalid(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            index_file = Path(tempdir) / "oids.json"
+            index_file.write_text('{"plugins": {}}', encoding="utf-8")
+
+            with self.assertRaises(ValueError):
+                OIDIndex.read(index_file)
+
+            index_file.write_text("no json", encoding="utf-8")
+
+            with self.assertRaises(ValueError):
+                OIDIndex.read(index_file)
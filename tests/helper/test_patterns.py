@@ -15,11 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import re
 import unittest
 
 from troubadix.helper.patterns import (
+    PatternRegistry,
     ScriptTag,
     SpecialScriptTag,
+    _get_special_script_tag_pattern,
     get_script_tag_pattern,
     get_script_tag_patterns,
     get_special_script_tag_pattern,
@@ -53,3 +56,33 @@ class SpecialScriptTagPatternsTestCase(unittest.TestCase):
         pattern2 = get_special_script_tag_pattern(SpecialScriptTag.ADD_PREFERENCE)
 
         self.assertIs(pattern1, pattern2)
+
+
+class PatternRegistryTestCase(unittest.TestCase):
+    def test_compile_once(self):
+        registry = PatternRegistry()
+
+        pattern1 = registry.compile(r"foo\s+bar")
+        pattern2 = registry.compile(r"foo\s+bar")
+
+        self.assertIs(pattern1, pattern2)
+        self.assertEqual(registry.compiles, 1)
+        self.assertEqual(registry.hits, 1)
+        self.assertEqual(len(registry), 1)
+
+    def test_flags(self):
+        registry = PatternRegistry()
+
+        pattern1 = registry.compile(r"foo")
+        pattern2 = registry.compile(r"foo", re.IGNORECASE)
+
+        self.assertIsNot(pattern1, pattern2)
+        self.assertEqual(pattern2.flags & re.IGNORECASE, re.IGNORECASE)
+        self.assertEqual(registry.compiles, 2)
+        self.assertEqual(registry.hits, 0)
+
+    def test_same_parametrized_pattern_instance(self):
+        pattern1 = _get_special_script_tag_pattern("dependencies", flags=re.DOTALL)
+        pattern2 = _get_special_script_tag_pattern("dependencies", flags=re.DOTALL)
+
+        self.assertIs(pattern1, pattern2)
@@ -1,9 +1,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # SPDX-FileCopyrightText: 2025 Greenbone AG
 
+import random
 import unittest
+from pathlib import Path
 
+from troubadix.helper import CURRENT_ENCODING
 from troubadix.helper.remove_comments import remove_comments
+from troubadix.helper.text_utils import StringState
 
 
 class RemoveCommentsTestCase(unittest.TestCase):
@@ -73,3 +77,73 @@ class RemoveCommentsTestCase(unittest.TestCase):
         input_content = r'display("\"); # This is a comment'
         expected_output = r'display("\"); '
         self.assertEqual(remove_comments(input_content), expected_output)
+
+
+def remove_comments_per_char(file_content: str) -> str:
+    """The former implementation of remove_comments, processing every single
+    character with a StringState, as reference"""
+
+    def remove_comments_in_line(line: str, state: StringState) -> str:
+        if not state.in_string and line.lstrip().startswith("#"):
+            return ""
+
+        for i, char in enumerate(line):
+            state.process_next_char(char)
+            if char == "#" and not state.in_string:
+                return line[:i]
+
+        return line
+
+    string_state = StringState()
+    return "\n".join(
+        [remove_comments_in_line(line, string_state) for line in file_content.splitlines()]
+    )
+
+
+CORPUS = [
+    "",
+    "\n\n",
+    "#",
+    "  # comment",
+    "a = 1; # comment # more",
+    "a = '#'; b = \"#\"; # comment",
+    "a = 'it\\'s # not a comment'; # comment",
+    'a = "C:\\"; # comment',
+    "a = 'C:\\\\'; # comment",
+    "a = 'multi\n# line\nstring'; # comment",
+    'a = "multi\n# line\nstring"; # comment',
+    "a = 'escaped line end\\\n#x'; # comment",
+    "a = 'escaped line end\\\n\n#x'; # comment",
+    "a = \"'\" + '\"'; # comment",
+    "a = 'unclosed\n# still in the string",
+    "windows\r\nline # endings\r\n# comment\r\n",
+    "old mac\rline # endings\r",
+    "\t# tab indented comment\n\ta = 1;\t# comment",
+    "form\x0cfeed # comment\x0bvertical # tab",
+]
+
+
+class RemoveCommentsEquivalenceTestCase(unittest.TestCase):
+    def test_corpus(self):
+        for content in CORPUS:
+            with self.subTest(content=content):
+                self.assertEqual(remove_comments(content), remove_comments_per_char(content))
+
+    def test_test_files(self):
+        test_files = Path(__file__).parent.parent / "plugins" / "test_files"
+        files = sorted(test_files.glob("**/*.nasl")) + sorted(test_files.glob("**/*.inc"))
+
+        for file in files:
+            content = file.read_text(encoding=CURRENT_ENCODING, errors="replace")
+            with self.subTest(file=file):
+                self.assertEqual(remove_comments(content), remove_comments_per_char(content))
+
+    def test_random(self):
+        generator = random.Random(4711)
+        characters = "ab #\"'\\\n\r\t;"
+
+        for _ in range(5000):
+            content = "".join(generator.choices(characters, k=generator.randint(0, 40)))
+            self.assertEqual(
+                remove_comments(content), remove_comments_per_char(content), repr(content)
+            )
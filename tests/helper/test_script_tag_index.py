@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import re
+import unittest
+from pathlib import Path
+
+from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.patterns import (
+    ScriptTag,
+    SpecialScriptTag,
+    get_script_tag_pattern,
+    get_special_script_tag_pattern,
+)
+from troubadix.helper.script_tag_index import ScriptTagIndex
+
+_test_files = Path(__file__).parent.parent / "plugins" / "test_files"
+
+CONTENT = (
+    'script_oid("1.3.6.1.4.1.25623.1.0.100001");\n'
+    'script_tag(name:"cvss_base", value:"5.0");\n'
+    "script_tag( name : 'summary', value:'Foo script_tag(name:\"insight\", value:\"bar\");');\n"
+    'script_tag(name:"summary", value:"Second");\n'
+    'script_family("Product detection");\n'
+    'script_dependencies("foo.nasl", "bar.nasl");\n'
+)
+
+
+class TestScriptTagIndex(unittest.TestCase):
+    def test_equivalent_to_pattern(self):
+        files = sorted(_test_files.glob("**/*.nasl")) + sorted(_test_files.glob("**/*.inc"))
+        contents = [CONTENT] + [
+            file.read_text(encoding=CURRENT_ENCODING, errors="replace") for file in files
+        ]
+
+        for content in contents:
+            index = ScriptTagIndex(content)
+            for tag in ScriptTag:
+                pattern = get_script_tag_pattern(tag)
+                self.assertEqual(
+                    [m.span() for m in index.finditer(tag)],
+                    [m.span() for m in pattern.finditer(content)],
+                )
+            for tag in SpecialScriptTag:
+                pattern = get_special_script_tag_pattern(tag)
+                match = pattern.search(content)
+                index_match = index.search(tag)
+                self.assertEqual(
+                    index_match.span() if index_match else None,
+                    match.span() if match else None,
+                )
+
+    def test_finditer(self):
+        index = ScriptTagIndex(CONTENT)
+
+        values = [match.group("value") for match in index.finditer(ScriptTag.SUMMARY)]
+
+        self.assertEqual(values, ['Foo script_tag(name:"insight", value:"bar"', "Second"])
+
+    def test_call_within_call(self):
+        index = ScriptTagIndex(CONTENT)
+
+        match = index.search(ScriptTag.INSIGHT)
+
+        self.assertEqual(match.group("value"), "bar")
+
+    def test_custom_pattern(self):
+        index = ScriptTagIndex(CONTENT)
+        pattern = re.compile(r'script_family\s*\(\s*"(?P<value>Product detection)"\s*\)')
+
+        self.assertEqual(
+            index.search(SpecialScriptTag.FAMILY, pattern).group("value"),
+            "Product detection",
+        )
+        self.assertIsNone(
+            index.search(SpecialScriptTag.FAMILY, re.compile(r'script_family\("Other"\)'))
+        )
+
+    def test_cached_matches(self):
+        index = ScriptTagIndex(CONTENT)
+
+        self.assertIs(index.search(SpecialScriptTag.OID), index.search(SpecialScriptTag.OID))
+
+    def test_contains(self):
+        index = ScriptTagIndex(CONTENT)
+
+        self.assertIn(ScriptTag.CVSS_BASE, index)
+        self.assertIn(SpecialScriptTag.DEPENDENCIES, index)
+        self.assertNotIn(ScriptTag.SOLUTION, index)
+        self.assertNotIn(SpecialScriptTag.NAME, index)
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from importlib import import_module
+from pathlib import Path
+
+from codespell_lib import main as codespell_main
+
+from troubadix.helper.content_store import ContentStore
+from troubadix.helper.spell_checker import SpellChecker, SpellingError, get_spell_checker
+
+# The internals of codespell imported by troubadix.helper.codespell_adapter
+CODESPELL_SYMBOLS = {
+    "codespell_lib._codespell": [
+        "_builtin_default",
+        "_select_builtin_dictionary",
+        "build_exclude_hashes",
+        "build_ignore_words",
+        "codespell_ignore_next_line_tag",
+        "codespell_ignore_tag",
+        "ignore_next_line_regex",
+        "inline_ignore_regex",
+        "uri_regex_def",
+        "word_regex_def",
+    ],
+    "codespell_lib._spellchecker": ["Misspelling", "build_dict"],
+    "codespell_lib._text_util": ["fix_case"],
+}
+
+_here = Path(__file__).parent
+CODESPELL_DIR = _here.parent.parent / "troubadix" / "codespell"
+
+CONTENTS = {
+    "plain.nasl": "teh first line\nno error\r\nTeh second line\rTEH third line\n",
+    "ignore.nasl": (
+        "teh # codespell:ignore\n"
+        "teh tje # codespell:ignore teh\n"
+        "# codespell:ignore-next-line\n"
+        "teh\n"
+        "# codespell:ignore-next-line tje\n"
+        "teh tje\n"
+    ),
+    "uri.nasl": "see https://example.com/teh and teh@example.com, but teh\n",
+    "escape.nasl": 'display("\\nteh\\tteh")\n',
+    "reason.nasl": "sometypo and othertypo\n",
+    "exclude.nasl": "  teh excluded line\nteh excluded line\n",
+    "ignore_words.nasl": "Tje and tje\n",
+    "iso_8859_1.nasl": "teh \xe4 line\n",
+    ".hidden.nasl": "teh\n",
+}
+
+
+def _codespell(*arguments: str) -> list[str]:
+    with redirect_stdout(io.StringIO()) as output:
+        codespell_main(
+            "--quiet-level=1", "--disable-colors", "--uri-ignore-words-list=*", *arguments
+        )
+    return output.getvalue().splitlines()
+
+
+class TestCodespellInternals(unittest.TestCase):
+    def test_symbols(self):
+        for module_name, names in CODESPELL_SYMBOLS.items():
+            module = import_module(module_name)
+            for name in names:
+                with self.subTest(symbol=f"{module_name}.{name}"):
+                    self.assertTrue(hasattr(module, name))
+
+
+class TestSpellChecker(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmpdir.name)
+        self.additions = self.dir / "additions"
+        self.additions.write_text(
+            "sometypo->sometype\nothertypo->other, disabled for a reason\n", encoding="utf-8"
+        )
+        self.exclude = self.dir / "exclude"
+        self.exclude.write_text("teh excluded line\n", encoding="utf-8")
+        self.ignore = self.dir / "ignore"
+        self.ignore.write_text("Tje\n", encoding="utf-8")
+
+        self.files = []
+        for name, content in CONTENTS.items():
+            path = self.dir / name
+            encoding = "iso-8859-1" if "iso_8859_1" in name else "utf-8"
+            path.write_bytes(content.encode(encoding))
+            self.files.append(path)
+        binary = self.dir / "binary.nasl"
+        binary.write_bytes(b"teh\x00\n")
+        self.files.append(binary)
+
+        self.spell_checker = SpellChecker([self.additions], [self.exclude], [self.ignore])
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_check(self):
+        errors = list(self.spell_checker.check("plain.nasl", CONTENTS["plain.nasl"]))
+
+        self.assertEqual(
+            [
+                SpellingError("plain.nasl", 1, "teh", "the"),
+                SpellingError("plain.nasl", 3, "Teh", "The"),
+                SpellingError("plain.nasl", 4, "TEH", "THE"),
+            ],
+            errors,
+        )
+        self.assertEqual("plain.nasl:3: Teh ==> The", str(errors[1]))
+
+    def test_check_reason(self):
+        errors = list(self.spell_checker.check("reason.nasl", CONTENTS["reason.nasl"]))
+
+        self.assertEqual(
+            ["sometypo ==> sometype", "othertypo ==> other  | disabled for a reason"],
+            [error.text for error in errors],
+        )
+
+    def test_check_file_skipped(self):
+        self.assertEqual([], list(self.spell_checker.check_file(self.dir / ".hidden.nasl")))
+        self.assertEqual([], list(self.spell_checker.check_file(self.dir / "binary.nasl")))
+        self.assertEqual([], list(self.spell_checker.check_file(self.dir / "missing.nasl")))
+
+    def test_check_file_content_store(self):
+        path = self.dir / "plain.nasl"
+        content_store = ContentStore(mmap_threshold=1)
+
+        errors = list(self.spell_checker.check_file(path, content_store))
+
+        self.assertEqual(3, len(errors))
+        self.assertEqual(path.read_bytes(), content_store.get(path).raw[:])
+
+    def test_same_as_codespell(self):
+        expected = _codespell(
+            "--dictionary=-",
+            f"--dictionary={self.additions}",
+            f"--exclude-file={self.exclude}",
+            f"--ignore-words={self.ignore}",
+            *(str(path) for path in self.files),
+        )
+
+        errors = [
+            str(error)
+            for path in sorted(self.files, key=str)
+            for error in self.spell_checker.check_file(path)
+        ]
+
+        self.assertEqual(expected, errors)
+        self.assertEqual(len(errors), 11)
+
+    def test_same_as_codespell_for_test_files(self):
+        files = sorted(
+            (path for path in _here.parent.rglob("*") if path.suffix in (".nasl", ".inc")),
+            key=str,
+        )
+        configuration = [
+            CODESPELL_DIR / "codespell.additions",
+            CODESPELL_DIR / "codespell.exclude",
+            CODESPELL_DIR / "codespell.ignore",
+        ]
+        expected = _codespell(
+            "--dictionary=-",
+            f"--dictionary={configuration[0]}",
+            f"--exclude-file={configuration[1]}",
+            f"--ignore-words={configuration[2]}",
+            *(str(path) for path in files),
+        )
+        spell_checker = SpellChecker(*([path] for path in configuration))
+
+        errors = [str(error) for path in files for error in spell_checker.check_file(path)]
+
+        self.assertEqual(expected, errors)
+        self.assertTrue(errors)
+
+    def test_get_spell_checker(self):
+        spell_checker = get_spell_checker([self.additions], [self.exclude], [self.ignore])
+
+        self.assertIs(
+            spell_checker, get_spell_checker([self.additions], [self.exclude], [self.ignore])
+        )
+        self.assertIsNot(spell_checker, get_spell_checker([self.additions]))
+
+        self.additions.write_text("teh->the\nmoretypo->more\n", encoding="utf-8")
+        changed = get_spell_checker([self.additions], [self.exclude], [self.ignore])
+
+        self.assertIsNot(spell_checker, changed)
+        self.assertEqual(["moretypo ==> more"], [e.text for e in changed.check("f", "moretypo")])
@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # SPDX-FileCopyrightText: 2025 Greenbone AG
 
+import re
 import unittest
 
 from troubadix.helper.text_utils import (
+    LineIndex,
     StringState,
+    find_lines_with,
     index_to_linecol,
     is_position_in_string,
 )
@@ -121,6 +124,74 @@ class TestIndexToLinecol(unittest.TestCase):
         self.assertRaises(ValueError, index_to_linecol, "", 0)
 
 
+class TestLineIndex(unittest.TestCase):
+    def test_linecol(self):
+        line_index = LineIndex("line1\nline2\r\nline3\rline4\n\nline6")
+
+        self.assertEqual(line_index.linecol(0), (1, 1))
+        self.assertEqual(line_index.linecol(6), (2, 1))
+        self.assertEqual(line_index.linecol(12), (2, 7))
+        self.assertEqual(line_index.linecol(13), (3, 1))
+        self.assertEqual(line_index.linecol(19), (4, 1))
+        self.assertEqual(line_index.linecol(25), (5, 1))
+        self.assertEqual(line_index.linecol(30), (6, 5))
+
+    def test_line(self):
+        line_index = LineIndex("hello\nworld\n")
+
+        self.assertEqual(line_index.line(0), 1)
+        self.assertEqual(line_index.line(5), 1)
+        self.assertEqual(line_index.line(6), 2)
+        self.assertEqual(line_index.line(11), 2)
+
+    def test_out_of_bounds(self):
+        line_index = LineIndex("hello")
+
+        self.assertRaises(ValueError, line_index.line, 5)
+        self.assertRaises(ValueError, line_index.line, -1)
+        self.assertRaises(ValueError, LineIndex("").line, 0)
+
+
+class TestFindLinesWith(unittest.TestCase):
+    def assertLikeFinditer(self, pattern: str, text: str):
+        compiled = re.compile(pattern, re.IGNORECASE)
+        expected = [
+            (match.group(0), match.group(1))
+            for match in re.finditer(rf".*({pattern}).*", text, re.IGNORECASE)
+        ]
+
+        self.assertEqual(
+            [(line, match.group()) for line, match in find_lines_with(compiled, text)],
+            expected,
+        )
+
+    def test_lines(self):
+        text = "foo\nbar the the baz\nthe the the\n\nand the the"
+
+        self.assertEqual(
+            [(line, match.start()) for line, match in find_lines_with(re.compile("the"), text)],
+            [("bar the the baz", 12), ("the the the", 28), ("and the the", 41)],
+        )
+
+    def test_like_finditer(self):
+        for pattern, text in (
+            (r"\s+a\s+a\s+", "x a a a a b\nc a a\n a a \n"),
+            (r"the\s+the", "the\nthe the the\n\nthe"),
+            (r"\s+or\s+not$", "foo or not"),
+            (r"\s+or\s+not$", "foo or not\nbar or not\n"),
+            (r"(^|\s+)A\s+flaws", "A flaws\nA flaws"),
+            (r"x", ""),
+            (r"x", "abc"),
+        ):
+            with self.subTest(pattern=pattern, text=text):
+                self.assertLikeFinditer(pattern, text)
+
+    def test_long_line(self):
+        text = "a" * 100_000 + " the the"
+
+        self.assertEqual(len(list(find_lines_with(re.compile(r"the\s+the"), text))), 1)
+
+
 class TestIsPositionInString(unittest.TestCase):
     def test_no_strings(self):
         text = "x = 5; y = 10;"
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import unittest
+
+from troubadix.helper.tokenizer import Token, Tokens, TokenType, tokenize
+
+
+class TokenizeTestCase(unittest.TestCase):
+    def test_tokens(self):
+        content = "if (x =~ \"a(b\") { y[0x1F] = 'it\\'s'; } # comment"
+
+        tokens = list(tokenize(content, comments=True))
+
+        self.assertEqual(
+            [(token.type, token.value) for token in tokens],
+            [
+                (TokenType.KEYWORD, "if"),
+                (TokenType.PUNCTUATION, "("),
+                (TokenType.IDENTIFIER, "x"),
+                (TokenType.PUNCTUATION, "=~"),
+                (TokenType.STRING, '"a(b"'),
+                (TokenType.PUNCTUATION, ")"),
+                (TokenType.PUNCTUATION, "{"),
+                (TokenType.IDENTIFIER, "y"),
+                (TokenType.PUNCTUATION, "["),
+                (TokenType.NUMBER, "0x1F"),
+                (TokenType.PUNCTUATION, "]"),
+                (TokenType.PUNCTUATION, "="),
+                (TokenType.STRING, "'it\\'s'"),
+                (TokenType.PUNCTUATION, ";"),
+                (TokenType.PUNCTUATION, "}"),
+                (TokenType.COMMENT, "# comment"),
+            ],
+        )
+
+    def test_offsets(self):
+        content = "a  >!<\n'b'"
+
+        self.assertEqual(
+            list(tokenize(content)),
+            [
+                Token(TokenType.IDENTIFIER, "a", 0, 1),
+                Token(TokenType.PUNCTUATION, ">!<", 3, 6),
+                Token(TokenType.STRING, "'b'", 7, 10),
+            ],
+        )
+
+    def test_comments_skipped(self):
+        tokens = list(tokenize('# if (\nx = "#";'))
+
+        self.assertEqual([token.value for token in tokens], ["x", "=", '"#"', ";"])
+
+    def test_backslash_in_double_quotes(self):
+        tokens = list(tokenize('a = "C:\\"; b = 1;'))
+
+        self.assertEqual(tokens[2].value, '"C:\\"')
+        self.assertEqual(tokens[3].value, ";")
+
+    def test_multiline_string(self):
+        tokens = list(tokenize('a = "foo\n# no comment\n";'))
+
+        self.assertEqual(tokens[2].type, TokenType.STRING)
+        self.assertEqual(len(tokens), 4)
+
+    def test_unclosed_string(self):
+        tokens = list(tokenize("a = 'foo;\nb = 1;"))
+
+        self.assertEqual(tokens[2].value, "'foo;\nb = 1;")
+
+
+class TokensTestCase(unittest.TestCase):
+    def test_closing(self):
+        tokens = Tokens('if (a(")")) { b[1] = "}"; }')
+
+        self.assertEqual(tokens.closing(1), 6)
+        self.assertEqual(tokens.closing(3), 5)
+        self.assertEqual(tokens.closing(7), 15)
+        self.assertEqual(tokens.closing(9), 11)
+        self.assertIsNone(tokens.closing(0))
+
+    def test_closing_per_bracket_kind(self):
+        tokens = Tokens("{ foo(; }")
+
+        self.assertEqual(tokens.closing(0), 4)
+        self.assertIsNone(tokens.closing(2))
+
+    def test_find(self):
+        tokens = Tokens('a; b = ";"; c;')
+
+        self.assertEqual(tokens.find(";"), 1)
+        self.assertEqual(tokens.find(";", 2), 5)
+        self.assertIsNone(tokens.find(";", 8))
+
+    def test_arguments(self):
+        tokens = Tokens('f(name:"a,b", value:g(1, 2), [3, 4]);')
+
+        self.assertEqual(
+            [[token.value for token in argument] for argument in tokens.arguments(1)],
+            [
+                ["name", ":", '"a,b"'],
+                ["value", ":", "g", "(", "1", ",", "2", ")"],
+                ["[", "3", ",", "4", "]"],
+            ],
+        )
+        self.assertEqual(Tokens("f();").arguments(1), [])
+
+    def test_text(self):
+        tokens = Tokens("x = foo( 1 );")
+
+        self.assertEqual(tokens.text(2, 5), "foo( 1 )")
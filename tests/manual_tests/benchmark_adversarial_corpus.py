@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import json
+import sys
+from pathlib import Path
+
+from troubadix.plugins import StandardPlugins
+from troubadix.worker import Worker
+
+CORPUS = Path(__file__).parent / "test_files" / "adversarial"
+
+# A plugin regressed if it takes this factor longer than in the baseline and
+# at least the given seconds longer, to not fail for noise on fast plugins.
+REGRESSION_FACTOR = 2.0
+REGRESSION_MIN_SECONDS = 0.1
+# Plugins exceeding it are taken with this time
+PLUGIN_TIMEOUT = 10.0
+
+
+def _measure(worker: Worker) -> dict[str, dict[str, float]]:
+    """The wall time per file and plugin"""
+    timings = {}
+    for file_path in sorted(CORPUS.glob("*.nasl")):
+        results = worker.check_file(file_path)
+        plugin_timings = {
+            plugin_name: timing.wall for plugin_name, timing in results.plugin_timings.items()
+        }
+        for plugin_name, plugin_results in results.plugin_results.items():
+            if plugin_name not in plugin_timings:
+                print(*(result.message for result in plugin_results), sep="\n")
+                plugin_timings[plugin_name] = worker.plugin_timeout
+
+        timings[file_path.name] = plugin_timings
+    return timings
+
+
+# poetry run python tests/manual_tests/benchmark_adversarial_corpus.py <baseline.json>
+def benchmark_adversarial_corpus(baseline_file: Path) -> bool:
+    """
+    Run all file plugins on the corpus of adversarial NASL files, like
+    unterminated strings and tags, very long lines or deeply nested
+    brackets, which may let regexes backtrack for a long time.
+
+    The wall times are written to the baseline file if it does not exist
+    and compared with it otherwise. Fails for plugins getting considerably
+    slower than the baseline, including plugins exceeding the timeout.
+
+    Args:
+        baseline_file: JSON file with the wall times per file and plugin
+    """
+    worker = Worker(
+        StandardPlugins().file_plugins, root=CORPUS, profile=True, plugin_timeout=PLUGIN_TIMEOUT
+    )
+    worker.setup()
+    timings = _measure(worker)
+
+    total = sum(sum(plugin_timings.values()) for plugin_timings in timings.values())
+    print(f"Files: {len(timings)}, total plugin time: {total:.3f} s")
+
+    if not baseline_file.exists():
+        baseline_file.write_text(json.dumps(timings, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {baseline_file}")
+        return True
+
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+    regressions = 0
+    print(f"{'File':32} {'Plugin':40} {'Baseline (s)':>12} {'Now (s)':>9}")
+    for file_name, plugin_timings in timings.items():
+        for plugin_name, wall in plugin_timings.items():
+            expected = baseline.get(file_name, {}).get(plugin_name)
+            if expected is None:
+                continue
+            if wall > expected * REGRESSION_FACTOR and wall > expected + REGRESSION_MIN_SECONDS:
+                regressions += 1
+                print(f"{file_name:32} {plugin_name:40} {expected:12.3f} {wall:9.3f}")
+
+    print(f"Regressions: {regressions}")
+    return not regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <baseline.json>")
+        sys.exit(1)
+
+    if not benchmark_adversarial_corpus(Path(sys.argv[1])):
+        sys.exit(1)
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.description_block import find_description_block
+from troubadix.helper.patterns import _get_tag_pattern, get_common_tag_patterns, get_xref_pattern
+
+# the whole content patterns of the plugins scanning the description block
+_PATTERNS = [
+    get_common_tag_patterns(),
+    _get_tag_pattern(name=r".+?", flags=re.DOTALL),
+    _get_tag_pattern(name=r".*", value=r""),
+    get_xref_pattern(name=r".+?", flags=re.DOTALL),
+    get_xref_pattern(name="URL", value=r".+?"),
+    re.compile(r"script_tag\(.*\);"),
+    re.compile(r"script_xref\(.*\);"),
+]
+
+
+def _measure(texts: list[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        for pattern in _PATTERNS:
+            for _ in pattern.finditer(text):
+                pass
+    return time.perf_counter() - start
+
+
+# poetry run python tests/manual_tests/benchmark_description_block.py <dir>
+def benchmark_description_block(directory: Path) -> None:
+    """
+    Compare the bytes scanned and the time spent by the script tag patterns
+    of the plugins when searching the whole content of the VTs with only
+    searching their description block.
+
+    Args:
+        directory: Directory containing the nasl files to read
+    """
+    files = sorted(directory.glob("**/*.nasl"))
+    if not files:
+        print(f"No nasl files found in {directory}")
+        return
+
+    contents = [file.read_text(encoding=CURRENT_ENCODING, errors="replace") for file in files]
+
+    start = time.perf_counter()
+    blocks = []
+    for content in contents:
+        span = find_description_block(content)
+        blocks.append(content[span[0] : span[1]] if span else content)
+    locate = time.perf_counter() - start
+
+    missing = sum(block is content for block, content in zip(blocks, contents))
+    full_bytes = sum(len(content) for content in contents)
+    block_bytes = sum(len(block) for block in blocks)
+
+    print(f"Files: {len(files)}, without description block: {missing}")
+    print(
+        f"Scanned per pattern: {full_bytes / 1e6:.1f} MB whole content, "
+        f"{block_bytes / 1e6:.1f} MB description blocks "
+        f"({100 - block_bytes * 100 / full_bytes:.0f}% less)"
+    )
+    print(f"{'Scan':24} {'Total (s)':>10} {'Per file (us)':>14}")
+    for name, elapsed in (
+        ("whole content", _measure(contents)),
+        ("description block", locate + _measure(blocks)),
+    ):
+        print(f"{name:24} {elapsed:10.3f} {elapsed / len(files) * 1e6:14.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <directory>")
+        sys.exit(1)
+
+    benchmark_description_block(Path(sys.argv[1]))
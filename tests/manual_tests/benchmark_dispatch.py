@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import sys
+import time
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+
+from pontos.terminal.null import NullTerminal
+
+from troubadix.helper import get_root
+from troubadix.plugin import FilePluginContext
+from troubadix.reporter import Reporter
+from troubadix.results import FileResults
+from troubadix.runner import CHUNKSIZE, Runner
+from troubadix.worker import check_file, initializer
+
+
+def _legacy_check_file(runner: Runner, file_path: Path) -> FileResults:
+    """The former task of the pool: A method bound to the runner, which
+    pickles the whole runner for every single file."""
+    worker = runner._create_worker()  # pylint: disable=protected-access
+    results = FileResults(file_path)
+    context = FilePluginContext(root=worker.root, nasl_file=file_path.resolve())
+    for plugin_class in worker.file_plugins:
+        worker.check(plugin_class(context), results)
+    return results
+
+
+def _measure(runner: Runner, task, files: list[Path], n_jobs: int) -> float:
+    # pylint: disable=protected-access
+    with Pool(
+        processes=n_jobs,
+        initializer=initializer,
+        initargs=(runner._create_worker(),),
+    ) as pool:
+        start = time.perf_counter()
+        for _ in pool.imap_unordered(task, files, chunksize=CHUNKSIZE):
+            pass
+        return time.perf_counter() - start
+
+
+# poetry run python tests/manual_tests/benchmark_dispatch.py <dir> [n_jobs]
+def benchmark_dispatch(directory: Path, n_jobs: int) -> None:
+    """
+    Compare the per-file overhead of dispatching files to the pool workers.
+
+    No plugin is executed, so the measured time is the pure cost of sending
+    a task to a worker, creating the file context and returning the results.
+
+    Args:
+        directory: Directory containing the nasl files to dispatch
+        n_jobs: Number of pool processes
+    """
+    files = sorted(directory.glob("**/*.nasl")) + sorted(directory.glob("**/*.inc"))
+    if not files:
+        print(f"No nasl files found in {directory}")
+        return
+
+    root = get_root(files[0])
+    runner = Runner(
+        n_jobs=n_jobs,
+        reporter=Reporter(term=NullTerminal(), root=root),
+        root=root,
+    )
+    runner.plugins.file_plugins = ()
+    runner.plugins.files_plugins = ()
+
+    legacy = _measure(runner, partial(_legacy_check_file, runner), files, n_jobs)
+    resident = _measure(runner, check_file, files, n_jobs)
+
+    print(f"Files: {len(files)}, jobs: {n_jobs}")
+    print(f"{'Dispatch':24} {'Total (s)':>10} {'Per file (us)':>14}")
+    for name, elapsed in (("runner per task", legacy), ("worker resident", resident)):
+        print(f"{name:24} {elapsed:10.3f} {elapsed / len(files) * 1e6:14.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print(f"Usage: {sys.argv[0]} <directory> [n_jobs]")
+        sys.exit(1)
+
+    benchmark_dispatch(Path(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) == 3 else 4)
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import sys
+import time
+from pathlib import Path
+
+from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.remove_comments import remove_comments
+from troubadix.helper.text_utils import StringState
+
+
+def _remove_comments_per_char(file_content: str) -> str:
+    """The former implementation, processing every character in Python"""
+
+    def remove_comments_in_line(line: str, state: StringState) -> str:
+        if not state.in_string and line.lstrip().startswith("#"):
+            return ""
+
+        for i, char in enumerate(line):
+            state.process_next_char(char)
+            if char == "#" and not state.in_string:
+                return line[:i]
+
+        return line
+
+    string_state = StringState()
+    return "\n".join(
+        [remove_comments_in_line(line, string_state) for line in file_content.splitlines()]
+    )
+
+
+def _measure(function, contents: list[str]) -> float:
+    start = time.perf_counter()
+    for content in contents:
+        function(content)
+    return time.perf_counter() - start
+
+
+# poetry run python tests/manual_tests/benchmark_remove_comments.py <dir>
+def benchmark_remove_comments(directory: Path) -> None:
+    """
+    Compare the throughput of the per character comment removal with the
+    current implementation on the .inc files of a directory, which are the
+    largest files of the feed. Both have to produce the same output.
+
+    Args:
+        directory: Directory containing the .inc files to read
+    """
+    files = sorted(directory.glob("**/*.inc"))
+    if not files:
+        print(f"No .inc files found in {directory}")
+        return
+
+    contents = [file.read_text(encoding=CURRENT_ENCODING, errors="replace") for file in files]
+    for file, content in zip(files, contents):
+        if remove_comments(content) != _remove_comments_per_char(content):
+            print(f"Different output for {file}")
+
+    megabytes = sum(len(content) for content in contents) / 1e6
+    print(f"Files: {len(files)}, {megabytes:.1f} MB")
+    print(f"{'Implementation':24} {'Total (s)':>10} {'MB/s':>10}")
+    for name, function in (
+        ("per character", _remove_comments_per_char),
+        ("current", remove_comments),
+    ):
+        elapsed = _measure(function, contents)
+        print(f"{name:24} {elapsed:10.3f} {megabytes / elapsed:10.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <directory>")
+        sys.exit(1)
+
+    benchmark_remove_comments(Path(sys.argv[1]))
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.patterns import (
+    ScriptTag,
+    SpecialScriptTag,
+    get_script_tag_pattern,
+    get_special_script_tag_pattern,
+)
+from troubadix.helper.script_tag_index import ScriptTagIndex
+
+
+class _CountingPattern:
+    """Counts the regex operations done with a pattern"""
+
+    def __init__(self, pattern: re.Pattern) -> None:
+        self.pattern = pattern
+        self.scans = 0
+        self.matches = 0
+
+    def finditer(self, content: str) -> list[re.Match]:
+        self.scans += 1
+        return list(self.pattern.finditer(content))
+
+    def match(self, content: str, position: int) -> re.Match | None:
+        self.matches += 1
+        return self.pattern.match(content, position)
+
+
+def _count_regex_operations(contents: list[str]) -> tuple[int, int, int]:
+    """The number of full text scans with the patterns and of the full
+    text scans and anchored matches of the index"""
+    pattern_scans = 0
+    index_matches = 0
+    for content in contents:
+        index = ScriptTagIndex(content)
+        for tag in ScriptTag:
+            counting_pattern = _CountingPattern(get_script_tag_pattern(tag))
+            counting_pattern.finditer(content)
+            list(index.finditer(tag, counting_pattern))
+            pattern_scans += counting_pattern.scans
+            index_matches += counting_pattern.matches
+        for tag in SpecialScriptTag:
+            counting_pattern = _CountingPattern(get_special_script_tag_pattern(tag))
+            counting_pattern.finditer(content)
+            list(index.finditer(tag, counting_pattern))
+            pattern_scans += counting_pattern.scans
+            index_matches += counting_pattern.matches
+    return pattern_scans, len(contents), index_matches
+
+
+def _full_text(contents: list[str]) -> float:
+    start = time.perf_counter()
+    for content in contents:
+        for tag in ScriptTag:
+            list(get_script_tag_pattern(tag).finditer(content))
+        for tag in SpecialScriptTag:
+            get_special_script_tag_pattern(tag).search(content)
+    return time.perf_counter() - start
+
+
+def _indexed(contents: list[str]) -> float:
+    start = time.perf_counter()
+    for content in contents:
+        index = ScriptTagIndex(content)
+        for tag in ScriptTag:
+            list(index.finditer(tag))
+        for tag in SpecialScriptTag:
+            index.search(tag)
+    return time.perf_counter() - start
+
+
+# poetry run python tests/manual_tests/benchmark_script_tag_index.py <dir>
+def benchmark_script_tag_index(directory: Path) -> None:
+    """
+    Compare searching the whole content of the files with every script tag
+    pattern against a single scan of the script tag index followed by the
+    same queries on the index.
+
+    Args:
+        directory: Directory containing the nasl files to read
+    """
+    files = sorted(directory.glob("**/*.nasl"))
+    if not files:
+        print(f"No nasl files found in {directory}")
+        return
+
+    contents = [file.read_text(encoding=CURRENT_ENCODING, errors="replace") for file in files]
+    full_text = _full_text(contents)
+    indexed = _indexed(contents)
+    pattern_scans, index_scans, index_matches = _count_regex_operations(contents)
+
+    print(f"Files: {len(files)}")
+    print(f"Full text scans with patterns: {pattern_scans}")
+    print(f"Full text scans with index: {index_scans}, anchored matches: {index_matches}")
+    print(f"{'Lookup':24} {'Total (s)':>10} {'Per file (us)':>14}")
+    for name, elapsed in (("full text patterns", full_text), ("script tag index", indexed)):
+        print(f"{name:24} {elapsed:10.3f} {elapsed / len(files) * 1e6:14.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <directory>")
+        sys.exit(1)
+
+    benchmark_script_tag_index(Path(sys.argv[1]))
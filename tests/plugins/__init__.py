@@ -21,6 +21,14 @@ from collections.abc import Iterable
 from pathlib import Path
 from unittest.mock import MagicMock
 
+from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.content_store import ContentStore
+from troubadix.helper.description_block import find_description_block
+from troubadix.helper.feed_index import FeedIndex
+from troubadix.helper.remove_comments import remove_comments
+from troubadix.helper.script_tag_index import ScriptTagIndex
+from troubadix.helper.text_utils import LineIndex
+from troubadix.helper.tokenizer import Tokens
 from troubadix.plugin import FilePluginContext, FilesPluginContext
 
 
@@ -54,15 +62,39 @@ class PluginTestCase(unittest.TestCase):
         *,
         nasl_file: Path | None = None,
         file_content: str | None = None,
+        file_bytes: bytes | None = None,
         lines: Iterable[str] | None = None,
         root: Path | None = None,
     ) -> FilePluginContext:
-        """Create a FilePluginContext mock"""
+        """Create a FilePluginContext mock
+
+        If no file_bytes are given, they are read from the nasl_file if
+        it exists or derived from the file_content otherwise."""
+        if file_bytes is None:
+            if nasl_file and nasl_file.is_file():
+                file_bytes = nasl_file.read_bytes()
+            elif file_content is not None:
+                file_bytes = file_content.encode(CURRENT_ENCODING)
+
         fake_context = MagicMock()
         fake_context.nasl_file = nasl_file
         fake_context.file_content = file_content
+        fake_context.file_bytes = file_bytes
         fake_context.lines = lines
         fake_context.root = root
+        fake_context.content_store = ContentStore()
+        fake_context.feed_index = FeedIndex(root, fake_context.content_store)
+        if file_content is not None:
+            fake_context.script_tags = ScriptTagIndex(file_content)
+            fake_context.line_index = LineIndex(file_content)
+            fake_context.code_without_comments = remove_comments(file_content)
+            fake_context.tokens = Tokens(file_content)
+            fake_context.description_span = find_description_block(file_content) or (
+                0,
+                len(file_content),
+            )
+            start, end = fake_context.description_span
+            fake_context.description_block = file_content[start:end]
         return fake_context
 
     def create_files_plugin_context(
@@ -75,4 +107,5 @@ class PluginTestCase(unittest.TestCase):
         fake_context = MagicMock()
         fake_context.nasl_files = nasl_files
         fake_context.root = root
+        fake_context.content_store = ContentStore()
         return fake_context
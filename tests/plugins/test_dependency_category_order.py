@@ -156,3 +156,26 @@ class CheckDependencyCategoryOrderTestCase(PluginTestCase):
             "file.nasl: Script category is missing or unsupported.",
             results[0].message,
         )
+
+    def test_dependency_category_missing(self):
+        self.dep.write_text('  script_family("Settings");', encoding=CURRENT_ENCODING)
+        path = self.dir / "file.nasl"
+        content = (
+            '  script_tag(name:"cvss_base", value:"4.0");\n'
+            '  script_tag(name:"summary", value:"Foo Bar...");\n'
+            '  script_dependencies("example.nasl");\n'
+            "  script_category(ACT_SCANNER);\n"
+        )
+        fake_context = self.create_file_plugin_context(
+            nasl_file=path, file_content=content, root=self.dir
+        )
+        plugin = CheckDependencyCategoryOrder(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], LinterError)
+        self.assertEqual(
+            "example.nasl: Script category is missing or unsupported.",
+            results[0].message,
+        )
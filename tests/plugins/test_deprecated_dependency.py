@@ -153,3 +153,20 @@ class CheckDeprecatedDependencyTestCase(PluginTestCase):
             "VT depends on example.nasl, which is marked as deprecated.",
             results[0].message,
         )
+
+    def test_input_files(self):
+        path = self.dir / "file.nasl"
+        content = (
+            '  script_dependencies("example.nasl", "foo/bar.nasl");\n'
+            '  script_dependencies("multi.nasl",\n    "line.nasl");\n'
+        )
+        fake_context = self.create_file_plugin_context(
+            nasl_file=path, file_content=content, root=self.dir
+        )
+
+        input_files = list(CheckDeprecatedDependency.input_files(fake_context))
+
+        # the multiline tag is not checked and therefore no input
+        self.assertIn(self.dir / "common" / "example.nasl", input_files)
+        self.assertIn(self.dir / "foo" / "bar.nasl", input_files)
+        self.assertFalse(any(file.name in ("multi.nasl", "line.nasl") for file in input_files))
@@ -92,3 +92,46 @@ class CheckDuplicateOIDTestCase(PluginTestCase):
             " in 'test_files/nasl/21.04/fail_name_and_copyright_newline.nasl'.",
             results[0].message,
         )
+
+    def test_map(self):
+        nasl_file = here / "test_files" / "nasl" / "21.04" / "fail.nasl"
+        context = self.create_file_plugin_context(
+            nasl_file=nasl_file,
+            file_content='script_oid("1.3.6.1.4.1.25623.1.0.100312");',
+        )
+
+        self.assertEqual(list(CheckDuplicateOID.map(context)), ["1.3.6.1.4.1.25623.1.0.100312"])
+
+    def test_map_no_oid(self):
+        context = self.create_file_plugin_context(
+            nasl_file=here / "test_files" / "nasl" / "21.04" / "fail.nasl",
+            file_content="",
+        )
+
+        self.assertEqual(list(CheckDuplicateOID.map(context)), [None])
+
+    def test_map_ignores_inc_files(self):
+        context = self.create_file_plugin_context(
+            nasl_file=here / "test_files" / "nasl" / "21.04" / "test.inc",
+            file_content='script_oid("1.3.6.1.4.1.25623.1.0.100312");',
+        )
+
+        self.assertEqual(list(CheckDuplicateOID.map(context)), [])
+
+    def test_reduce(self):
+        file1 = here / "test_files" / "nasl" / "21.04" / "fail.nasl"
+        file2 = here / "test_files" / "nasl" / "21.04" / "test.nasl"
+        context = self.create_files_plugin_context(nasl_files=[file1, file2], root=here)
+        plugin = CheckDuplicateOID(context)
+
+        results = list(
+            plugin.reduce(
+                [
+                    (file1, "1.3.6.1.4.1.25623.1.0.100312"),
+                    (file2, "1.3.6.1.4.1.25623.1.0.100312"),
+                ]
+            )
+        )
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].file, file2)
@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.content_store import FileContent
 from troubadix.plugin import LinterError
 from troubadix.plugins.encoding import CheckEncoding
 
@@ -163,3 +164,25 @@ class CheckEncodingTestCase(PluginTestCase):
                 "Likely UTF-8 multibyte sequence found in line 1",
                 results[1].message,
             )
+
+    def test_multibyte_sequences_reported_once_per_line(self):
+        with self.create_directory() as tempdir:
+            path = tempdir / "file.nasl"
+
+            path.write_text("äöü\nfoo\nbar ä\n®", encoding="utf-8")
+            content = FileContent(path, mmap_threshold=0)
+            fake_context = self.create_file_plugin_context(
+                nasl_file=path, file_content=content.text, file_bytes=content.raw
+            )
+            plugin = CheckEncoding(fake_context)
+
+            results = list(plugin.run())
+
+            self.assertEqual(
+                [(result.message, result.line) for result in results[1:]],
+                [
+                    ("Likely UTF-8 multibyte sequence found in line 1", 1),
+                    ("Likely UTF-8 multibyte sequence found in line 3", 3),
+                    ("Likely UTF-8 multibyte sequence found in line 4", 4),
+                ],
+            )
@@ -62,6 +62,7 @@ class CheckScriptFamilyTestCase(PluginTestCase):
         self.assertEqual(len(results), 1)
         self.assertIsInstance(results[0], LinterError)
         self.assertEqual("Invalid or misspelled script family 'TestTest'", results[0].message)
+        self.assertIsNotNone(results[0].line)
 
     def test_script_family2(self):
         nasl_file = Path(__file__).parent / "test.nasl"
@@ -94,3 +95,4 @@ class CheckScriptFamilyTestCase(PluginTestCase):
         self.assertEqual(len(results), 1)
         self.assertIsInstance(results[0], LinterError)
         self.assertEqual("More then one script family exist", results[0].message)
+        self.assertEqual(results[0].line, 4)
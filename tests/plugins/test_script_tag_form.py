@@ -63,6 +63,21 @@ class CheckScriptTagFormTestCase(PluginTestCase):
             results[0].message,
         )
 
+    def test_only_description_block(self):
+        content = (
+            "if(description)\n{\n"
+            '  script_tag(nammmme: "foo", value:"bar");\n'
+            "  exit(0);\n}\n"
+            '# script_tag(nammmme: "ignored", value:"bar");\n'
+        )
+        fake_context = self.create_file_plugin_context(nasl_file=self.path, file_content=content)
+        plugin = CheckScriptTagForm(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(len(results), 1)
+        self.assertIn('nammmme: "foo"', results[0].message)
+
     def test_wrong_value(self):
         content = '  script_tag(name: "foo", valueeeee:"bar");\n'
         fake_context = self.create_file_plugin_context(nasl_file=self.path, file_content=content)
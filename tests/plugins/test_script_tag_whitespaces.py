@@ -217,3 +217,21 @@ class CheckScriptTagWhitespacesTestCase(PluginTestCase):
 
         self.assertEqual(len(results), 1)
         self.assertIsInstance(results[0], LinterError)
+
+    def test_unterminated_calls(self):
+        content = (
+            '  script_xref(name:"URL", value:"http://\n' * 1000
+            + '  script_xref(name:"foo", value:"bar ");\n'
+            '  script_tag(name:"insight", value:TRUE);\n'
+        )
+        fake_context = self.create_file_plugin_context(nasl_file=self.path, file_content=content)
+        plugin = CheckScriptTagWhitespaces(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(
+            'script_xref(name:"foo", value:"bar ");: value contains a'
+            " leading or trailing whitespace character",
+            results[0].message,
+        )
@@ -74,3 +74,23 @@ class CheckWrongSetGetKBCallTestCase(PluginTestCase):
             "'value:' parameter: get_kb_item(name:\"kbkey\");",
             results[3].message,
         )
+
+    def test_nested_calls_and_comments(self):
+        nasl_file = Path(__file__).parent / "test.nasl"
+        content = (
+            '  set_kb_item(name:"kb/key", value:get_version(port:port));\n'
+            '  set_kb_item(name:string("kb/", key), value:TRUE);\n'
+            '  # set_kb_item("kb/key", value:"value");\n'
+            '  set_kb_item(value:"name:"+name);\n'
+        )
+        fake_context = self.create_file_plugin_context(nasl_file=nasl_file, file_content=content)
+        plugin = CheckWrongSetGetKBCalls(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(
+            "The VT/Include is missing a 'name:' and/or 'value:' parameter: "
+            'set_kb_item(value:"name:"+name);',
+            results[0].message,
+        )
@@ -15,9 +15,10 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from pathlib import Path
+from unittest.mock import patch
 
 from troubadix.plugin import LinterError
-from troubadix.plugins.spelling import CheckSpelling
+from troubadix.plugins.spelling import BATCH_SIZE, CheckSpelling
 
 from . import PluginTestCase
 
@@ -105,3 +106,68 @@ class CheckSpellingTestCase(PluginTestCase):
             f"{nasl_file}:2: upated ==> updated",
             results[1].message,
         )
+
+    def test_content_store(self):
+        nasl_file = Path(__file__).parent / "test_files" / "fail_spelling.nasl"
+        fake_context = self.create_files_plugin_context(nasl_files=[nasl_file])
+        plugin = CheckSpelling(fake_context)
+        # the file is read before, e.g. by the file plugins of the worker
+        self.assertTrue(fake_context.content_store.get(nasl_file).raw)
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError):
+            results = list(plugin.run())
+
+        self.assertEqual(len(results), 3)
+
+    def test_dictionary_error(self):
+        nasl_file = Path(__file__).parent / "test_files" / "fail_spelling.nasl"
+        fake_context = self.create_files_plugin_context(nasl_files=[nasl_file])
+        plugin = CheckSpelling(fake_context)
+
+        with patch(
+            "troubadix.plugins.spelling.get_spell_checker", side_effect=ValueError("broken")
+        ):
+            results = list(plugin.run())
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], LinterError)
+        self.assertIn("Building the codespell dictionaries failed", results[0].message)
+        self.assertIn("ValueError: broken", results[0].message)
+
+    def test_split(self):
+        nasl_files = [
+            Path(__file__).parent / "test_files" / "fail_spelling.nasl",
+            Path(__file__).parent / "test.nasl",
+            Path(__file__).parent / "test_files" / "fail_spelling_iso_8859_1.nasl",
+        ]
+        fake_context = self.create_files_plugin_context(nasl_files=nasl_files)
+
+        contexts = CheckSpelling.split(fake_context, 2)
+
+        # sorted like codespell reports them
+        self.assertEqual(
+            [[nasl_files[1], nasl_files[0]], [nasl_files[2]]],
+            [context.nasl_files for context in contexts],
+        )
+        self.assertEqual(
+            [result.message for result in CheckSpelling(fake_context).run()],
+            [result.message for context in contexts for result in CheckSpelling(context).run()],
+        )
+
+    def test_split_more_parts_than_files(self):
+        nasl_file = Path(__file__).parent / "test.nasl"
+        fake_context = self.create_files_plugin_context(nasl_files=[nasl_file])
+
+        contexts = CheckSpelling.split(fake_context, 4)
+
+        self.assertEqual([[nasl_file]], [context.nasl_files for context in contexts])
+
+    def test_split_batches(self):
+        nasl_files = [Path(f"{i}.nasl") for i in range(BATCH_SIZE + 2)]
+        fake_context = self.create_files_plugin_context(nasl_files=nasl_files)
+
+        contexts = CheckSpelling.split(fake_context, 2)
+
+        self.assertEqual(len(contexts), 2)
+        self.assertEqual(sorted(nasl_files[:BATCH_SIZE], key=str), contexts[0].nasl_files)
+        self.assertEqual(nasl_files[BATCH_SIZE:], contexts[1].nasl_files)
@@ -95,6 +95,39 @@ class CheckUsingDisplayTestCase(PluginTestCase):
         # Comments are removed, so display() won't be found
         self.assertEqual(0, len(results))
 
+    def test_using_display_with_comment(self):
+        path = Path("some/file.nasl")
+        content = (
+            '# if (debug) display("FOO");\n' 'display("FOO"); # if (debug)\n' '# display("BAR");\n'
+        )
+        fake_context = self.create_file_plugin_context(nasl_file=path, file_content=content)
+        plugin = CheckUsingDisplay(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(1, len(results))
+        self.assertIsInstance(results[0], LinterError)
+        self.assertEqual(
+            'VT is using a display() without any if statement at line 2: display("FOO");',
+            results[0].message,
+        )
+        self.assertEqual(2, results[0].line)
+
+    def test_using_display_with_comment_after_string(self):
+        path = Path("some/file.nasl")
+        content = 'x = "foo\nbar"; display("FOO"); # comment\n'
+        fake_context = self.create_file_plugin_context(nasl_file=path, file_content=content)
+        plugin = CheckUsingDisplay(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(1, len(results))
+        self.assertEqual(
+            "VT is using a display() without any if statement at line 2: " 'bar"; display("FOO");',
+            results[0].message,
+        )
+        self.assertEqual(2, results[0].line)
+
     def test_using_debug_if_display(self):
         """Test that display() inside a debug if statement is allowed"""
         path = Path("some/file.nasl")
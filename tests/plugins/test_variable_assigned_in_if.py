@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+from pathlib import Path
+
+from tests.plugins import PluginTestCase
+from troubadix.plugin import LinterError
+from troubadix.plugins.variable_assigned_in_if import CheckVariableAssignedInIf
+
+
+class CheckVariableAssignedInIfTestCase(PluginTestCase):
+    def test_ok(self):
+        nasl_file = Path(__file__).parent / "test.nasl"
+        content = (
+            'if( variable =~ "content" ) {}\n'
+            'if( variable == "content" || foo != 1 ) {}\n'
+            "if( ! infos = get_app_version_and_location( cpe:CPE ) ) exit( 0 );\n"
+            '# if( variable = "content" ) {}\n'
+            'display( "if( variable = 1 )" );\n'
+        )
+        fake_context = self.create_file_plugin_context(nasl_file=nasl_file, file_content=content)
+        plugin = CheckVariableAssignedInIf(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(len(results), 0)
+
+    def test_assignment(self):
+        nasl_file = Path(__file__).parent / "test.nasl"
+        content = (
+            'if( variable = "content" ) {}\n'
+            "} else if( foo =~ 'bar' && bar = TRUE )\n"
+            '  exit( 0 );\nif((foo =~ "bar" || bar =~ "foo") || foobar = 0) {}\n'
+        )
+        fake_context = self.create_file_plugin_context(nasl_file=nasl_file, file_content=content)
+        plugin = CheckVariableAssignedInIf(fake_context)
+
+        results = list(plugin.run())
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], LinterError)
+        self.assertEqual(
+            "VT/Include 'test.nasl' is using a variable assignment within an"
+            " if() call in the following line(s):\n"
+            ' if( variable = "content" )\n'
+            " } else if( foo =~ 'bar' && bar = TRUE )\n"
+            ' if((foo =~ "bar" || bar =~ "foo") || foobar = 0)\n',
+            results[0].message,
+        )
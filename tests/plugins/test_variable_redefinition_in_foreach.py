@@ -49,3 +49,17 @@ class CheckVariableRedefinitionInForeachTestCase(PluginTestCase):
             " same foreach loop\n'foreach url(make_list(url1, url))'",
             results[1].message,
         )
+
+    def test_multiline_and_nested(self):
+        nasl_file = Path(__file__).parent / "test.nasl"
+        content = (
+            "foreach url(make_list(foo(url, bar),\n                     baz)) {}\n"
+            "foreach url(make_list_unique(bar,\n                            url)) {}\n"
+            "# foreach url(url) {}\n"
+        )
+        fake_context = self.create_file_plugin_context(nasl_file=nasl_file, file_content=content)
+        plugin = CheckVariableRedefinitionInForeach(fake_context)
+        results = list(plugin.run())
+
+        self.assertEqual(len(results), 1)
+        self.assertIn("foreach url(make_list_unique(bar,", results[0].message)
@@ -15,10 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
 import unittest
+from contextlib import redirect_stderr
 from pathlib import Path
 from subprocess import SubprocessError
 
+from troubadix.helper.oid_index import OIDIndex
 from troubadix.standalone_plugins.changed_oid import check_oid, git, parse_args
 from troubadix.standalone_plugins.util import temporary_git_directory
 
@@ -50,6 +53,30 @@ class TestChangedOid(unittest.TestCase):
             parsed_args = parse_args(["-c", "main..test"])
             self.assertTrue(check_oid(parsed_args))
 
+    def test_check_oid_fail_with_oid_index(self):
+        with temporary_git_directory() as tmpdir:
+            testgit(tmpdir)
+            oid_index_file = tmpdir / "oids.json"
+            OIDIndex({"2.3.6.1.4.1.25623.1.0.100313": Path("other.nasl")}).write(oid_index_file)
+            parsed_args = parse_args(["-c", "main..test", "--oid-index", str(oid_index_file)])
+
+            with redirect_stderr(io.StringIO()) as f:
+                self.assertTrue(check_oid(parsed_args))
+
+            self.assertIn("is already used by other.nasl", f.getvalue())
+
+    def test_check_oid_fail_with_oid_index_same_file(self):
+        with temporary_git_directory() as tmpdir:
+            testgit(tmpdir)
+            oid_index_file = tmpdir / "oids.json"
+            OIDIndex({"2.3.6.1.4.1.25623.1.0.100313": Path("test.nasl")}).write(oid_index_file)
+            parsed_args = parse_args(["-c", "main..test", "--oid-index", str(oid_index_file)])
+
+            with redirect_stderr(io.StringIO()) as f:
+                self.assertTrue(check_oid(parsed_args))
+
+            self.assertNotIn("is already used", f.getvalue())
+
     def test_git_fail(self):
         with self.assertRaises(SubprocessError):
             git("bla")
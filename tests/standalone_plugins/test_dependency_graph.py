@@ -2,11 +2,14 @@
 # SPDX-FileCopyrightText: 2024 Greenbone AG
 import io
 import os
+import shutil
+import tempfile
 import unittest
 from contextlib import redirect_stderr
 from pathlib import Path
 from unittest.mock import patch
 
+from troubadix.helper.feed_index import FEED_INDEX_FILE, FeedIndexFile
 from troubadix.plugins.dependency_category_order import VTCategory
 from troubadix.standalone_plugins.dependency_graph.cli import parse_args
 from troubadix.standalone_plugins.dependency_graph.dependency_graph import (
@@ -16,6 +19,7 @@ from troubadix.standalone_plugins.dependency_graph.dependency_graph import (
     extract_category,
     extract_dependencies,
     get_feed,
+    get_feed_from_index,
     get_scripts,
     main,
 )
@@ -131,6 +135,26 @@ if(description)
         scripts = get_feed(Path(self.local_root), feed)
         self.assertEqual(len(scripts), 5)
 
+    def test_get_feed_from_index(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            root = Path(tempdir) / "nasl"
+            shutil.copytree(self.local_root, root)
+            # only deprecated by its exit code, which the graph doesn't look at
+            (root / "common" / "exit_66.nasl").write_text(
+                "if(description)\n{\n  script_category(ACT_GATHER_INFO);\n  exit(0);\n}\n"
+                "exit(66);\n",
+                encoding="latin1",
+            )
+
+            with FeedIndexFile(root / FEED_INDEX_FILE) as feed_index:
+                feed_index.refresh()
+
+                for feed in Feed:
+                    self.assertEqual(
+                        sorted(get_feed_from_index(feed_index, feed), key=lambda s: s.name),
+                        sorted(get_feed(root, feed), key=lambda s: s.name),
+                    )
+
     @patch("pathlib.Path.read_text")
     def test_get_scripts(self, mock_read_text):
         mock_read_text.return_value = self.script_content
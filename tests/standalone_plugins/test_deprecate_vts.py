@@ -6,11 +6,13 @@ import unittest
 from pathlib import Path
 
 from tests.plugins import TemporaryDirectory
+from troubadix.helper.oid_index import OIDIndex
 from troubadix.standalone_plugins.deprecate_vts import (
     DeprecatedFile,
     _finalize_content,
     _get_summary,
     deprecate,
+    find_replacement_oid,
     get_files_from_path,
     load_transition_oid_mapping,
     parse_args,
@@ -191,6 +193,23 @@ class DeprecateVTsTestCase(unittest.TestCase):
                 result,
             )
 
+    def test_find_replacement_oid_with_oid_index(self):
+        file = DeprecatedFile("testfile1.nasl", Path("testfile1.nasl"), NASL_CONTENT)
+        oid_mapping = {"1.3.6.1.4.1.25623.1.0.910673": "1.3.6.1.4.1.25623.1.0.999999"}
+        oid_index = OIDIndex({"1.3.6.1.4.1.25623.1.0.999999": Path("notus/replacement.nasl")})
+
+        self.assertEqual(
+            find_replacement_oid(file, oid_mapping, oid_index),
+            "1.3.6.1.4.1.25623.1.0.999999",
+        )
+
+    def test_find_replacement_oid_not_in_oid_index(self):
+        file = DeprecatedFile("testfile1.nasl", Path("testfile1.nasl"), NASL_CONTENT)
+        oid_mapping = {"1.3.6.1.4.1.25623.1.0.910673": "1.3.6.1.4.1.25623.1.0.999999"}
+
+        with self.assertRaises(ValueError):
+            find_replacement_oid(file, oid_mapping, OIDIndex())
+
     def test_load_transition_oid_mapping(self):
         with TemporaryDirectory() as tempdir:
             transition_file = tempdir / "transition.py"
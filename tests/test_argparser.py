@@ -15,7 +15,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
 import unittest
+from contextlib import redirect_stderr
 from multiprocessing import cpu_count
 from pathlib import Path
 from unittest.mock import Mock
@@ -148,3 +150,117 @@ class TestArgparsing(unittest.TestCase):
         parsed_args = parse_args(self.terminal, ["--log-file-statistic", "foo"])
 
         self.assertEqual(parsed_args.log_file_statistic, Path("foo"))
+
+    def test_parse_profile(self):
+        parsed_args = parse_args(self.terminal, ["--profile", "foo.json"])
+
+        self.assertEqual(parsed_args.profile, Path("foo.json"))
+
+    def test_parse_profile_default_file(self):
+        parsed_args = parse_args(self.terminal, ["--fix", "--profile"])
+
+        self.assertEqual(parsed_args.profile, Path("troubadix-profile.json"))
+
+    def test_parse_no_profile(self):
+        parsed_args = parse_args(self.terminal, ["--fix"])
+
+        self.assertIsNone(parsed_args.profile)
+
+    def test_parse_oid_index(self):
+        parsed_args = parse_args(self.terminal, ["--oid-index", "oids.json"])
+
+        self.assertEqual(parsed_args.oid_index, Path("oids.json"))
+
+    def test_parse_no_oid_index(self):
+        parsed_args = parse_args(self.terminal, ["--fix"])
+
+        self.assertIsNone(parsed_args.oid_index)
+
+    def test_parse_feed_index(self):
+        parsed_args = parse_args(self.terminal, ["--feed-index"])
+
+        self.assertTrue(parsed_args.feed_index)
+
+    def test_parse_changed_since(self):
+        parsed_args = parse_args(self.terminal, ["--changed-since", "main"])
+
+        self.assertEqual(parsed_args.changed_since, "main")
+
+    def test_parse_changed_since_with_files(self):
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+            parse_args(self.terminal, ["--changed-since", "main", "--files", "foo.nasl"])
+
+    def test_parse_shard(self):
+        parsed_args = parse_args(
+            self.terminal, ["--shard", "2/4", "--shard-results", "shard.results"]
+        )
+
+        self.assertEqual(parsed_args.shard, (2, 4))
+        self.assertEqual(parsed_args.shard_results, Path("shard.results"))
+
+    def test_parse_invalid_shard(self):
+        for shard in ("0/4", "5/4", "1", "a/b"):
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                parse_args(self.terminal, ["--shard", shard])
+
+    def test_parse_shard_results_without_shard(self):
+        with self.assertRaises(SystemExit):
+            parse_args(self.terminal, ["--shard-results", "shard.results"])
+
+    def test_parse_serve(self):
+        parsed_args = parse_args(self.terminal, ["--serve", "foo.sock", "-r", "."])
+
+        self.assertEqual(parsed_args.serve, Path("foo.sock"))
+        self.assertIsNone(parsed_args.connect)
+
+    def test_parse_serve_without_root(self):
+        with self.assertRaises(SystemExit):
+            parse_args(self.terminal, ["--serve", "foo.sock"])
+
+    def test_parse_serve_unsupported(self):
+        for arguments in (["--profile"], ["--oid-index", "oids.json"], ["--files", "foo.nasl"]):
+            with self.subTest(arguments=arguments), self.assertRaises(SystemExit):
+                parse_args(self.terminal, ["--serve", "foo.sock", "-r", ".", *arguments])
+
+    def test_parse_serve_feed_index(self):
+        parsed_args = parse_args(self.terminal, ["--serve", "foo.sock", "-r", ".", "--feed-index"])
+
+        self.assertTrue(parsed_args.feed_index)
+
+    def test_parse_connect_unsupported(self):
+        for arguments in (
+            ["--fix"],
+            ["--include-tests", "foo"],
+            ["--plugin-timeout", "5"],
+            ["--feed-index"],
+        ):
+            with self.subTest(arguments=arguments), self.assertRaises(SystemExit):
+                parse_args(
+                    self.terminal, ["--connect", "foo.sock", "--files", "a.nasl", *arguments]
+                )
+
+    def test_parse_connect(self):
+        parsed_args = parse_args(self.terminal, ["--connect", "foo.sock", "--files", "foo.nasl"])
+
+        self.assertEqual(parsed_args.connect, Path("foo.sock"))
+
+    def test_parse_cache(self):
+        parsed_args = parse_args(self.terminal, ["--cache-dir", "foo", "--cache-max-size", "10"])
+
+        self.assertEqual(parsed_args.cache_dir, Path("foo"))
+        self.assertEqual(parsed_args.cache_max_size, 10)
+
+    def test_parse_plugin_timeout(self):
+        parsed_args = parse_args(self.terminal, ["--plugin-timeout", "2.5"])
+
+        self.assertEqual(parsed_args.plugin_timeout, 2.5)
+
+    def test_parse_invalid_plugin_timeout(self):
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+            parse_args(self.terminal, ["--plugin-timeout", "-1"])
+
+    def test_parse_no_cache(self):
+        parsed_args = parse_args(self.terminal, ["--fix"])
+
+        self.assertIsNone(parsed_args.cache_dir)
+        self.assertEqual(parsed_args.cache_max_size, 1024)
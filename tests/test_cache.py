@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from troubadix import cache as cache_module
+from troubadix.cache import ResultCache, plugins_fingerprint
+from troubadix.helper.content_store import ContentStore
+from troubadix.plugin import FilePluginContext, LinterError
+from troubadix.plugins.cvss_format import CheckCVSSFormat
+from troubadix.plugins.dependencies import CheckDependencies
+from troubadix.plugins.duplicate_oid import CheckDuplicateOID
+from troubadix.results import FileResults
+
+
+class TestPluginsFingerprint(unittest.TestCase):
+    def test_fingerprint(self):
+        fingerprint = plugins_fingerprint([CheckCVSSFormat], ignore_warnings=False)
+
+        self.assertEqual(fingerprint, plugins_fingerprint([CheckCVSSFormat], ignore_warnings=False))
+        self.assertNotEqual(
+            fingerprint, plugins_fingerprint([CheckCVSSFormat], ignore_warnings=True)
+        )
+        self.assertNotEqual(
+            fingerprint,
+            plugins_fingerprint([CheckCVSSFormat, CheckDuplicateOID], ignore_warnings=False),
+        )
+
+    def test_fingerprint_sources(self):
+        fingerprint = plugins_fingerprint([CheckCVSSFormat])
+
+        with patch.object(cache_module, "_sources_digest", return_value=b"changed"):
+            self.assertNotEqual(fingerprint, plugins_fingerprint([CheckCVSSFormat]))
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name) / "nasl"
+        (self.root / "common").mkdir(parents=True)
+        self.nasl_file = self.root / "common" / "foo.nasl"
+        self.nasl_file.write_text('script_dependencies("bar.nasl");\n', encoding="latin1")
+        self.cache = ResultCache(Path(self.tmpdir.name) / "cache")
+        self.plugins = [CheckCVSSFormat, CheckDependencies]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def key(self) -> str:
+        # a new store per key, as files are changed during the tests
+        context = FilePluginContext(
+            root=self.root, nasl_file=self.nasl_file, content_store=ContentStore()
+        )
+        return self.cache.key("fingerprint", context, self.plugins)
+
+    def test_key_changes_with_content(self):
+        key = self.key()
+        self.assertEqual(key, self.key())
+
+        self.nasl_file.write_text('script_dependencies("baz.nasl");\n', encoding="latin1")
+
+        self.assertNotEqual(key, self.key())
+
+    def test_key_changes_with_input_files(self):
+        key = self.key()
+
+        dependency = self.root / "common" / "bar.nasl"
+        dependency.write_text("exit(0);\n", encoding="latin1")
+        created_key = self.key()
+        self.assertNotEqual(key, created_key)
+
+        dependency.write_text("exit(1);\n", encoding="latin1")
+        self.assertNotEqual(created_key, self.key())
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get(self.key(), self.nasl_file))
+
+    def test_put_get(self):
+        results = FileResults(self.nasl_file)
+        results.add_plugin_results(CheckCVSSFormat.name, [LinterError("foo", plugin="bar")])
+        results.add_plugin_results(CheckDependencies.name, [])
+        results.add_plugin_facts(CheckDuplicateOID.name, ["1.2.3"])
+
+        key = self.key()
+        self.cache.put(key, results)
+        cached = self.cache.get(key, self.nasl_file)
+
+        self.assertTrue(cached.cached)
+        self.assertTrue(cached)
+        self.assertEqual(cached.file_path, self.nasl_file)
+        self.assertEqual(cached.plugin_results, results.plugin_results)
+        self.assertEqual(cached.plugin_facts, {CheckDuplicateOID.name: ["1.2.3"]})
+        self.assertEqual(cached.plugin_timings, {})
+
+    def test_put_json(self):
+        results = FileResults(self.nasl_file)
+        results.add_plugin_results(
+            CheckCVSSFormat.name, [LinterError("foo", file=self.nasl_file, plugin="bar", line=2)]
+        )
+
+        key = self.key()
+        self.cache.put(key, results)
+        data = json.loads((self.cache.directory / key[:2] / key).read_text(encoding="utf-8"))
+
+        self.assertEqual(
+            data["plugin_results"],
+            {
+                CheckCVSSFormat.name: [
+                    {
+                        "type": "LinterError",
+                        "message": "foo",
+                        "file": str(self.nasl_file),
+                        "plugin": "bar",
+                        "line": 2,
+                    }
+                ]
+            },
+        )
+
+    def test_put_not_serializable(self):
+        results = FileResults(self.nasl_file)
+        results.add_plugin_facts(CheckDuplicateOID.name, [object()])
+
+        key = self.key()
+        self.cache.put(key, results)
+
+        self.assertIsNone(self.cache.get(key, self.nasl_file))
+
+    def test_get_pickle(self):
+        key = self.key()
+        path = self.cache.directory / key[:2] / key
+        path.parent.mkdir(parents=True)
+        path.write_bytes(pickle.dumps(({}, {})))
+
+        self.assertIsNone(self.cache.get(key, self.nasl_file))
+
+    def test_get_invalid(self):
+        key = self.key()
+        path = self.cache.directory / key[:2] / key
+        path.parent.mkdir(parents=True)
+        path.write_text('{"plugin_results": {"foo": [{"type": "os.system"}]}}')
+
+        self.assertIsNone(self.cache.get(key, self.nasl_file))
+
+    def test_evict(self):
+        keys = [f"{i:02}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            self.cache.put(key, FileResults(self.nasl_file))
+            path = self.cache.directory / key[:2] / key
+            os.utime(path, (i, i))
+
+        self.cache.max_bytes = 2 * path.stat().st_size
+        self.assertEqual(self.cache.evict(), 1)
+
+        self.assertIsNone(self.cache.get(keys[0], self.nasl_file))
+        self.assertIsNotNone(self.cache.get(keys[1], self.nasl_file))
+        self.assertIsNotNone(self.cache.get(keys[2], self.nasl_file))
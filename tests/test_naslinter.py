@@ -22,7 +22,20 @@ from unittest.mock import Mock
 
 from pontos.terminal import Terminal
 
-from troubadix.troubadix import generate_file_list, generate_patterns
+from troubadix.standalone_plugins.common import git
+from troubadix.standalone_plugins.util import temporary_git_directory
+from troubadix.troubadix import (
+    generate_file_list,
+    generate_patterns,
+    get_changed_files,
+    get_dependent_files,
+)
+
+
+def _write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="latin1")
+    return path
 
 
 class TestNASLinter(unittest.TestCase):
@@ -106,3 +119,53 @@ class TestNASLinter(unittest.TestCase):
 
         self.assertEqual(new_include_patterns, expected_include_patterns)
         self.assertEqual(new_exclude_patterns, expected_exclude_patterns)
+
+    def test_get_changed_files(self):
+        with temporary_git_directory() as tmpdir:
+            common = tmpdir / "nasl" / "common"
+            changed = _write(common / "changed.nasl", "exit(0);\n")
+            deleted = _write(common / "deleted.inc", "exit(0);\n")
+            _write(common / "unchanged.nasl", "exit(0);\n")
+            _write(common / "README.md", "readme\n")
+            git("add", ".")
+            git("commit", "-m", "initial")
+
+            _write(changed, "exit(1);\n")
+            deleted.unlink()
+            untracked = _write(common / "untracked.nasl", "exit(0);\n")
+            _write(common / "README.md", "changed\n")
+
+            files = get_changed_files("HEAD")
+
+        self.assertEqual(files, sorted([changed, deleted, untracked]))
+
+    def test_get_dependent_files(self):
+        with temporary_git_directory() as tmpdir:
+            root = tmpdir / "nasl"
+            changed = _write(root / "common" / "changed.nasl", "exit(0);\n")
+            dependent = _write(
+                root / "common" / "dependent.nasl",
+                'script_dependencies("foo.nasl", "changed.nasl");\n',
+            )
+            gsf_dependent = _write(
+                root / "22.04" / "gsf" / "dependent.nasl",
+                'script_dependencies("changed.nasl");\n',
+            )
+            # mentions the name, but doesn't depend on it
+            _write(root / "common" / "other.nasl", "# changed.nasl\n")
+            _write(
+                root / "common" / "other_dependency.nasl",
+                'script_dependencies("gsf/changed.nasl");\n',
+            )
+            git("add", ".")
+
+            files = get_dependent_files(root, [changed])
+
+        self.assertEqual(sorted(files), sorted([dependent, gsf_dependent]))
+
+    def test_get_dependent_files_none(self):
+        with temporary_git_directory() as tmpdir:
+            root = tmpdir / "nasl"
+            changed = _write(root / "common" / "changed.nasl", "exit(0);\n")
+
+            self.assertEqual(get_dependent_files(root, [changed]), [])
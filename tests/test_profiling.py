@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from troubadix.helper.patterns import compile_pattern
+from troubadix.profiling import Profile, measure
+from troubadix.results import FileResults, Results, Timing
+
+_root = Path(__file__).parent / "plugins" / "test_files" / "nasl"
+
+
+class TestMeasure(unittest.TestCase):
+    def test_measure(self):
+        with measure() as timing:
+            sum(range(1000))
+
+        self.assertEqual(timing.calls, 1)
+        self.assertGreater(timing.wall, 0.0)
+        self.assertGreaterEqual(timing.cpu, 0.0)
+
+    def test_measure_pattern_registry(self):
+        with measure() as timing:
+            compile_pattern(r"test_measure_pattern_registry\s*")
+            compile_pattern(r"test_measure_pattern_registry\s*")
+
+        self.assertEqual(timing.compiles, 1)
+        self.assertEqual(timing.pattern_hits, 1)
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        self.file1 = _root / "21.04" / "runner" / "test.nasl"
+        self.file2 = _root / "21.04" / "runner" / "fail.nasl"
+
+        self.profile = Profile(_root)
+
+        results = FileResults(self.file1)
+        results.add_plugin_timing("plugin_a", Timing(wall=1.0, cpu=0.5, calls=1))
+        results.add_plugin_timing("plugin_b", Timing(wall=2.0, cpu=2.0, calls=1))
+        self.profile.add(results)
+
+        results = FileResults(self.file2)
+        results.add_plugin_timing("plugin_a", Timing(wall=0.5, cpu=0.5, calls=1))
+        self.profile.add(results)
+
+        results = Results()
+        results.add_plugin_timing("plugin_c", Timing(wall=4.0, cpu=1.0, calls=1))
+        self.profile.add(results)
+
+    def test_top_plugins(self):
+        top = self.profile.top_plugins(2)
+
+        self.assertEqual(
+            top,
+            [
+                ("plugin_c", Timing(wall=4.0, cpu=1.0, calls=1)),
+                ("plugin_b", Timing(wall=2.0, cpu=2.0, calls=1)),
+            ],
+        )
+
+    def test_top_files(self):
+        top = self.profile.top_files(5)
+
+        self.assertEqual(
+            top,
+            [
+                (self.file1, Timing(wall=3.0, cpu=2.5, calls=2)),
+                (self.file2, Timing(wall=0.5, cpu=0.5, calls=1)),
+            ],
+        )
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            profile_file = Path(tempdir) / "profile.json"
+
+            self.profile.write(profile_file)
+
+            data = json.loads(profile_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(
+            data["plugins"]["plugin_a"],
+            {"wall": 1.5, "cpu": 1.0, "calls": 2, "compiles": 0, "pattern_hits": 0},
+        )
+        self.assertEqual(
+            data["files"]["21.04/runner/test.nasl"],
+            {"wall": 3.0, "cpu": 2.5, "calls": 2, "compiles": 0, "pattern_hits": 0},
+        )
+        self.assertEqual(len(data["files"]), 2)
@@ -16,11 +16,19 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 # pylint: disable=protected-access
 
+import json
 import unittest
 from pathlib import Path
 
 from troubadix.plugin import LinterError, LinterWarning
-from troubadix.results import FileResults
+from troubadix.results import (
+    BatchResults,
+    FileResults,
+    FilesResults,
+    Results,
+    Timing,
+    WorkerTimes,
+)
 
 
 class TestResults(unittest.TestCase):
@@ -60,3 +68,69 @@ class TestResults(unittest.TestCase):
         )
 
         self.assertTrue(fresults)
+
+    def test_merge(self):
+        error = LinterError("first", plugin="test")
+        other_error = LinterError("second", plugin="test")
+        results = Results()
+        results.add_plugin_results("test", [error])
+        results.add_plugin_timing("test", Timing(wall=1.0, calls=1))
+        other = Results()
+        other.add_plugin_results("test", [other_error])
+        other.add_plugin_timing("test", Timing(wall=2.0, calls=1))
+
+        results.merge(other)
+
+        self.assertTrue(results)
+        self.assertEqual([error, other_error], results.plugin_results["test"])
+        self.assertEqual(Timing(wall=3.0, calls=2), results.plugin_timings["test"])
+
+    def test_json(self):
+        results = FileResults(file_path=Path("some/file.nasl"))
+        results.add_plugin_results(
+            "test",
+            [
+                LinterError("error", file=Path("some/file.nasl"), plugin="test", line=3),
+                LinterWarning("warning", plugin="test"),
+            ],
+        )
+        results.add_plugin_timing("test", Timing(wall=1.0, calls=1))
+        results.add_plugin_facts("facts", ["1.2.3", None])
+
+        loaded = FileResults.from_json(json.loads(json.dumps(results.to_json())))
+
+        self.assertEqual(Path("some/file.nasl"), loaded.file_path)
+        self.assertEqual(results.plugin_results, loaded.plugin_results)
+        self.assertEqual(results.plugin_timings, loaded.plugin_timings)
+        self.assertEqual(results.plugin_facts, loaded.plugin_facts)
+
+    def test_json_invalid(self):
+        with self.assertRaises(ValueError):
+            Results.from_json({"plugin_results": {"test": [{"type": "dict"}]}})
+        with self.assertRaises(ValueError):
+            FileResults.from_json({"plugin_results": {}, "plugin_timings": {}})
+
+
+class TestWorkerTimes(unittest.TestCase):
+    def test_no_batches(self):
+        worker_times = WorkerTimes(n_jobs=2)
+
+        self.assertEqual(worker_times.utilisation, 0.0)
+        self.assertEqual(worker_times.idle_tail, 0.0)
+
+    def test_utilisation_and_idle_tail(self):
+        worker_times = WorkerTimes(n_jobs=2)
+        worker_times.add(BatchResults([], worker=1, start=0.0, end=4.0))
+        worker_times.add(BatchResults([], worker=2, start=0.0, end=1.0))
+        worker_times.add(BatchResults([], worker=2, start=1.0, end=2.0))
+
+        self.assertEqual(worker_times.utilisation, 6.0 / 8.0)
+        self.assertEqual(worker_times.idle_tail, 2.0)
+
+    def test_files_plugin_time(self):
+        worker_times = WorkerTimes(n_jobs=2)
+        worker_times.add(BatchResults([], worker=1, start=0.0, end=2.0))
+        worker_times.add(FilesResults(Results(), worker=2, start=0.0, end=4.0))
+
+        self.assertEqual(worker_times.utilisation, 6.0 / 8.0)
+        self.assertEqual(worker_times.idle_tail, 2.0)
@@ -17,6 +17,7 @@
 # pylint: disable=protected-access
 
 import io
+import tempfile
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
@@ -34,8 +35,9 @@ from troubadix.plugins.missing_desc_exit import CheckMissingDescExit
 from troubadix.plugins.script_version_and_last_modification_tags import (
     CheckScriptVersionAndLastModificationTags,
 )
+from troubadix.plugins.spelling import CheckSpelling
 from troubadix.reporter import Reporter
-from troubadix.runner import Runner
+from troubadix.runner import MAX_BATCH_FILES, MIN_BATCH_BYTES, Runner, create_batches
 
 _here = Path(__file__).parent
 
@@ -159,6 +161,148 @@ class TestRunner(unittest.TestCase):
             0,
         )
 
+    def test_runner_run_files_and_file_plugins(self):
+        nasl_files = [
+            _here / "plugins" / "test_files" / "nasl" / "21.04" / "runner" / "test.nasl",
+            _here / "plugins" / "test_files" / "nasl" / "21.04" / "runner" / "fail.nasl",
+        ]
+        runner = Runner(
+            n_jobs=2,
+            reporter=self._reporter,
+            included_plugins=[CheckDuplicateOID.name, CheckCVSSFormat.name],
+            root=self.root,
+        )
+
+        with redirect_stdout(io.StringIO()):
+            sys_exit = runner.run(nasl_files)
+
+        self.assertFalse(sys_exit)
+
+        result_counts = self._reporter._result_counts.result_counts
+        self.assertEqual(result_counts[CheckDuplicateOID.name]["error"], 2)
+        self.assertEqual(result_counts[CheckCVSSFormat.name]["error"], 2)
+
+    def test_runner_run_split_files_plugin(self):
+        test_files = _here / "plugins" / "test_files"
+        nasl_files = [
+            test_files / "fail_spelling.nasl",
+            _here / "plugins" / "test.nasl",
+            test_files / "fail_spelling_iso_8859_1.nasl",
+        ]
+        outputs = []
+        for n_jobs in (1, 3):
+            reporter = Reporter(term=self._term, root=_here / "plugins", verbose=2)
+            runner = Runner(
+                n_jobs=n_jobs,
+                reporter=reporter,
+                included_plugins=[CheckSpelling.name],
+                root=_here / "plugins",
+            )
+
+            with redirect_stdout(io.StringIO()) as f:
+                runner.run(nasl_files)
+
+            # the single files are reported in between, as they are checked,
+            # and the timing line may wrap
+            lines = f.getvalue().splitlines()
+            elapsed = next(i for i, line in enumerate(lines) if "Time elapsed" in line)
+            statistic = next(i for i, line in enumerate(lines) if "Errors Warnings" in line)
+            outputs.append(
+                [line for line in lines[:elapsed] + lines[statistic:] if "Checking" not in line]
+            )
+
+            self.assertEqual(reporter._result_counts.result_counts[CheckSpelling.name]["error"], 4)
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_runner_run_with_profile(self):
+        nasl_file = _here / "plugins" / "test_files" / "nasl" / "21.04" / "runner" / "fail.nasl"
+        runner = Runner(
+            n_jobs=1,
+            reporter=self._reporter,
+            included_plugins=[CheckDuplicateOID.name, CheckCVSSFormat.name],
+            root=self.root,
+            profile=True,
+        )
+
+        with redirect_stdout(io.StringIO()) as f:
+            runner.run([nasl_file])
+
+        self.assertEqual(runner.profile.plugins[CheckCVSSFormat.name].calls, 1)
+        # map and reduce step
+        self.assertEqual(runner.profile.plugins[CheckDuplicateOID.name].calls, 2)
+        self.assertEqual(runner.profile.files[nasl_file].calls, 2)
+        self.assertIn("21.04/runner/fail.nasl", f.getvalue())
+
+    def test_runner_run_with_oid_index(self):
+        runner_dir = _here / "plugins" / "test_files" / "nasl" / "21.04" / "runner"
+        runner = Runner(
+            n_jobs=1,
+            reporter=self._reporter,
+            included_plugins=[CheckDuplicateOID.name],
+            root=self.root,
+            oid_index=True,
+        )
+
+        with redirect_stdout(io.StringIO()):
+            runner.run([runner_dir / "test_valid_oid.nasl", runner_dir / "fail.nasl"])
+
+        self.assertEqual(
+            runner.oid_index.get("1.3.6.1.4.1.25623.1.0.123"),
+            Path("21.04/runner/test_valid_oid.nasl"),
+        )
+        self.assertEqual(len(runner.oid_index), 1)
+
+    def test_runner_run_without_oid_index(self):
+        nasl_file = _here / "plugins" / "test_files" / "nasl" / "21.04" / "runner" / "fail.nasl"
+        runner = Runner(
+            n_jobs=1,
+            reporter=self._reporter,
+            included_plugins=[CheckDuplicateOID.name],
+            root=self.root,
+        )
+
+        with redirect_stdout(io.StringIO()):
+            runner.run([nasl_file])
+
+        self.assertIsNone(runner.oid_index)
+
+    def test_runner_run_with_cache(self):
+        nasl_file = _here / "plugins" / "test_files" / "nasl" / "21.04" / "runner" / "fail.nasl"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            outputs = []
+            for _ in range(2):
+                runner = Runner(
+                    n_jobs=1,
+                    reporter=Reporter(term=self._term, root=self.root),
+                    included_plugins=[CheckDuplicateOID.name, CheckCVSSFormat.name],
+                    root=self.root,
+                    cache_dir=Path(cache_dir),
+                )
+
+                with redirect_stdout(io.StringIO()) as f:
+                    runner.run([nasl_file])
+
+                outputs.append(f.getvalue())
+
+        self.assertIn("Result cache: 0 of 1 files unchanged", outputs[0])
+        self.assertIn("Result cache: 1 of 1 files unchanged", outputs[1])
+        # the same results are reported from the cache
+        self.assertEqual(outputs[0].split("Result cache")[0], outputs[1].split("Result cache")[0])
+
+    def test_runner_run_fix_without_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            runner = Runner(
+                n_jobs=1,
+                reporter=self._reporter,
+                root=self.root,
+                fix=True,
+                cache_dir=Path(cache_dir),
+            )
+
+        self.assertIsNone(runner._cache)
+
     def test_runner_run_fail_with_verbose_level_2(self):
         nasl_file = _here / "plugins" / "test_files" / "nasl" / "21.04" / "runner" / "fail.nasl"
         content = nasl_file.read_text(encoding=CURRENT_ENCODING)
@@ -320,13 +464,14 @@ class TestRunner(unittest.TestCase):
         compare_content = (
             "\tIncluded Plugins: check_duplicate_oid, check_missing_desc_exit\n"
             "\tRunning plugins: check_duplicate_oid, check_missing_desc_exit\n"
+            f"\n\nChecking {get_path_from_root(nasl_file, self.root)} (1/1)\n\t\t"
+            "No results for plugin"
+            " check_missing_desc_exit\n"
             "\n\nRun plugin check_duplicate_oid\n"
             "\tResults for plugin check_duplicate_oid\n"
             "\t\tInvalid OID 1.2.3.4.5.6.78909.1.7.654321 found"
-            " in '21.04/runner/test.nasl'.\n\n\n"
-            f"Checking {get_path_from_root(nasl_file, self.root)} (1/1)\n\t\t"
-            "No results for plugin"
-            " check_missing_desc_exit\n\tTime elapsed: 0:00:00.013967"
+            " in '21.04/runner/test.nasl'.\n"
+            "\tTime elapsed: 0:00:00.013967"
         )
         gen_content = gen_log_file.read_text(encoding="utf-8")
         gen_log_file.unlink()
@@ -497,3 +642,42 @@ class TestRunner(unittest.TestCase):
         gen_log_file.unlink()
 
         self.assertNotEqual(compare_content, gen_content)
+
+
+class TestCreateBatches(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.tmp = Path(self._tempdir.name)
+
+    def _create_file(self, name: str, size: int) -> Path:
+        file_path = self.tmp / name
+        file_path.write_bytes(b"x" * size)
+        return file_path
+
+    def test_largest_files_first(self):
+        small = self._create_file("small.nasl", 10)
+        large = self._create_file("large.nasl", MIN_BATCH_BYTES * 2)
+        medium = self._create_file("medium.nasl", MIN_BATCH_BYTES)
+
+        batches = create_batches([small, large, medium], n_jobs=1)
+
+        self.assertEqual(batches, [[large], [medium], [small]])
+
+    def test_small_files_are_bundled(self):
+        files = [self._create_file(f"{i}.nasl", 10) for i in range(MAX_BATCH_FILES + 1)]
+
+        batches = create_batches(files, n_jobs=4)
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(len(batches[0]), MAX_BATCH_FILES)
+        self.assertEqual(len(batches[1]), 1)
+        self.assertCountEqual([f for batch in batches for f in batch], files)
+
+    def test_missing_file(self):
+        missing = self.tmp / "missing.nasl"
+
+        self.assertEqual(create_batches([missing], n_jobs=1), [[missing]])
+
+    def test_no_files(self):
+        self.assertEqual(create_batches([], n_jobs=1), [])
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import io
+import json
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from troubadix.plugins.cvss_format import CheckCVSSFormat
+from troubadix.server import Server, run_client
+
+_here = Path(__file__).parent
+_root = _here / "plugins" / "test_files" / "nasl"
+
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.socket_path = Path(tempdir.name) / "troubadix.sock"
+
+        self.server = Server(
+            self.socket_path,
+            root=_root,
+            n_jobs=1,
+            included_plugins=[CheckCVSSFormat.name],
+        )
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.start()
+
+        def stop():
+            self.server.shutdown()
+            thread.join()
+            self.server.server_close()
+
+        self.addCleanup(stop)
+
+    def test_run_client(self):
+        nasl_file = _root / "21.04" / "runner" / "fail.nasl"
+
+        # the pool is reused for several requests
+        for _ in range(2):
+            output = io.StringIO()
+            success = run_client(self.socket_path, [nasl_file], output=output, verbose=1)
+
+            self.assertFalse(success)
+            self.assertIn("Checking 21.04/runner/fail.nasl (1/1)", output.getvalue())
+            self.assertIn("check_cvss_format", output.getvalue())
+
+    def test_run_client_success(self):
+        nasl_file = _root / "21.04" / "runner" / "test.nasl"
+        output = io.StringIO()
+
+        self.assertTrue(run_client(self.socket_path, [nasl_file], output=output))
+
+    def test_invalid_request(self):
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(str(self.socket_path))
+            with sock.makefile("rw", encoding="utf-8") as stream:
+                stream.write('{"foo": []}\n')
+                stream.flush()
+
+                message = json.loads(stream.readline())
+
+        self.assertIn("error", message)
+
+    def test_run_error(self):
+        nasl_file = _root / "21.04" / "runner" / "test.nasl"
+        pool = self.server.pool
+
+        with (
+            patch("troubadix.server.Runner.run", side_effect=OSError("broken")),
+            self.assertRaisesRegex(RuntimeError, "OSError: broken"),
+        ):
+            run_client(self.socket_path, [nasl_file], output=io.StringIO())
+
+        # the next request runs on a new pool
+        self.assertIsNot(pool, self.server.pool)
+        self.assertTrue(run_client(self.socket_path, [nasl_file], output=io.StringIO()))
+
+    def test_run_refreshes_feed_index(self):
+        nasl_file = _root / "21.04" / "runner" / "test.nasl"
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.server.feed_index_file = Path(tempdir.name) / "feed-index.db"
+        output = io.StringIO()
+
+        self.assertTrue(run_client(self.socket_path, [nasl_file], output=output))
+        self.assertIn("Feed index:", output.getvalue())
+        self.assertTrue(self.server.feed_index_file.exists())
+
+    def test_server_close_removes_socket(self):
+        self.assertTrue(self.socket_path.exists())
+        self.server.shutdown()
+        self.server.server_close()
+
+        self.assertFalse(self.socket_path.exists())
@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+# pylint: disable=protected-access
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from pontos.terminal.terminal import ConsoleTerminal
+
+from troubadix.__version__ import __version__
+from troubadix.plugin import LinterError
+from troubadix.plugins.cvss_format import CheckCVSSFormat
+from troubadix.plugins.duplicate_oid import CheckDuplicateOID
+from troubadix.reporter import Reporter
+from troubadix.results import FileResults, Results
+from troubadix.runner import Runner
+from troubadix.shard import ShardResults, check_shards, main, select_shard
+
+_here = Path(__file__).parent
+_root = _here / "plugins" / "test_files" / "nasl"
+
+
+class TestSelectShard(unittest.TestCase):
+    def setUp(self):
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.root = Path(tempdir.name)
+
+        self.files = []
+        for i, size in enumerate([100, 10, 50, 50, 30, 20, 80, 5]):
+            path = self.root / f"{i}.nasl"
+            path.write_bytes(b"x" * size)
+            self.files.append(path)
+
+    def test_shards_split_all_files(self):
+        shards = [select_shard(self.files, self.root, index, 3) for index in range(1, 4)]
+
+        self.assertEqual(sorted(file for shard in shards for file in shard), sorted(self.files))
+        self.assertEqual(sum(len(shard) for shard in shards), len(self.files))
+
+    def test_deterministic(self):
+        self.assertEqual(
+            select_shard(self.files, self.root, 2, 3),
+            select_shard(reversed(self.files), self.root, 2, 3),
+        )
+
+    def test_balanced_by_size(self):
+        sizes = [
+            sum(file.stat().st_size for file in select_shard(self.files, self.root, index, 2))
+            for index in (1, 2)
+        ]
+
+        self.assertEqual(sizes, [175, 170])
+
+    def test_single_shard(self):
+        self.assertEqual(sorted(select_shard(self.files, self.root, 1, 1)), sorted(self.files))
+
+
+class TestShardResults(unittest.TestCase):
+    def test_write_read(self):
+        shard = ShardResults(_root, 1, 2, map_reduce_plugins=[CheckDuplicateOID.name])
+        file_results = FileResults(_root / "common" / "foo.nasl")
+        file_results.add_plugin_results("plugin", [LinterError("error")])
+        shard.add(file_results)
+        shard.add(Results().add_plugin_results("files_plugin", [LinterError("error")]))
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            shard_file = Path(tempdir) / "shard.results"
+            shard.write(shard_file)
+            read_shard = ShardResults.read(shard_file)
+
+        self.assertEqual(read_shard.index, 1)
+        self.assertEqual(read_shard.count, 2)
+        self.assertEqual(read_shard.map_reduce_plugins, [CheckDuplicateOID.name])
+        self.assertEqual(len(read_shard.file_results), 1)
+        self.assertEqual(len(read_shard.results), 1)
+        self.assertEqual(read_shard.root, _root)
+        self.assertEqual(read_shard.file_results[0].file_path, file_results.file_path)
+        self.assertEqual(read_shard.file_results[0].plugin_results, file_results.plugin_results)
+
+    def test_read_invalid(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            shard_file = Path(tempdir) / "shard.results"
+            shard_file.write_bytes(b"\x80\x04N.")
+
+            with self.assertRaises(ValueError):
+                ShardResults.read(shard_file)
+
+    def test_read_no_shard_results(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            shard_file = Path(tempdir) / "shard.results"
+            shard_file.write_text('["version"]', encoding="utf-8")
+
+            with self.assertRaises(TypeError):
+                ShardResults.read(shard_file)
+
+            shard_file.write_text(json.dumps({"version": __version__}), encoding="utf-8")
+
+            with self.assertRaises(TypeError):
+                ShardResults.read(shard_file)
+
+    def test_read_other_version(self):
+        shard = ShardResults(_root, 1, 1)
+        shard.version = "0.0.1"
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            shard_file = Path(tempdir) / "shard.results"
+            shard.write(shard_file)
+
+            with self.assertRaisesRegex(ValueError, "0.0.1"):
+                ShardResults.read(shard_file)
+
+    def test_rebase(self):
+        shard = ShardResults(Path("/old/nasl"), 1, 1)
+        shard.add(FileResults(Path("/old/nasl/common/foo.nasl")))
+
+        shard.rebase(Path("/new/nasl"))
+
+        self.assertEqual(shard.root, Path("/new/nasl"))
+        self.assertEqual(shard.file_results[0].file_path, Path("/new/nasl/common/foo.nasl"))
+
+    def test_check_shards(self):
+        check_shards([ShardResults(_root, 2, 2), ShardResults(_root, 1, 2)])
+
+        with self.assertRaisesRegex(ValueError, "Missing results of shard"):
+            check_shards([ShardResults(_root, 2, 3), ShardResults(_root, 1, 3)])
+        with self.assertRaisesRegex(ValueError, "Duplicate"):
+            check_shards([ShardResults(_root, 1, 1), ShardResults(_root, 1, 1)])
+        with self.assertRaisesRegex(ValueError, "different shard counts"):
+            check_shards([ShardResults(_root, 1, 1), ShardResults(_root, 1, 2)])
+        with self.assertRaises(ValueError):
+            check_shards([])
+
+
+class TestMergeShards(unittest.TestCase):
+    def setUp(self):
+        self.nasl_files = [
+            _root / "21.04" / "runner" / "test.nasl",
+            _root / "21.04" / "runner" / "fail.nasl",
+        ]
+
+    def _run(self, shard: tuple[int, int] | None = None) -> Runner:
+        runner = Runner(
+            n_jobs=1,
+            reporter=Reporter(term=ConsoleTerminal(), root=_root),
+            included_plugins=[CheckDuplicateOID.name, CheckCVSSFormat.name],
+            root=_root,
+            shard=shard,
+        )
+        with redirect_stdout(io.StringIO()):
+            runner.run(self.nasl_files)
+        return runner
+
+    def test_shard_run(self):
+        runner = self._run((2, 2))
+
+        self.assertEqual(len(runner.shard.file_results), 1)
+        # the duplicate OIDs are only found when merging
+        self.assertNotIn(CheckDuplicateOID.name, runner._reporter._result_counts.result_counts)
+
+    def test_merge(self):
+        counts = self._run()._reporter._result_counts.result_counts
+
+        shards = [self._run((index, 2)).shard for index in (1, 2)]
+        reporter = Reporter(term=ConsoleTerminal(), root=_root)
+        runner = Runner(
+            n_jobs=1,
+            reporter=reporter,
+            root=_root,
+            included_plugins=[CheckDuplicateOID.name],
+        )
+        with redirect_stdout(io.StringIO()):
+            success = runner.merge(shards)
+
+        self.assertFalse(success)
+        self.assertEqual(reporter._result_counts.result_counts, counts)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            shard_files = []
+            for index in (1, 2):
+                shard_file = Path(tempdir) / f"{index}.results"
+                self._run((index, 2)).shard.write(shard_file)
+                shard_files.append(str(shard_file))
+
+            with redirect_stdout(io.StringIO()) as f, self.assertRaises(SystemExit) as cm:
+                main(shard_files)
+
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("check_duplicate_oid", f.getvalue())
+        self.assertIn("check_cvss_format", f.getvalue())
+
+    def test_main_missing_shard(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            shard_file = Path(tempdir) / "1.results"
+            self._run((1, 2)).shard.write(shard_file)
+
+            with redirect_stdout(io.StringIO()) as f, self.assertRaises(SystemExit):
+                main([str(shard_file)])
+
+        self.assertIn("Missing results of shard(s) 2/2", f.getvalue())
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import os
+import pickle
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from troubadix.plugin import FilePlugin, FilesPluginContext, LinterError
+from troubadix.plugins.cvss_format import CheckCVSSFormat
+from troubadix.plugins.duplicate_oid import CheckDuplicateOID
+from troubadix.plugins.missing_desc_exit import CheckMissingDescExit
+from troubadix.time_budget import PluginTimeoutError, time_budget
+from troubadix.worker import Worker, check_file, check_files
+
+_here = Path(__file__).parent
+_root = _here / "plugins" / "test_files" / "nasl"
+
+
+class SlowPlugin(FilePlugin):
+    name = "slow_plugin"
+
+    def run(self):
+        time.sleep(10)
+        yield from ()
+
+
+class SlowFixPlugin(FilePlugin):
+    name = "slow_fix_plugin"
+
+    def run(self):
+        yield from ()
+
+    def fix(self):
+        time.sleep(0.2)
+        yield LinterError("fixed", plugin=self.name)
+
+
+class ExceptionCatchingPlugin(FilePlugin):
+    name = "exception_catching_plugin"
+
+    def run(self):
+        try:
+            time.sleep(10)
+        except Exception:  # noqa: BLE001
+            time.sleep(10)
+        yield from ()
+
+
+class TestTimeBudget(unittest.TestCase):
+    def test_exceeded(self):
+        start = time.perf_counter()
+
+        with self.assertRaises(PluginTimeoutError), time_budget(0.05):
+            time.sleep(10)
+
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_not_exceeded(self):
+        with time_budget(5):
+            pass
+
+        # the timer is stopped
+        time.sleep(0.01)
+
+    def test_no_budget(self):
+        with time_budget(None), time_budget(0):
+            time.sleep(0.01)
+
+
+class TestWorker(unittest.TestCase):
+    def setUp(self):
+        self.worker = Worker([CheckCVSSFormat, CheckMissingDescExit], root=_root)
+
+    def test_worker_is_picklable(self):
+        worker = pickle.loads(pickle.dumps(self.worker))
+
+        self.assertEqual(worker.file_plugins, (CheckCVSSFormat, CheckMissingDescExit))
+        self.assertEqual(worker.root, _root)
+
+    def test_check_file(self):
+        nasl_file = _root / "21.04" / "runner" / "fail.nasl"
+
+        results = self.worker.check_file(nasl_file)
+
+        self.assertEqual(results.file_path, nasl_file)
+        self.assertEqual(len(results.plugin_results[CheckCVSSFormat.name]), 2)
+        self.assertIn(CheckMissingDescExit.name, results.plugin_results)
+
+    def test_check_file_collects_facts(self):
+        nasl_file = _root / "21.04" / "runner" / "test.nasl"
+        worker = Worker([], [CheckDuplicateOID], root=_root)
+
+        results = worker.check_file(nasl_file)
+
+        self.assertEqual(
+            results.plugin_facts,
+            {CheckDuplicateOID.name: ["1.2.3.4.5.6.78909.1.7.654321"]},
+        )
+
+    def test_check_file_plugin_timeout(self):
+        nasl_file = _root / "21.04" / "runner" / "fail.nasl"
+        worker = Worker([SlowPlugin, CheckCVSSFormat], root=_root, plugin_timeout=0.05)
+
+        results = worker.check_file(nasl_file)
+
+        [error] = results.plugin_results[SlowPlugin.name]
+        self.assertIsInstance(error, LinterError)
+        self.assertEqual(
+            error.message, f"Plugin slow_plugin exceeded 0.05 seconds on file {nasl_file}"
+        )
+        # the remaining plugins still run
+        self.assertEqual(len(results.plugin_results[CheckCVSSFormat.name]), 2)
+
+    def test_check_file_plugin_timeout_not_caught(self):
+        nasl_file = _root / "21.04" / "runner" / "fail.nasl"
+        worker = Worker([ExceptionCatchingPlugin], root=_root, plugin_timeout=0.05)
+        start = time.perf_counter()
+
+        results = worker.check_file(nasl_file)
+
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(len(results.plugin_results[ExceptionCatchingPlugin.name]), 1)
+
+    def test_check_file_fix_without_timeout(self):
+        nasl_file = _root / "21.04" / "runner" / "fail.nasl"
+        worker = Worker([SlowFixPlugin], root=_root, fix=True, plugin_timeout=0.05)
+
+        results = worker.check_file(nasl_file)
+
+        [result] = results.plugin_results[SlowFixPlugin.name]
+        self.assertEqual(result.message, "fixed")
+
+    def test_check_file_task(self):
+        nasl_file = _root / "21.04" / "runner" / "fail.nasl"
+
+        with patch("troubadix.worker._worker", self.worker):
+            results = check_file(nasl_file)
+
+        self.assertEqual(len(results.plugin_results[CheckCVSSFormat.name]), 2)
+
+    def test_check_files_task(self):
+        nasl_file = _root / "21.04" / "runner" / "test.nasl"
+        context = FilesPluginContext(root=_root, nasl_files=[nasl_file])
+
+        with patch("troubadix.worker._worker", self.worker):
+            files_results = check_files(CheckDuplicateOID, context)
+
+        self.assertEqual(len(files_results.results.plugin_results[CheckDuplicateOID.name]), 1)
+        self.assertEqual(files_results.worker, os.getpid())
+        self.assertLessEqual(files_results.start, files_results.end)
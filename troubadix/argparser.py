@@ -25,6 +25,8 @@ from pathlib import Path
 
 from pontos.terminal import Terminal
 
+from troubadix.time_budget import DEFAULT_PLUGIN_TIMEOUT
+
 
 # allows non existent paths and directory paths
 def directory_type(string: str) -> Path:
@@ -72,6 +74,70 @@ def check_cpu_count(number: str) -> int:
     return number
 
 
+def shard_type(string: str) -> tuple[int, int]:
+    """Parse a shard given as INDEX/COUNT, e.g. 1/4"""
+    try:
+        index, count = (int(value) for value in string.split("/"))
+    except ValueError as e:
+        raise ValueError(f"{string} is not a shard like 1/4.") from e
+    if not 1 <= index <= count:
+        raise ValueError(f"Shard index of {string} must be between 1 and {count}.")
+    return index, count
+
+
+def timeout_type(string: str) -> float:
+    """Parse a timeout in seconds, 0 for no timeout"""
+    seconds = float(string)
+    if seconds < 0:
+        raise ValueError(f"{string} is not a valid timeout.")
+    return seconds
+
+
+# The options of a run not honored by the server, as the files and the
+# reporting are given by the requests of '--connect'
+SERVE_UNSUPPORTED_OPTIONS = {
+    "--full": "full",
+    "--dirs": "dirs",
+    "--files": "files",
+    "--from-file": "from_file",
+    "--changed-since": "changed_since",
+    "--verbose": "verbose",
+    "--log-file": "log_file",
+    "--log-file-statistic": "log_file_statistic",
+    "--no-statistic": "no_statistic",
+    "--profile": "profile",
+    "--oid-index": "oid_index",
+    "--shard": "shard",
+}
+# The options of a run not honored by '--connect', as the server uses the
+# plugins and options it was started with
+CONNECT_UNSUPPORTED_OPTIONS = {
+    "--include-tests": "included_plugins",
+    "--exclude-tests": "excluded_plugins",
+    "--fix": "fix",
+    "--ignore-warnings": "ignore_warnings",
+    "--n-jobs": "n_jobs",
+    "--profile": "profile",
+    "--oid-index": "oid_index",
+    "--feed-index": "feed_index",
+    "--plugin-timeout": "plugin_timeout",
+    "--cache-dir": "cache_dir",
+    "--cache-max-size": "cache_max_size",
+    "--shard": "shard",
+}
+
+
+def _given_options(
+    parser: ArgumentParser, parsed_args: Namespace, options: dict[str, str]
+) -> list[str]:
+    """The options which are not left at their defaults"""
+    return [
+        option
+        for option, dest in options.items()
+        if getattr(parsed_args, dest) != parser.get_default(dest)
+    ]
+
+
 def parse_args(
     terminal: Terminal,
     args: Sequence[str],
@@ -141,6 +207,16 @@ def parse_args(
         ),
     )
 
+    what_group.add_argument(
+        "--changed-since",
+        metavar="REVISION",
+        help=(
+            "Check the nasl and inc files changed since the given git revision "
+            "and the VTs depending on them via script_dependencies. "
+            "Uncommitted and untracked files are included."
+        ),
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -238,6 +314,118 @@ def parse_args(
         help="Don't print the statistic",
     )
 
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=Path("troubadix-profile.json"),
+        type=file_type,
+        metavar="PROFILE_FILE",
+        help=(
+            "Measure the time spent per plugin and per file, print the slowest "
+            "ones and write all timings as JSON to the given file. "
+            "Default file: %(const)s"
+        ),
+    )
+
+    parser.add_argument(
+        "--oid-index",
+        type=file_type,
+        metavar="OID_INDEX_FILE",
+        help=(
+            "Write the OIDs of the checked VTs and their files as JSON to the "
+            "given file, to be looked up by other tools without reading the "
+            "files again. Collected by the check_duplicate_oid plugin."
+        ),
+    )
+
+    parser.add_argument(
+        "--feed-index",
+        action="store_true",
+        help=(
+            "Keep the metadata of all VTs in an index within the root, which is "
+            "refreshed for the changed VTs before every run. The plugins looking "
+            "at the dependencies of a VT take them from there."
+        ),
+    )
+
+    parser.add_argument(
+        "--plugin-timeout",
+        type=timeout_type,
+        default=DEFAULT_PLUGIN_TIMEOUT,
+        metavar="SECONDS",
+        help=(
+            "Report an error instead of waiting for a plugin, which takes longer "
+            "than the given seconds on a single file. 0 disables the timeout. "
+            "Default: %(default)s"
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=directory_type,
+        metavar="CACHE_DIR",
+        help=(
+            "Keep the results of the file checks in the given directory and "
+            "skip files, which did not change since the last run. "
+            "Not used together with --fix."
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=1024,
+        metavar="MB",
+        help="Maximum size of the result cache in MB. Default: %(default)s",
+    )
+
+    parser.add_argument(
+        "--shard",
+        type=shard_type,
+        metavar="INDEX/COUNT",
+        help=(
+            "Only check the files of the given shard, e.g. 2/4, out of a size "
+            "balanced split of all files. Plugins checking all files at once "
+            "only run on the first shard. Merge the results of all shards "
+            "with troubadix-merge-shards."
+        ),
+    )
+
+    parser.add_argument(
+        "--shard-results",
+        type=file_type,
+        metavar="SHARD_FILE",
+        help=(
+            "File to write the results of the shard to. "
+            "Default: troubadix-shard-INDEX-COUNT.results"
+        ),
+    )
+
+    server_group = parser.add_mutually_exclusive_group(required=False)
+
+    server_group.add_argument(
+        "--serve",
+        type=Path,
+        metavar="SOCKET",
+        help=(
+            "Start a server listening on the given Unix socket, which keeps "
+            "the plugins and the process pool for the requests of "
+            "'--connect'. Requires '-r'/'--root'. The plugins and options "
+            "given here are used for all requests, '--feed-index' refreshes "
+            "the index for each request."
+        ),
+    )
+
+    server_group.add_argument(
+        "--connect",
+        type=Path,
+        metavar="SOCKET",
+        help=(
+            "Let the server listening on the given Unix socket check the files "
+            "instead of starting the plugins locally."
+        ),
+    )
+
     if not args:
         print("No arguments given.", file=sys.stderr)
         parser.print_help(sys.stdout)
@@ -262,4 +450,26 @@ def parse_args(
         )
         sys.exit(1)
 
+    if parsed_args.shard_results and not parsed_args.shard:
+        terminal.warning("Argument '--shard-results' is only usable with '--shard'")
+        sys.exit(1)
+
+    if parsed_args.serve and not parsed_args.root:
+        terminal.warning("Argument '--serve' requires '-r'/'--root'")
+        sys.exit(1)
+
+    for server_option, unsupported_options in (
+        ("serve", SERVE_UNSUPPORTED_OPTIONS),
+        ("connect", CONNECT_UNSUPPORTED_OPTIONS),
+    ):
+        if not getattr(parsed_args, server_option):
+            continue
+        given = _given_options(parser, parsed_args, unsupported_options)
+        if given:
+            terminal.warning(
+                f"Argument(s) {', '.join(repr(option) for option in given)} can't be "
+                f"used with '--{server_option}'"
+            )
+            sys.exit(1)
+
     return parsed_args
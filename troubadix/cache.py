@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""On-disk cache for the results of the file plugins.
+
+A cache entry holds the results (and map reduce facts) of all file plugins
+for a single file. Its key is a hash over everything these results depend
+on: the content, path and mode of the file, the troubadix version, the
+source code of troubadix and the plugins, the relevant options and the content of the
+other files the plugins declared as their inputs (see
+`FilePlugin.input_files`). Unchanged files are therefore not linted again.
+
+The entries are stored as JSON, as the cache directory may be shared and
+loading an entry must not be able to execute code.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+
+from troubadix.__version__ import __version__
+from troubadix.plugin import FilePlugin, FilePluginContext, MapReducePlugin
+from troubadix.results import FileResults
+
+# Default upper limit for the size of all cache entries
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+_MISSING = b"\0missing"
+
+_PACKAGE_DIR = Path(__file__).parent
+
+
+@cache
+def _sources_digest() -> bytes:
+    """Hash over the source code of the troubadix package, as the plugins
+    depend on its helpers"""
+    digest = hashlib.sha256()
+    for source_file in sorted(_PACKAGE_DIR.rglob("*.py")):
+        digest.update(str(source_file.relative_to(_PACKAGE_DIR)).encode())
+        digest.update(hashlib.sha256(source_file.read_bytes()).digest())
+    return digest.digest()
+
+
+def plugins_fingerprint(
+    plugins: Iterable[type[FilePlugin] | type[MapReducePlugin]], **options
+) -> str:
+    """Create a fingerprint of the troubadix version and source code, the
+    used plugins including their source code and the given options"""
+    digest = hashlib.sha256(__version__.encode())
+    digest.update(_sources_digest())
+
+    for plugin in plugins:
+        digest.update(plugin.name.encode())
+        digest.update(Path(inspect.getsourcefile(plugin)).read_bytes())
+
+    for name, value in sorted(options.items()):
+        digest.update(f"{name}={value!r}".encode())
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Stores the results of the file plugins below a directory and drops
+    the least recently used entries when exceeding max_bytes"""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(
+        self,
+        fingerprint: str,
+        context: FilePluginContext,
+        plugins: Iterable[type[FilePlugin] | type[MapReducePlugin]],
+    ) -> str:
+        """Create the key of the cache entry for the file of the context"""
+        digest = hashlib.sha256(fingerprint.encode())
+        digest.update(str(context.nasl_file).encode())
+        digest.update(str(context.nasl_file.stat().st_mode).encode())
+        digest.update(context.file_bytes)
+
+        for plugin in plugins:
+            for input_file in plugin.input_files(context):
+                digest.update(str(input_file).encode())
+                if input_file.is_file():
+                    digest.update(
+                        hashlib.sha256(context.content_store.get(input_file).raw).digest()
+                    )
+                else:
+                    digest.update(_MISSING)
+
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str, file_path: Path) -> FileResults | None:
+        """Return the cached results for the key or None"""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_bytes())
+            data["file_path"] = str(file_path)
+            results = FileResults.from_json(data)
+            # mark the entry as recently used
+            os.utime(path)
+        except (OSError, ValueError, TypeError):
+            return None
+
+        results.cached = True
+
+        return results
+
+    def put(self, key: str, results: FileResults) -> None:
+        """Store the results of a file. Results with facts which are not
+        JSON serializable are not stored."""
+        data = results.to_json()
+        # the time spent is only reported for the run that linted the file
+        data["plugin_timings"] = {}
+        try:
+            encoded = json.dumps(data).encode()
+        except (TypeError, ValueError):
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write atomically, other workers may read the entry at the same time
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            f.write(encoded)
+        os.replace(f.name, path)
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the cache fits into
+        max_bytes
+
+        Returns
+            The number of removed entries
+        """
+        entries = []
+        for path in self.directory.glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        removed = 0
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+            removed += 1
+
+        return removed
@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""The internals of codespell used by the spell checker.
+
+codespell has no API besides its command line. The parts of it used to
+build the dictionaries and to find the words are imported from its private
+modules here and nowhere else. They may change with any release, which is
+why codespell is pinned to an exact version in pyproject.toml. Check them
+again before updating the pin.
+"""
+
+from codespell_lib._codespell import (  # noqa: F401
+    _builtin_default,
+    _select_builtin_dictionary,
+    build_exclude_hashes,
+    build_ignore_words,
+    codespell_ignore_next_line_tag,
+    codespell_ignore_tag,
+    ignore_next_line_regex,
+    inline_ignore_regex,
+    uri_regex_def,
+    word_regex_def,
+)
+from codespell_lib._spellchecker import Misspelling, build_dict  # noqa: F401
+from codespell_lib._text_util import fix_case  # noqa: F401
+
+
+def builtin_dictionaries() -> list[str]:
+    """The paths of the builtin dictionaries codespell uses by default"""
+    return _select_builtin_dictionary(_builtin_default)
@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Shared access to the content of the files checked during a run."""
+
+import mmap
+from collections import OrderedDict
+from pathlib import Path
+
+from troubadix.helper import CURRENT_ENCODING
+
+# Upper limit for the content kept by a store (per process)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Files of at least this size are memory-mapped instead of read
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+
+
+def file_signature(path: Path) -> tuple[int, int]:
+    """The modification time and size of a file, to notice changes"""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileContent:
+    """
+    The content of a file, read from disk at most once.
+
+    Provides the raw bytes and the text decoded with the NASL file encoding.
+    As with `Path.read_text`, the newlines of the text are normalized to
+    '\\n', the raw bytes keep them untouched.
+
+    Files of at least mmap_threshold bytes, like the huge policy files, are
+    memory-mapped. Their raw bytes are not copied into memory, the text is
+    decoded directly from the mapping. Touching a mapping of a file that
+    shrank in the meantime crashes the process with SIGBUS, so the mapping
+    is closed as soon as the file changed or may have changed and the file
+    is mapped again on the next access of the raw content.
+    """
+
+    def __init__(self, path: Path, mmap_threshold: int = DEFAULT_MMAP_THRESHOLD) -> None:
+        self.path = path
+        self.mmap_threshold = mmap_threshold
+        self._raw: bytes | mmap.mmap | None = None
+        self._text: str | None = None
+        self._signature: tuple[int, int] | None = None
+        self._size: int | None = None
+
+    @property
+    def raw(self) -> bytes | mmap.mmap:
+        """The raw content, a read-only bytes-like object. Don't keep a
+        reference to it, a mapping may be closed once the file changed."""
+        if self._raw is None:
+            self._signature = file_signature(self.path)
+            _, size = self._signature
+            if size and size >= self.mmap_threshold:
+                with self.path.open("rb") as f:
+                    self._raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._raw = self.path.read_bytes()
+            self._size = len(self._raw)
+        return self._raw
+
+    def close(self) -> None:
+        """Close the mapping of the file, if it is memory-mapped"""
+        if isinstance(self._raw, mmap.mmap):
+            self._raw.close()
+            self._raw = None
+
+    def is_current(self) -> bool:
+        """Whether the file did not change on disk since it was read. The
+        mapping of a changed file is closed."""
+        try:
+            current = self._signature is None or self._signature == file_signature(self.path)
+        except OSError:
+            current = False
+
+        if not current:
+            self.close()
+        return current
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = str(self.raw, CURRENT_ENCODING).replace("\r\n", "\n").replace("\r", "\n")
+        return self._text
+
+    @property
+    def size(self) -> int:
+        """The size of the raw content when it was read"""
+        if self._size is None:
+            return len(self.raw)
+        return self._size
+
+
+class ContentStore:
+    """
+    Keeps the content of recently used files, so that all plugins of a run
+    including the ones looking at other files, like dependencies, work on a
+    single read of every file. Files changed on disk in the meantime, e.g.
+    between the runs of a long living server, are read again.
+
+    The least recently used files are dropped once the content of all kept
+    files exceeds max_bytes.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.mmap_threshold = mmap_threshold
+        self._contents: OrderedDict[Path, FileContent] = OrderedDict()
+        self._size = 0
+
+    def get(self, path: Path) -> FileContent:
+        """Return the content of the file at the given path
+
+        Raises:
+            OSError: if the file can't be read
+        """
+        content = self._contents.get(path)
+        if content is not None:
+            if content.is_current():
+                self._contents.move_to_end(path)
+                return content
+
+            del self._contents[path]
+            self._size -= content.size
+
+        content = FileContent(path, self.mmap_threshold)
+        self._size += content.size
+        self._contents[path] = content
+
+        while self._size > self.max_bytes and len(self._contents) > 1:
+            _, dropped = self._contents.popitem(last=False)
+            self._size -= dropped.size
+            dropped.close()
+
+        return content
+
+    def release(self, path: Path) -> None:
+        """Drop the content of the file, e.g. after it was fixed, as it may
+        have been rewritten. The file is read again on the next access."""
+        content = self._contents.pop(path, None)
+        if content is not None:
+            self._size -= content.size
+            content.close()
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self._contents
+
+    def __len__(self) -> int:
+        return len(self._contents)
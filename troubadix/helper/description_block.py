@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+import re
+
+DESCRIPTION_BLOCK_START_PATTERN = re.compile(
+    r"^[ \t]*if\s*\(\s*description\s*\)\s*\{", re.MULTILINE
+)
+
+# the strings and comments, which may contain braces, and the braces
+# outside of them. Strings are matched like by the tokenizer.
+_BRACE_PATTERN = re.compile(
+    r'"[^"]*"?|\'[^\'\\]*(?:\\.[^\'\\]*)*(?:\'|\\?\Z)|#[^\r\n]*|(?P<brace>[{}])',
+    re.DOTALL,
+)
+
+
+def find_description_block(file_content: str) -> tuple[int, int] | None:
+    """Find the `if(description) { ... }` block of a VT, which contains the
+    script tags. Only the block itself is scanned to find its closing brace,
+    not the code after it.
+
+    Returns:
+        The start and end offset of the block, or None if the file has no
+        complete description block
+    """
+    start_match = DESCRIPTION_BLOCK_START_PATTERN.search(file_content)
+    if not start_match:
+        return None
+
+    depth = 1
+    for match in _BRACE_PATTERN.finditer(file_content, start_match.end()):
+        brace = match.group("brace")
+        if brace == "{":
+            depth += 1
+        elif brace == "}":
+            depth -= 1
+            if depth == 0:
+                return start_match.start(), match.end()
+
+    return None
@@ -0,0 +1,502 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Metadata of the VTs of a feed, looked up by the names used in
+script_dependencies() or read from the persistent index of the whole feed."""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from collections.abc import Iterator
+from dataclasses import dataclass
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Self
+
+from troubadix.helper.content_store import ContentStore, FileContent, file_signature
+from troubadix.helper.helper import FEED_VERSIONS
+from troubadix.helper.oid_index import OIDIndex
+from troubadix.helper.patterns import (
+    ScriptTag,
+    SpecialScriptTag,
+    _get_special_script_tag_pattern,
+    get_script_tag_pattern,
+)
+from troubadix.helper.script_tag_index import ScriptTagIndex
+
+DEPRECATED_PATTERN = re.compile(
+    r"^\s*exit\s*\(\s*66\s*\)\s*;|script_tag\s*\(\s*name\s*:\s*"
+    r"(?P<quote>[\"'])deprecated(?P=quote)\s*,\s*value\s*:\s*TRUE"
+    r"\s*\)\s*;",
+    re.MULTILINE,
+)
+DEPRECATED_TAG_PATTERN = get_script_tag_pattern(ScriptTag.DEPRECATED)
+DEPENDENCIES_PATTERN = _get_special_script_tag_pattern(
+    "dependencies", flags=re.DOTALL | re.MULTILINE
+)
+CVE_ID_PATTERN = _get_special_script_tag_pattern("cve_id", flags=re.MULTILINE | re.DOTALL)
+CVE_PATTERN = re.compile(r"CVE-\d{4}-\d{4,}")
+# Matches specific if blocks used to gate code to run only for enterprise feeds
+ENTERPRISE_FEED_CHECK_PATTERN = re.compile(
+    r'if\s*\(FEED_NAME\s*==\s*"GSF"\s*\|\|\s*FEED_NAME\s*==\s*"GEF"\s*\|\|\s*FEED_NAME\s*==\s*"SCM"\)\s*'
+    r"(?:\{[^}]*\}\s*|[^\{;]*;)"
+)
+
+# The file of the persistent index within the root of the feed
+FEED_INDEX_FILE = ".troubadix-feed-index.db"
+# Increase on changes of the table or of the collected metadata, to let
+# the index be built again
+FEED_INDEX_VERSION = 2
+# Changed VTs are parsed in parallel, if at least that many
+PARALLEL_REFRESH_FILES = 1000
+_MMAP_SIZE = 1024 * 1024 * 1024
+_COLUMNS = (
+    "path, mtime_ns, size, oid, family, category, deprecated, deprecated_tag, dependencies, "
+    "cves, script_version, solution_type"
+)
+
+
+def split_dependencies(value: str) -> list[str]:
+    """
+    Remove single and/or double quotes, spaces
+    and create a list by using the comma as a separator
+    additionally, check and filter for inline comments
+    """
+    dependencies = []
+    for line in value.splitlines():
+        subject = line[: line.index("#")] if "#" in line else line
+        _dependencies = re.sub(r'[\'"\s]', "", subject).split(",")
+        dependencies += [dep for dep in _dependencies if dep != ""]
+    return dependencies
+
+
+@dataclass(frozen=True, slots=True)
+class VTMetadata:
+    """The metadata of a VT, e.g. for the checks of the VTs depending on it
+
+    A VT is deprecated if it has the deprecated script tag or exits with
+    66, like the troubadix plugins check it. deprecated_tag only tells about
+    the script tag, like the dependency graph checks it.
+
+    The dependencies are (name, enterprise feed only) tuples, the latter
+    if the dependency is only added for the enterprise feeds."""
+
+    path: Path
+    oid: str | None
+    family: str | None
+    category: str | None
+    deprecated: bool
+    deprecated_tag: bool
+    dependencies: tuple[tuple[str, bool], ...]
+    cves: tuple[str, ...]
+    script_version: str | None
+    solution_type: str | None
+
+    @classmethod
+    def from_content(cls, path: Path, content: str) -> "VTMetadata":
+        script_tags = ScriptTagIndex(content)
+        oid = script_tags.search(SpecialScriptTag.OID)
+        family = script_tags.search(SpecialScriptTag.FAMILY)
+        category = script_tags.search(SpecialScriptTag.CATEGORY)
+        cve_ids = script_tags.search(SpecialScriptTag.CVE_ID, CVE_ID_PATTERN)
+        script_version = script_tags.search(SpecialScriptTag.VERSION)
+        solution_type = script_tags.search(ScriptTag.SOLUTION_TYPE)
+
+        return cls(
+            path=path,
+            oid=oid.group("oid") if oid else None,
+            family=family.group("value") if family else None,
+            category=category.group("value") if category else None,
+            deprecated=bool(DEPRECATED_PATTERN.search(content)),
+            deprecated_tag=bool(DEPRECATED_TAG_PATTERN.search(content)),
+            dependencies=_get_dependencies(content, script_tags),
+            cves=tuple(CVE_PATTERN.findall(cve_ids.group("value"))) if cve_ids else (),
+            script_version=script_version.group("value") if script_version else None,
+            solution_type=solution_type.group("value") if solution_type else None,
+        )
+
+
+def _get_dependencies(content: str, script_tags: ScriptTagIndex) -> tuple[tuple[str, bool], ...]:
+    if_blocks = (
+        [match.span() for match in ENTERPRISE_FEED_CHECK_PATTERN.finditer(content)]
+        if "FEED_NAME" in content
+        else []
+    )
+
+    dependencies = []
+    for match in script_tags.finditer(SpecialScriptTag.DEPENDENCIES, DEPENDENCIES_PATTERN):
+        start, end = match.span()
+        is_enterprise_feed = any(
+            start >= block_start and end <= block_end for block_start, block_end in if_blocks
+        )
+        dependencies.extend(
+            (dependency, is_enterprise_feed)
+            for dependency in split_dependencies(match.group("value"))
+        )
+    return tuple(dependencies)
+
+
+@dataclass
+class RefreshStatistic:
+    """The VTs looked at by a refresh of a FeedIndexFile"""
+
+    parsed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.parsed + self.unchanged
+
+
+def _read_vt(
+    args: tuple[Path, bytes | None],
+) -> tuple[Path, tuple[int, int], bytes, VTMetadata | None] | None:
+    """Hash and parse a VT for the refresh of the index. The VT is not
+    parsed again, if its content did not change. None if the VT was removed
+    in the meantime."""
+    path, stored_hash = args
+    try:
+        # taken before reading, so that a change in between is noticed
+        signature = file_signature(path)
+        content = FileContent(path)
+        content_hash = hashlib.sha256(content.raw).digest()
+    except OSError:
+        return None
+
+    if content_hash == stored_hash:
+        return path, signature, content_hash, None
+    return path, signature, content_hash, VTMetadata.from_content(path, content.text)
+
+
+class FeedIndexFile:
+    """
+    The metadata of all VTs of a feed, kept in an SQLite database within the
+    root of the feed, see FEED_INDEX_FILE.
+
+    `refresh` only parses the VTs, which were added or changed since the
+    last refresh. Changes are noticed by the modification time and size of
+    the files and confirmed by the hash of their content, e.g. a checkout
+    touching a file does not let it be parsed again.
+
+    The database is memory-mapped, so that the processes reading it, like
+    the workers of a troubadix run, share the pages of the file instead of
+    keeping a copy each.
+    """
+
+    def __init__(self, path: Path, root: Path | None = None, *, read_only: bool = False) -> None:
+        """
+        Arguments:
+            path        the database file, created if missing and not
+                        read only
+            root        the root of the feed. Default: the directory of the
+                        database file
+            read_only   only read an existing index, e.g. from several
+                        processes in parallel
+
+        Raises:
+            ValueError: if a read only index is missing or was written by
+                        another version
+        """
+        self.path = path
+        self.root = root if root is not None else path.parent
+
+        if read_only:
+            if not path.is_file():
+                raise ValueError(f"The feed index {path} does not exist")
+            self._connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            self._connection = sqlite3.connect(path)
+
+        self._connection.execute(f"PRAGMA mmap_size = {_MMAP_SIZE}")
+
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != FEED_INDEX_VERSION:
+            if read_only:
+                self.close()
+                raise ValueError(
+                    f"The feed index {path} was written by another version of troubadix, "
+                    "it needs to be refreshed"
+                )
+            self._create()
+
+    def _create(self) -> None:
+        with self._connection:
+            self._connection.execute("DROP TABLE IF EXISTS vts")
+            self._connection.execute(
+                "CREATE TABLE vts ("
+                "path TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "hash BLOB NOT NULL, "
+                "oid TEXT, "
+                "family TEXT, "
+                "category TEXT, "
+                "deprecated INTEGER NOT NULL, "
+                "deprecated_tag INTEGER NOT NULL, "
+                "dependencies TEXT NOT NULL, "
+                "cves TEXT NOT NULL, "
+                "script_version TEXT, "
+                "solution_type TEXT"
+                ") WITHOUT ROWID"
+            )
+            self._connection.execute("CREATE INDEX vts_oid ON vts (oid)")
+            self._connection.execute(f"PRAGMA user_version = {FEED_INDEX_VERSION}")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _vt_files(self) -> Iterator[Path]:
+        """All VTs within the root, hidden directories like .git are
+        skipped"""
+        for directory, directories, files in os.walk(self.root):
+            directories[:] = [name for name in directories if not name.startswith(".")]
+            for name in files:
+                if name.endswith(".nasl"):
+                    yield Path(directory, name)
+
+    def refresh(self, n_jobs: int = 1) -> RefreshStatistic:
+        """Bring the index up to date with the VTs within the root
+
+        Arguments:
+            n_jobs      the number of processes parsing the changed VTs
+        """
+        stored = {
+            path: (mtime_ns, size, content_hash)
+            for path, mtime_ns, size, content_hash in self._connection.execute(
+                "SELECT path, mtime_ns, size, hash FROM vts"
+            )
+        }
+        statistic = RefreshStatistic()
+
+        changed = []
+        for path in self._vt_files():
+            entry = stored.pop(path.relative_to(self.root).as_posix(), None)
+            try:
+                signature = file_signature(path)
+            except OSError:
+                continue
+
+            if entry and entry[:2] == signature:
+                statistic.unchanged += 1
+            else:
+                changed.append((path, entry[2] if entry else None))
+
+        with self._connection:
+            self._connection.executemany("DELETE FROM vts WHERE path = ?", ((p,) for p in stored))
+            statistic.removed = len(stored)
+
+            if n_jobs > 1 and len(changed) >= PARALLEL_REFRESH_FILES:
+                with Pool(n_jobs) as pool:
+                    self._store(pool.imap_unordered(_read_vt, changed, chunksize=64), statistic)
+            else:
+                self._store(map(_read_vt, changed), statistic)
+
+        return statistic
+
+    def _store(
+        self,
+        vts: Iterator[tuple[Path, tuple[int, int], bytes, VTMetadata | None] | None],
+        statistic: RefreshStatistic,
+    ) -> None:
+        for vt in vts:
+            if vt is None:
+                continue
+
+            path, (mtime_ns, size), content_hash, metadata = vt
+            relative_path = path.relative_to(self.root).as_posix()
+            if metadata is None:
+                self._connection.execute(
+                    "UPDATE vts SET mtime_ns = ?, size = ? WHERE path = ?",
+                    (mtime_ns, size, relative_path),
+                )
+                statistic.unchanged += 1
+                continue
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO vts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    relative_path,
+                    mtime_ns,
+                    size,
+                    content_hash,
+                    metadata.oid,
+                    metadata.family,
+                    metadata.category,
+                    metadata.deprecated,
+                    metadata.deprecated_tag,
+                    json.dumps(metadata.dependencies),
+                    " ".join(metadata.cves),
+                    metadata.script_version,
+                    metadata.solution_type,
+                ),
+            )
+            statistic.parsed += 1
+
+    def _entry(self, row: tuple) -> tuple[VTMetadata, tuple[int, int]]:
+        (
+            path,
+            mtime_ns,
+            size,
+            oid,
+            family,
+            category,
+            deprecated,
+            deprecated_tag,
+            dependencies,
+            cves,
+            script_version,
+            solution_type,
+        ) = row
+        metadata = VTMetadata(
+            path=self.root / path,
+            oid=oid,
+            family=family,
+            category=category,
+            deprecated=bool(deprecated),
+            deprecated_tag=bool(deprecated_tag),
+            dependencies=tuple(
+                (name, is_enterprise_feed) for name, is_enterprise_feed in json.loads(dependencies)
+            ),
+            cves=tuple(cves.split()),
+            script_version=script_version,
+            solution_type=solution_type,
+        )
+        return metadata, (mtime_ns, size)
+
+    def get(self, path: Path | str) -> VTMetadata | None:
+        """The metadata of the VT at the path relative to the root"""
+        row = self._connection.execute(
+            f"SELECT {_COLUMNS} FROM vts WHERE path = ?", (Path(path).as_posix(),)
+        ).fetchone()
+        return self._entry(row)[0] if row else None
+
+    def resolve(self, name: str) -> tuple[VTMetadata, tuple[int, int]] | None:
+        """The metadata of the VT with the name used in script_dependencies()
+        and the modification time and size of the file it was parsed from.
+        Like the scanner, the last feed version containing it wins."""
+        candidates = [f"{version}/{name}" if version else name for version in FEED_VERSIONS]
+        entries = {
+            row[0]: row
+            for row in self._connection.execute(
+                f"SELECT {_COLUMNS} FROM vts WHERE path IN "
+                f"({', '.join('?' * len(candidates))})",
+                candidates,
+            )
+        }
+        for candidate in reversed(candidates):
+            if candidate in entries:
+                return self._entry(entries[candidate])
+        return None
+
+    def __iter__(self) -> Iterator[VTMetadata]:
+        for row in self._connection.execute(f"SELECT {_COLUMNS} FROM vts ORDER BY path"):
+            yield self._entry(row)[0]
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM vts").fetchone()
+        return count
+
+    def oid_index(self) -> OIDIndex:
+        """The files of the OIDs, for duplicated OIDs the first file"""
+        files: dict[str, Path] = {}
+        for oid, path in self._connection.execute(
+            "SELECT oid, path FROM vts WHERE oid IS NOT NULL ORDER BY path"
+        ):
+            files.setdefault(oid, Path(path))
+        return OIDIndex(files)
+
+
+class FeedIndex:
+    """
+    The metadata of the VTs by their names used in script_dependencies(),
+    e.g. "gb_default_credentials_options.nasl". Like the scanner, a name is
+    resolved within the feed versions, the last one containing it wins.
+
+    A VT is resolved and parsed when it is looked up the first time, not
+    again for every VT depending on it. If a persistent index of the feed
+    is given, it is taken from there instead. The kept metadata is only
+    used as long as the file does not change on disk. Names that can't be
+    resolved are not kept, as the file may be added later, e.g. between the
+    runs of a server.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        content_store: ContentStore | None = None,
+        index_file: Path | None = None,
+    ) -> None:
+        self.root = root
+        self.content_store = content_store if content_store is not None else ContentStore()
+        self.index_file = index_file
+        self._feed_index_file: FeedIndexFile | None = None
+        self._entries: dict[str, tuple[VTMetadata, tuple[int, int]]] = {}
+
+    def __getstate__(self) -> dict:
+        # the database connection can't be shared with other processes, it
+        # is opened again on the first use
+        state = self.__dict__.copy()
+        state["_feed_index_file"] = None
+        return state
+
+    def resolve(self, name: str) -> Path | None:
+        """The path of the VT with the name within the feed versions"""
+        path = None
+        for version in FEED_VERSIONS:
+            candidate = self.root / version / name
+            if candidate.is_file():
+                path = candidate
+        return path
+
+    def _stored(self, name: str) -> tuple[VTMetadata, tuple[int, int]] | None:
+        if not self.index_file:
+            return None
+        if self._feed_index_file is None:
+            self._feed_index_file = FeedIndexFile(self.index_file, self.root, read_only=True)
+        return self._feed_index_file.resolve(name)
+
+    @staticmethod
+    def _is_current(entry: tuple[VTMetadata, tuple[int, int]] | None) -> bool:
+        if entry is None:
+            return False
+        metadata, signature = entry
+        try:
+            return file_signature(metadata.path) == signature
+        except OSError:
+            return False
+
+    def get(self, name: str) -> VTMetadata | None:
+        """The metadata of the VT with the name or None if it does not exist
+        within the feed"""
+        entry = self._entries.get(name)
+        if self._is_current(entry):
+            return entry[0]
+        self._entries.pop(name, None)
+
+        entry = self._stored(name)
+        if not self._is_current(entry):
+            path = self.resolve(name)
+            if path is None:
+                return None
+
+            # taken before reading, so that a change in between is noticed
+            signature = file_signature(path)
+            entry = VTMetadata.from_content(path, self.content_store.get(path).text), signature
+
+        self._entries[name] = entry
+        return entry[0]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -6,10 +6,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
-from troubadix.helper.text_utils import (
-    StringState,
-    index_to_linecol,
-)
+from troubadix.helper.text_utils import LineIndex
+from troubadix.helper.tokenizer import Tokens
 
 # Brace pairings
 CONDITION_BRACES = ("(", ")")
@@ -54,8 +52,15 @@ class IfParseResult:
 class IfParser:
     """Parser for if statements in NASL files."""
 
-    def __init__(self, file_content: str):
+    def __init__(self, file_content: str, tokens: Tokens | None = None):
+        """
+        Args:
+            file_content: The NASL code to parse
+            tokens: The tokens of the code, if already available
+        """
         self.file_content = file_content
+        self.tokens = tokens if tokens is not None else Tokens(file_content)
+        self.line_index = LineIndex(file_content)
 
     def find_if_statements(self) -> IfParseResult:
         """
@@ -75,40 +80,46 @@ class IfParser:
         if not starts:
             return IfParseResult(results, errors)
 
-        for if_start, opening_brace in starts:
-            line, _ = index_to_linecol(self.file_content, if_start)
+        for if_token, opening_token in starts:
+            if_start = self.tokens[if_token].start
+            line = self.line_index.line(if_start)
 
             # Step 2: Find the end of the condition (the closing parenthesis)
-            condition_end, condition_error = self._find_closing_brace(
-                opening_brace, CONDITION_BRACES
+            condition_token, condition_error = self._find_closing_brace(
+                opening_token, CONDITION_BRACES
             )
             if condition_error:
                 errors.append(IfParseError(line=line, error_type=condition_error))
                 continue
-            condition = self.file_content[opening_brace + 1 : condition_end].strip()
+            condition_start = self.tokens[opening_token].end
+            condition_end = self.tokens[condition_token].start
+            condition = self.file_content[condition_start:condition_end].strip()
 
-            # Step 3: Find the start of the outcome (first non-whitespace after condition)
-            outcome_start, outcome_error = self._find_outcome_start(condition_end)
+            # Step 3: Find the start of the outcome (first token after condition)
+            outcome_token, outcome_error = self._find_outcome_start(condition_token)
             if outcome_error:
                 errors.append(IfParseError(line=line, error_type=outcome_error))
                 continue
+            outcome_start = self.tokens[outcome_token].start
 
             # Step 4: Determine if this is a body or single-expression statement
-            if self.file_content[outcome_start] == "{":
+            if self.tokens[outcome_token].is_punctuation("{"):
                 # Body: find closing brace for body '}'
-                body_end, body_error = self._find_closing_brace(outcome_start, BODY_BRACES)
+                body_token, body_error = self._find_closing_brace(outcome_token, BODY_BRACES)
                 if body_error:
                     errors.append(IfParseError(line=line, error_type=body_error))
                     continue
+                body_end = self.tokens[body_token].start
                 if_end = body_end + 1
                 outcome_start = outcome_start + 1  # exclude opening brace
                 outcome_end = body_end
             else:
                 # Single statement: find end of statement ';'
-                statement_end, statement_error = self._find_statement_end(outcome_start)
+                statement_token, statement_error = self._find_statement_end(outcome_token)
                 if statement_error:
                     errors.append(IfParseError(line=line, error_type=statement_error))
                     continue
+                statement_end = self.tokens[statement_token].start
                 if_end = statement_end + 1
                 outcome_end = statement_end
 
@@ -118,7 +129,7 @@ class IfParser:
                 IfStatement(
                     if_start=if_start,
                     if_end=if_end,
-                    condition_start=opening_brace + 1,
+                    condition_start=condition_start,
                     condition_end=condition_end,
                     outcome_start=outcome_start,
                     outcome_end=outcome_end,
@@ -131,97 +142,60 @@ class IfParser:
 
     def _find_closing_brace(
         self,
-        start_pos: int,
+        opening_token: int,
         brace_pair: tuple[str, str],
     ) -> tuple[int | None, IfErrorType | None]:
-        """Find the matching closing brace, with proper error reporting."""
-        opening_brace, closing_brace = brace_pair
-        open_count = 1
-        string_state = StringState()
-
-        for i in range(start_pos + 1, len(self.file_content)):
-            char = self.file_content[i]
-            string_state.process_next_char(char)
-
-            # Skip characters inside strings
-            if string_state.in_string:
-                continue
-
-            if char == opening_brace:
-                open_count += 1
-            elif char == closing_brace:
-                open_count -= 1
-                if open_count == 0:
-                    return i, None
+        """Find the token of the matching closing brace, with proper error reporting."""
+        closing_token = self.tokens.closing(opening_token)
+        if closing_token is not None:
+            return closing_token, None
 
         # Error: unclosed brace
-        if opening_brace == "(":
+        if brace_pair == CONDITION_BRACES:
             return None, IfErrorType.UNCLOSED_CONDITION
         else:
             return None, IfErrorType.UNCLOSED_BODY
 
     def _find_condition_starts(self) -> list[tuple[int, int]]:
         """
-        Find starting positions of if conditions in the file content.
+        Find the tokens starting if conditions.
         Returns:
-            A list of tuples where each tuple contains the start position of the "if" keyword
-            and the position of the opening parenthesis.
+            A list of tuples where each tuple contains the index of the "if" keyword token
+            and the index of the opening parenthesis token.
         """
-        starts = []
-        string_state = StringState()
-
-        for i, char in enumerate(self.file_content):
-            string_state.process_next_char(char)
-
-            # Skip characters inside strings
-            if string_state.in_string:
-                continue
-
-            # check for if with word boundary, valid: ["if", " if"], not valid: "xif"
-            if (i == 0 or not self.file_content[i - 1].isalnum()) and self.file_content.startswith(
-                "if", i
-            ):
-                # skip whitespace
-                j = i + 2
-                while j < len(self.file_content) and self.file_content[j].isspace():
-                    j += 1
-                # check for condition start
-                if j < len(self.file_content) and self.file_content[j] == "(":
-                    starts.append((i, j))
-
-        return starts
-
-    def _find_outcome_start(self, condition_end: int) -> tuple[int | None, IfErrorType | None]:
+        return [
+            (i, i + 1)
+            for i, token in enumerate(self.tokens)
+            if token.is_keyword("if")
+            and i + 1 < len(self.tokens)
+            and self.tokens[i + 1].is_punctuation("(")
+        ]
+
+    def _find_outcome_start(self, condition_token: int) -> tuple[int | None, IfErrorType | None]:
         """
-        Find the start of the outcome/then part after the condition (next non-whitespace character).
+        Find the token starting the outcome/then part after the condition.
         """
-        pos = condition_end + 1
-        while pos < len(self.file_content) and self.file_content[pos].isspace():
-            pos += 1
+        outcome_token = condition_token + 1
 
-        if pos >= len(self.file_content):
+        if outcome_token >= len(self.tokens):
             return None, IfErrorType.MISSING_OUTCOME
 
-        if self.file_content[pos] == ";":
+        if self.tokens[outcome_token].is_punctuation(";"):
             return None, IfErrorType.TERMINATED_AFTER_CONDITION
 
-        return pos, None
-
-    def _find_statement_end(self, statement_start: int) -> tuple[int | None, IfErrorType | None]:
-        """Find the end of a single statement (semicolon outside of strings)."""
-        string_state = StringState()
+        return outcome_token, None
 
-        for i in range(statement_start, len(self.file_content)):
-            char = self.file_content[i]
-            string_state.process_next_char(char)
-            if not string_state.in_string and char == ";":
-                return i, None
+    def _find_statement_end(self, statement_token: int) -> tuple[int | None, IfErrorType | None]:
+        """Find the token ending a single statement (semicolon)."""
+        statement_end = self.tokens.find(";", statement_token)
+        if statement_end is None:
+            return None, IfErrorType.MISSING_STATEMENT
 
-        return None, IfErrorType.MISSING_STATEMENT
+        return statement_end, None
 
 
 # Wrapper function to maintain backward compatibility
-def find_if_statements(file_content: str) -> IfParseResult:
+def find_if_statements(file_content: str, tokens: Tokens | None = None) -> IfParseResult:
     """Parse a file to find all if statements."""
-    parser = IfParser(file_content)
+    parser = IfParser(file_content, tokens)
     return parser.find_if_statements()
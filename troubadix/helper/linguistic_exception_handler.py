@@ -17,6 +17,7 @@
 
 
 import re
+import string
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 
@@ -199,3 +200,197 @@ def handle_linguistic_checks(file: str, correction: str, checks: Iterable[Lingui
         bool: whether any check was passed by the provided file and correction
     """
     return any(check.execute(file, correction) for check in checks)
+
+
+# Upper limit for the results of the file conditions kept
+MAX_CACHED_RESULTS = 100_000
+
+_FILE_CHECK_TYPES = (FileCheck, FilesCheck, FilePatternCheck)
+_TEXT_CHECK_TYPES = (TextCheck, PatternCheck, PatternsCheck)
+
+# The characters matching themselves at the start of a pattern
+_LITERAL_CHARACTERS = frozenset(string.ascii_letters + string.digits + " ,:;'\"/_-=>")
+_QUANTIFIERS = ("?", "*", "+", "{")
+
+
+def _split_check(
+    check: LinguisticCheck,
+) -> tuple[list[LinguisticCheck], list[LinguisticCheck]] | None:
+    """The conditions of the check on the file and on the correction, which
+    all have to pass. None for checks that can't be split, like checks
+    looking at both."""
+    if type(check) in _FILE_CHECK_TYPES:
+        return [check], []
+    if type(check) in _TEXT_CHECK_TYPES:
+        return [], [check]
+    if isinstance(check, CompositeCheck) and type(check).execute is CompositeCheck.execute:
+        file_checks, text_checks = [], []
+        for sub_check in check.checks:
+            split = _split_check(sub_check)
+            if split is None:
+                return None
+            file_checks += split[0]
+            text_checks += split[1]
+        return file_checks, text_checks
+    return None
+
+
+def _has_top_level_alternative(pattern: str) -> bool:
+    depth = 0
+    escaped = in_class = False
+    for character in pattern:
+        if escaped:
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif in_class:
+            in_class = character != "]"
+        elif character == "[":
+            in_class = True
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+        elif character == "|" and depth == 0:
+            return True
+    return False
+
+
+def _literal_prefix(pattern: re.Pattern) -> str:
+    """The text every match of the pattern starts with, lowercase for
+    patterns ignoring the case. Empty if there is none."""
+    if pattern.flags & re.VERBOSE or _has_top_level_alternative(pattern.pattern):
+        return ""
+
+    length = 0
+    for character in pattern.pattern:
+        if character not in _LITERAL_CHARACTERS:
+            break
+        length += 1
+    # a quantified character is not required
+    if pattern.pattern[length : length + 1] in _QUANTIFIERS:
+        length -= 1
+
+    prefix = pattern.pattern[: max(length, 0)]
+    return prefix.lower() if pattern.flags & re.IGNORECASE else prefix
+
+
+def _required_texts(condition: LinguisticCheck) -> tuple[list[str], list[str]] | None:
+    """The texts of which a correction passing the condition contains at
+    least one, split into the ones to compare case sensitive and the
+    lowercase ones to compare ignoring the case. None if there are none."""
+    if isinstance(condition, TextCheck):
+        return [condition.text], []
+
+    if isinstance(condition, PatternCheck):
+        patterns = [condition.pattern]
+    elif isinstance(condition, PatternsCheck):
+        patterns = condition.patterns
+    else:
+        return None
+
+    texts, folded_texts = [], []
+    for pattern in patterns:
+        prefix = _literal_prefix(pattern)
+        if not prefix:
+            return None
+        if pattern.flags & re.IGNORECASE:
+            folded_texts.append(prefix)
+        else:
+            texts.append(prefix)
+    return texts, folded_texts
+
+
+class LinguisticExceptionMatcher:
+    """Determines if any of the checks pass for a file and a correction, like
+    `handle_linguistic_checks`, but without trying every check on every hit.
+
+    The checks are split into their conditions on the file and on the
+    correction. The conditions on the file are evaluated once per file and
+    their results are kept as a bit mask of the passing checks. The checks
+    are grouped by a text the correction has to contain to pass them, like
+    the text of a TextCheck or the literal start of a pattern, e.g. the
+    corrected word of the spelling exceptions. A hit only evaluates the
+    conditions on the correction of the checks passing for its file and
+    whose text it contains. Checks that can't be split are executed for
+    every hit.
+    """
+
+    def __init__(self, checks: Iterable[LinguisticCheck]) -> None:
+        self._file_checks: list[tuple[int, list[LinguisticCheck]]] = []
+        self._text_checks: dict[int, list[LinguisticCheck]] = {}
+        self._other_checks: list[LinguisticCheck] = []
+        # the checks by the texts a passing correction contains, and the
+        # checks without such a text
+        self._texts: dict[str, int] = {}
+        self._folded_texts: dict[str, int] = {}
+        self._unfiltered = 0
+
+        for i, check in enumerate(checks):
+            split = _split_check(check)
+            if split is None:
+                self._other_checks.append(check)
+                continue
+
+            bit = 1 << i
+            file_checks, text_checks = split
+            self._file_checks.append((bit, file_checks))
+            self._text_checks[bit] = text_checks
+            self._group(bit, text_checks)
+
+        self._file_masks: dict[str, int] = {}
+
+    def _group(self, bit: int, conditions: list[LinguisticCheck]) -> None:
+        for condition in conditions:
+            required = _required_texts(condition)
+            if required is not None:
+                texts, folded_texts = required
+                for text in texts:
+                    self._texts[text] = self._texts.get(text, 0) | bit
+                for text in folded_texts:
+                    self._folded_texts[text] = self._folded_texts.get(text, 0) | bit
+                return
+
+        self._unfiltered |= bit
+
+    def _file_mask(self, file_path: str) -> int:
+        mask = self._file_masks.get(file_path)
+        if mask is None:
+            if len(self._file_masks) >= MAX_CACHED_RESULTS:
+                self._file_masks.clear()
+
+            mask = self._file_masks[file_path] = sum(
+                bit
+                for bit, conditions in self._file_checks
+                if all(condition.execute(file_path, "") for condition in conditions)
+            )
+        return mask
+
+    def _candidates(self, correction: str) -> int:
+        """The checks whose text is contained in the correction"""
+        mask = self._unfiltered
+        for text, bit in self._texts.items():
+            if text in correction:
+                mask |= bit
+
+        if self._folded_texts:
+            # characters like the long s match ASCII letters ignoring the
+            # case, but are not lowered to them
+            folded = correction.lower() if correction.isascii() else None
+            for text, bit in self._folded_texts.items():
+                if folded is None or text in folded:
+                    mask |= bit
+        return mask
+
+    def matches(self, file_path: str, correction: str) -> bool:
+        """Whether any of the checks passes for the file and correction"""
+        candidates = self._file_mask(file_path)
+        if candidates:
+            candidates &= self._candidates(correction)
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            if all(condition.execute("", correction) for condition in self._text_checks[bit]):
+                return True
+
+        return any(check.execute(file_path, correction) for check in self._other_checks)
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""The OIDs of the VTs and their files, collected by the check_duplicate_oid
+plugin while troubadix checks the files. Written with `--oid-index`, other
+tools can look up the VT of an OID without reading the whole feed."""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from troubadix.helper.helper import get_path_from_root
+
+
+class OIDIndex:
+    """Maps the OIDs to the files of the VTs, relative to the root"""
+
+    def __init__(self, files: dict[str, Path] | None = None) -> None:
+        self._files = dict(files or {})
+
+    @classmethod
+    def from_facts(cls, facts: Iterable[tuple[Path, str | None]], root: Path) -> "OIDIndex":
+        """Create the index from the facts of the check_duplicate_oid plugin.
+        Files without an OID are skipped and for duplicated OIDs the first
+        file is kept."""
+        files: dict[str, Path] = {}
+        for nasl_file, oid in facts:
+            if oid:
+                files.setdefault(oid, get_path_from_root(nasl_file, root))
+        return cls(files)
+
+    def get(self, oid: str) -> Path | None:
+        """The file of the VT with the OID, relative to the root"""
+        return self._files.get(oid)
+
+    def __contains__(self, oid: str) -> bool:
+        return oid in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def write(self, index_file: Path) -> None:
+        index_file.write_text(
+            json.dumps(
+                {"oids": {oid: file.as_posix() for oid, file in sorted(self._files.items())}},
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+    @staticmethod
+    def read(index_file: Path) -> "OIDIndex":
+        """Read an index written by `write`
+
+        Raises:
+            ValueError: if the file is not an OID index
+        """
+        try:
+            oids = json.loads(index_file.read_text(encoding="utf-8"))["oids"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"{index_file} is not an OID index") from e
+
+        return OIDIndex({oid: Path(file) for oid, file in oids.items()})
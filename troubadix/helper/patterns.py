@@ -20,6 +20,44 @@ from enum import Enum
 
 from troubadix.helper.helper import SCRIPT_CATEGORIES
 
+
+class PatternRegistry:
+    """Compiles every regex pattern only once per process
+
+    The patterns are memoized by their pattern string, which is the
+    formatted template, and their flags. Other than the cache of the re
+    module, the registry never evicts a pattern and counts the compiles
+    and hits, e.g. to see in a profile if a plugin compiles patterns per
+    file.
+    """
+
+    def __init__(self) -> None:
+        self._patterns: dict[tuple[str, int], re.Pattern] = {}
+        self.compiles = 0
+        self.hits = 0
+
+    def compile(self, pattern: str, flags: re.RegexFlag = 0) -> re.Pattern:
+        key = (pattern, flags)
+        compiled = self._patterns.get(key)
+        if compiled is None:
+            compiled = self._patterns[key] = re.compile(pattern, flags=flags)
+            self.compiles += 1
+        else:
+            self.hits += 1
+        return compiled
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+
+pattern_registry = PatternRegistry()
+
+
+def compile_pattern(pattern: str, flags: re.RegexFlag = 0) -> re.Pattern:
+    """Returns the compiled pattern from the process-wide pattern registry"""
+    return pattern_registry.compile(pattern, flags)
+
+
 # regexp pattern for getting any value of
 # script_tag(name:"last_modification", value:"<value>");
 LAST_MODIFICATION_ANY_VALUE_PATTERN = (
@@ -57,7 +95,7 @@ def _get_tag_pattern(name: str, *, value: str = r".+?", flags: re.RegexFlag = 0)
     Returns
         `re.Pattern` object
     """
-    return re.compile(_TAG_PATTERN.format(name=name, value=value), flags=flags)
+    return compile_pattern(_TAG_PATTERN.format(name=name, value=value), flags=flags)
 
 
 class ScriptTag(Enum):
@@ -169,7 +207,7 @@ def get_xref_pattern(name: str, *, value: str = r".+?", flags: re.RegexFlag = 0)
     Returns
         `re.Pattern` object
     """
-    return re.compile(
+    return compile_pattern(
         _XREF_TAG_PATTERN.format(name=name, value=value),
         flags=flags,
     )
@@ -217,7 +255,7 @@ def _get_special_script_tag_pattern(
     Returns
         `re.Pattern` object
     """
-    return re.compile(_SPECIAL_TAG_PATTERN.format(name=name, value=value), flags=flags)
+    return compile_pattern(_SPECIAL_TAG_PATTERN.format(name=name, value=value), flags=flags)
 
 
 __PORT_VALUE = r"\"(?P<service>[\w\s])+\", (?P<port>\d{1,5})"
@@ -1,7 +1,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # SPDX-FileCopyrightText: 2025 Greenbone AG
 
-from troubadix.helper.text_utils import StringState
+import re
+
+# the characters that start a comment or a string outside of strings
+_SPECIAL_PATTERN = re.compile(r"[#\"']")
+# the rest of a single quoted string up to the closing quote, the end of the
+# line or a backslash escaping the first character of the next line
+_SINGLE_QUOTED_PATTERN = re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL)
 
 
 def remove_comments(file_content: str) -> str:
@@ -18,19 +24,53 @@ def remove_comments(file_content: str) -> str:
     Returns:
         String with comments removed
     """
-    string_state = StringState()
-    return "\n".join(
-        [_remove_comments_in_line(line, string_state) for line in file_content.splitlines()]
-    )
+    # the quote of the string the current position is in, if any
+    quote = None
+    escape_next = False
+    lines = []
+
+    for line in file_content.splitlines():
+        if not quote and line.lstrip().startswith("#"):
+            lines.append("")
+            continue
+
+        pos = 0
+        while True:
+            if not quote:
+                match = _SPECIAL_PATTERN.search(line, pos)
+                if not match:
+                    break
+                if match.group() == "#":
+                    line = line[: match.start()]
+                    break
+                quote = match.group()
+                pos = match.end()
+
+            elif quote == '"':
+                # backslashes don't escape in double quoted strings
+                end = line.find('"', pos)
+                if end == -1:
+                    break
+                quote = None
+                pos = end + 1
 
+            else:
+                if escape_next:
+                    if pos == len(line):
+                        break
+                    escape_next = False
+                    pos += 1
 
-def _remove_comments_in_line(line: str, state: StringState) -> str:
-    if not state.in_string and line.lstrip().startswith("#"):
-        return ""
+                pos = _SINGLE_QUOTED_PATTERN.match(line, pos).end()
+                if pos == len(line):
+                    break
+                if line[pos] == "\\":
+                    # a backslash at the end of the line
+                    escape_next = True
+                    break
+                quote = None
+                pos += 1
 
-    for i, char in enumerate(line):
-        state.process_next_char(char)
-        if char == "#" and not state.in_string:
-            return line[:i]
+        lines.append(line)
 
-    return line
+    return "\n".join(lines)
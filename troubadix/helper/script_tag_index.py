@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Index of the script tag calls of a file.
+
+Many plugins search the whole file content for the `script_tag(name:...)`
+and `script_<name>(...)` calls they are interested in. The index finds the
+start of all these calls in a single scan. The patterns of the plugins are
+then only matched at the positions of the calls with the right name, which
+gives exactly the matches a search over the whole content would give.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterator
+
+from troubadix.helper.patterns import (
+    ScriptTag,
+    SpecialScriptTag,
+    get_script_tag_pattern,
+    get_special_script_tag_pattern,
+)
+
+# Finds every "script_" and looks ahead for the name of a script_tag call
+# and the name of a script_<name> call. Only "script_" is consumed, so no
+# call is missed, even if it starts within another one.
+_CALL_PATTERN = re.compile(
+    r"script_"
+    r"(?:(?=(?P<special>\w+)\s*\())?"
+    r"(?:(?=tag\(\s*name\s*:\s*(?P<quote>['\"])(?P<tag>[^'\"]*)(?P=quote)))?"
+)
+
+
+class ScriptTagIndex:
+    """The positions of all script tag calls of a file content by name
+
+    The `search` and `finditer` methods are drop-in replacements for the
+    methods of the script tag patterns applied to the whole content. Their
+    results are cached, so every pattern is matched only once per file,
+    regardless of the number of plugins using it.
+    """
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self._tag_positions: dict[str, list[int]] = defaultdict(list)
+        self._special_positions: dict[str, list[int]] = defaultdict(list)
+        self._matches: dict[tuple[ScriptTag | SpecialScriptTag, re.Pattern], list[re.Match]] = {}
+
+        for match in _CALL_PATTERN.finditer(content):
+            if match.group("tag") is not None:
+                self._tag_positions[match.group("tag")].append(match.start())
+            if match.group("special") is not None:
+                self._special_positions[match.group("special")].append(match.start())
+
+    def _positions(self, tag: ScriptTag | SpecialScriptTag) -> list[int]:
+        if isinstance(tag, ScriptTag):
+            return self._tag_positions.get(tag.value, [])
+        return self._special_positions.get(tag.value, [])
+
+    @staticmethod
+    def _default_pattern(tag: ScriptTag | SpecialScriptTag) -> re.Pattern:
+        if isinstance(tag, ScriptTag):
+            return get_script_tag_pattern(tag)
+        return get_special_script_tag_pattern(tag)
+
+    def finditer(
+        self,
+        tag: ScriptTag | SpecialScriptTag,
+        pattern: re.Pattern | None = None,
+    ) -> Iterator[re.Match]:
+        """Find all calls of the script tag, like `pattern.finditer(content)`
+
+        Arguments:
+            tag         the script tag to look for
+            pattern     a pattern for this script tag, e.g. with a specific
+                        value. Default: the precompiled pattern of the tag.
+        """
+        pattern = pattern or self._default_pattern(tag)
+        key = (tag, pattern)
+        matches = self._matches.get(key)
+        if matches is None:
+            matches = []
+            end = 0
+            # like finditer, skip the calls within a previous match
+            for position in self._positions(tag):
+                if position < end:
+                    continue
+                match = pattern.match(self.content, position)
+                if match:
+                    matches.append(match)
+                    end = match.end()
+            self._matches[key] = matches
+
+        return iter(matches)
+
+    def search(
+        self,
+        tag: ScriptTag | SpecialScriptTag,
+        pattern: re.Pattern | None = None,
+    ) -> re.Match | None:
+        """Find the first call of the script tag, like
+        `pattern.search(content)`
+
+        Arguments:
+            tag         the script tag to look for
+            pattern     a pattern for this script tag, e.g. with a specific
+                        value. Default: the precompiled pattern of the tag.
+        """
+        return next(self.finditer(tag, pattern), None)
+
+    def __contains__(self, tag: ScriptTag | SpecialScriptTag) -> bool:
+        """Whether the script tag is called at all, regardless of its
+        value"""
+        return bool(self._positions(tag))
@@ -0,0 +1,198 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Spell checking of file content with the dictionaries of codespell.
+
+A codespell run parses its dictionaries, exclude and ignore files again
+before checking any file. The spell checker builds them once per process
+and checks the content in memory, with the results codespell reports for
+the options used by the check_spelling plugin:
+
+    --quiet-level=1 --dictionary=- --dictionary=<additions>
+    --exclude-file=<exclude> --ignore-words=<ignore> --uri-ignore-words-list=*
+"""
+
+import io
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from troubadix.helper.codespell_adapter import (
+    Misspelling,
+    build_dict,
+    build_exclude_hashes,
+    build_ignore_words,
+    builtin_dictionaries,
+    codespell_ignore_next_line_tag,
+    codespell_ignore_tag,
+    fix_case,
+    ignore_next_line_regex,
+    inline_ignore_regex,
+    uri_regex_def,
+    word_regex_def,
+)
+from troubadix.helper.content_store import ContentStore, file_signature
+
+# Escape sequences which may precede a valid word, like "\nvalid"
+_ESCAPE_CHARACTERS = ("a", "b", "f", "n", "r", "t", "v")
+# codespell only looks at the first bytes to skip binary files
+_BINARY_CHECK_BYTES = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class SpellingError:
+    """A misspelled word, reported like codespell does"""
+
+    file: str
+    line: int
+    word: str
+    correction: str
+
+    @property
+    def text(self) -> str:
+        """The misspelled word and its correction"""
+        return f"{self.word} ==> {self.correction}"
+
+    def __str__(self) -> str:
+        return f"{self.file}:{self.line}: {self.text}"
+
+
+class SpellChecker:
+    """Finds misspelled words with the builtin dictionaries of codespell and
+    additional dictionaries. Lines in the exclude files and the words in the
+    ignore files are not reported."""
+
+    def __init__(
+        self,
+        dictionaries: Iterable[Path] = (),
+        exclude_files: Iterable[Path] = (),
+        ignore_words_files: Iterable[Path] = (),
+    ) -> None:
+        ignore_words: set[str] = set()
+        self._ignore_words_cased: set[str] = set()
+        for ignore_words_file in ignore_words_files:
+            build_ignore_words(str(ignore_words_file), ignore_words, self._ignore_words_cased)
+
+        self._misspellings: dict[str, Misspelling] = {}
+        for dictionary in builtin_dictionaries() + [str(dictionary) for dictionary in dictionaries]:
+            build_dict(dictionary, self._misspellings, ignore_words)
+
+        self._exclude_lines: set[str] = set()
+        for exclude_file in exclude_files:
+            build_exclude_hashes(str(exclude_file), self._exclude_lines)
+
+        self._word_regex = re.compile(word_regex_def)
+        self._uri_regex = re.compile(uri_regex_def)
+
+    def check(self, file: str, content: str) -> Iterator[SpellingError]:
+        """Find the misspelled words in the content of the file"""
+        next_line_ignore_words: set[str] | None = None
+
+        # like a file opened by codespell, which keeps "\r\n" and "\r"
+        for i, line in enumerate(io.StringIO(content, newline="").readlines()):
+            line = line.rstrip()
+            pending_ignore_words = next_line_ignore_words
+            next_line_ignore_words = None
+
+            directive_words: set[str] = set()
+            if codespell_ignore_next_line_tag in line:
+                match = ignore_next_line_regex.search(line)
+                if match:
+                    directive_words = _ignore_words(match)
+                    next_line_ignore_words = directive_words
+
+            if not line or line in self._exclude_lines:
+                continue
+
+            ignored_words: set[str] = set()
+            match = inline_ignore_regex.search(line) if codespell_ignore_tag in line else None
+            if match:
+                ignored_words = _ignore_words(match)
+                if not ignored_words:
+                    continue
+
+            ignored_words |= directive_words
+            if pending_ignore_words is not None:
+                if not pending_ignore_words:
+                    continue
+                ignored_words |= pending_ignore_words
+
+            # all words of URIs are ignored
+            line = self._uri_regex.sub(" ", line)
+            for match in self._word_regex.finditer(line):
+                word = match.group()
+                if word in self._ignore_words_cased:
+                    continue
+
+                lower_word = word.lower()
+                misspelling = self._misspellings.get(lower_word)
+                if misspelling is None or lower_word in ignored_words:
+                    continue
+
+                if (
+                    match.start() > 0
+                    and line[match.start() - 1] == "\\"
+                    and word.startswith(_ESCAPE_CHARACTERS)
+                    and lower_word[1:] not in self._misspellings
+                ):
+                    continue
+
+                correction = fix_case(word, misspelling.data)
+                if misspelling.reason:
+                    correction = f"{correction}  | {misspelling.reason}"
+
+                yield SpellingError(file, i + 1, word, correction)
+
+    def check_file(
+        self, file_path: Path, content_store: ContentStore | None = None
+    ) -> Iterator[SpellingError]:
+        """Find the misspelled words in a file, read from the content store
+        if given. Like codespell, hidden and binary files are skipped and
+        files that are no valid UTF-8 are read as ISO-8859-1."""
+        if file_path.name.startswith("."):
+            return
+
+        if content_store is None:
+            content_store = ContentStore()
+        try:
+            raw = content_store.get(file_path).raw
+        except OSError:
+            return
+
+        if b"\x00" in raw[:_BINARY_CHECK_BYTES]:
+            return
+
+        # decoded at once, as a memory-mapped file may be closed later on
+        try:
+            content = str(raw, "utf-8")
+        except UnicodeDecodeError:
+            content = str(raw, "iso-8859-1")
+
+        yield from self.check(str(file_path), content)
+
+
+def _ignore_words(match: re.Match) -> set[str]:
+    """The words listed in an inline codespell:ignore comment"""
+    return set(filter(None, (match.group("words") or "").split(",")))
+
+
+# The spell checkers of the process by their files, with the signatures of
+# the files they were built from
+_spell_checkers: dict[tuple[tuple[Path, ...], ...], tuple[list, SpellChecker]] = {}
+
+
+def get_spell_checker(
+    dictionaries: Iterable[Path] = (),
+    exclude_files: Iterable[Path] = (),
+    ignore_words_files: Iterable[Path] = (),
+) -> SpellChecker:
+    """Returns the spell checker for the files, which is built only once
+    per process and again if one of the files changes"""
+    files = (tuple(dictionaries), tuple(exclude_files), tuple(ignore_words_files))
+    signatures = [file_signature(file) for file_group in files for file in file_group]
+
+    built = _spell_checkers.get(files)
+    if built is None or built[0] != signatures:
+        built = _spell_checkers[files] = (signatures, SpellChecker(*files))
+    return built[1]
@@ -3,6 +3,10 @@
 
 """Utilities for text processing and string manipulation in NASL files."""
 
+import re
+from bisect import bisect_right
+from collections.abc import Iterator
+
 
 class StringState:
     """
@@ -44,26 +48,54 @@ class StringState:
             self.in_single_quote = not self.in_single_quote
 
 
+class LineIndex:
+    """
+    Maps character indexes of a text to line numbers.
+
+    The start offsets of all lines are computed once, so every lookup is a
+    binary search instead of a scan of the text. Lines are split like
+    `str.splitlines`.
+    """
+
+    def __init__(self, text: str):
+        self.length = len(text)
+        self._line_starts = [0]
+        for line in text.splitlines(keepends=True):
+            self._line_starts.append(self._line_starts[-1] + len(line))
+
+    def linecol(self, index: int) -> tuple[int, int]:
+        """
+        Converts character index to (line_number, column_number) (1-based index)
+
+        Args:
+            index: Character position to locate
+        Returns:
+            (line, column) tuple (both start at 1)
+        """
+        if index < 0 or index >= self.length:
+            raise ValueError(f"Index {index} out of bounds for text of length {self.length}")
+
+        line = bisect_right(self._line_starts, index)
+        return (line, index - self._line_starts[line - 1] + 1)
+
+    def line(self, index: int) -> int:
+        """Converts character index to the line number (1-based index)"""
+        return self.linecol(index)[0]
+
+
 def index_to_linecol(text: str, index: int) -> tuple[int, int]:
     """
     Converts character index to (line_number, column_number) (1-based index)
 
+    Use a `LineIndex` to look up more than one index of the same text.
+
     Args:
         text: Input string
         index: Character position to locate
     Returns:
         (line, column) tuple (both start at 1)
     """
-    if index < 0 or index >= len(text):
-        raise ValueError(f"Index {index} out of bounds for text of length {len(text)}")
-
-    lines = text.splitlines(keepends=True)
-    line_num = 0
-    for line_num, line in enumerate(lines, 1):
-        if index < len(line):
-            break
-        index -= len(line)
-    return (line_num, index + 1)
+    return LineIndex(text).linecol(index)
 
 
 def is_position_in_string(text: str, position: int) -> bool:
@@ -102,3 +134,47 @@ def find_matching_brace(
             if depth == 0:
                 return pos
     return None
+
+
+def find_lines_with(pattern: re.Pattern, text: str) -> Iterator[tuple[str, re.Match]]:
+    """
+    Find the lines containing the pattern, like the matches of
+    `re.finditer(".*(<pattern>).*", text)` without re.DOTALL.
+
+    The leading ".*" lets the regex engine try every position of a line
+    for every start of the search, which takes quadratic time on long
+    lines. Instead, the starts of the pattern are searched and the line is
+    taken from the last match of the pattern within the line.
+
+    Args:
+        pattern: The pattern to find, without a leading ".*"
+        text: Input string
+    Yields:
+        The line(s) as matched by ".*(<pattern>).*" and the match of the
+        pattern
+    """
+    pos = 0
+    match = pattern.search(text)
+    while match:
+        line_start = max(pos, text.rfind("\n", pos, match.start()) + 1)
+        line_end = text.find("\n", match.start())
+        if line_end == -1:
+            line_end = len(text)
+
+        # like the greedy ".*", use the last match starting in the line
+        next_match = pattern.search(text, match.start() + 1)
+        while next_match and next_match.start() <= line_end:
+            match = next_match
+            next_match = pattern.search(text, match.start() + 1)
+
+        # a match may span lines, the line reaches to the end of its last line
+        pos = text.find("\n", match.end())
+        if pos == -1:
+            pos = len(text)
+
+        yield text[line_start:pos], match
+
+        # the next match may start within the found line
+        if next_match and next_match.start() < pos:
+            next_match = pattern.search(text, pos)
+        match = next_match
@@ -0,0 +1,189 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Tokenizer for the structure of NASL code.
+
+The tokens are meant for plugins checking the structure of the code, like
+if statements, loops or function calls. They don't need to care about
+brackets, keywords or comment characters within strings or comments, as
+these are single tokens.
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from enum import Enum
+
+
+class TokenType(Enum):
+    STRING = "string"
+    COMMENT = "comment"
+    IDENTIFIER = "identifier"
+    KEYWORD = "keyword"
+    NUMBER = "number"
+    PUNCTUATION = "punctuation"
+
+
+KEYWORDS = frozenset(
+    {
+        "break",
+        "continue",
+        "else",
+        "export",
+        "for",
+        "foreach",
+        "function",
+        "global_var",
+        "if",
+        "import",
+        "include",
+        "local_var",
+        "repeat",
+        "return",
+        "until",
+        "while",
+        "FALSE",
+        "NULL",
+        "TRUE",
+    }
+)
+
+BRACKETS = {"(": ")", "[": "]", "{": "}"}
+
+# Backslashes only escape within single quoted strings. Unclosed strings
+# reach until the end of the content.
+_TOKEN_PATTERN = re.compile(
+    r"(?P<whitespace>\s+)"
+    r"|(?P<comment>#[^\r\n]*)"
+    r'|(?P<string>"[^"]*"?|\'[^\'\\]*(?:\\.[^\'\\]*)*(?:\'|\\?\Z))'
+    r"|(?P<number>0[xX][0-9a-fA-F]+|\d+)"
+    r"|(?P<identifier>[A-Za-z_]\w*)"
+    r"|(?P<punctuation>>>>=|>>>|>!<|<<=|>>=|==|!=|=~|!~|<=|>=|><|&&|\|\||\+\+|--"
+    r"|\+=|-=|\*=|/=|%=|<<|>>|\*\*|.)",
+    re.DOTALL,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Token:
+    type: TokenType
+    value: str
+    start: int
+    end: int
+
+    def is_punctuation(self, value: str) -> bool:
+        return self.type is TokenType.PUNCTUATION and self.value == value
+
+    def is_keyword(self, value: str) -> bool:
+        return self.type is TokenType.KEYWORD and self.value == value
+
+
+def tokenize(content: str, *, comments: bool = False) -> Iterator[Token]:
+    """Split NASL code into tokens, whitespace is skipped
+
+    Arguments:
+        content     the NASL code
+        comments    whether to yield the comments as tokens
+    """
+    for match in _TOKEN_PATTERN.finditer(content):
+        kind = match.lastgroup
+        if kind == "whitespace" or (kind == "comment" and not comments):
+            continue
+
+        value = match.group()
+        if kind == "identifier" and value in KEYWORDS:
+            kind = "keyword"
+
+        yield Token(TokenType(kind), value, match.start(), match.end())
+
+
+class Tokens:
+    """The tokens of NASL code without its comments
+
+    Besides the tokens, it provides the lookups needed to walk the structure
+    of the code, computed once for all users.
+    """
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.tokens = list(tokenize(content))
+        self._closing: dict[int, int] | None = None
+        self._punctuation: dict[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __getitem__(self, index: int) -> Token:
+        return self.tokens[index]
+
+    def __iter__(self) -> Iterator[Token]:
+        return iter(self.tokens)
+
+    def closing(self, index: int) -> int | None:
+        """The index of the bracket closing the opening bracket at index
+
+        Every kind of bracket is matched on its own, e.g. a missing ")"
+        within a block does not affect the "}" closing the block.
+        """
+        if self._closing is None:
+            self._closing = {}
+            open_brackets: dict[str, list[int]] = defaultdict(list)
+            closing_brackets = {closing: opening for opening, closing in BRACKETS.items()}
+            for i, token in enumerate(self.tokens):
+                if token.type is not TokenType.PUNCTUATION:
+                    continue
+                if token.value in BRACKETS:
+                    open_brackets[token.value].append(i)
+                elif token.value in closing_brackets:
+                    stack = open_brackets[closing_brackets[token.value]]
+                    if stack:
+                        self._closing[stack.pop()] = i
+
+        return self._closing.get(index)
+
+    def find(self, value: str, start: int = 0) -> int | None:
+        """The index of the first punctuation token with the value at or
+        after start"""
+        if self._punctuation is None:
+            self._punctuation = defaultdict(list)
+            for i, token in enumerate(self.tokens):
+                if token.type is TokenType.PUNCTUATION:
+                    self._punctuation[token.value].append(i)
+
+        indexes = self._punctuation.get(value, [])
+        position = bisect_left(indexes, start)
+        return indexes[position] if position < len(indexes) else None
+
+    def arguments(self, opening: int) -> list[list[Token]]:
+        """The tokens of the comma separated arguments within the brackets
+        opened at opening, e.g. of a function call. Commas within nested
+        brackets don't separate arguments."""
+        closing = self.closing(opening)
+        if closing is None or closing == opening + 1:
+            return []
+
+        arguments: list[list[Token]] = [[]]
+        i = opening + 1
+        while i < closing:
+            token = self.tokens[i]
+            if token.is_punctuation(","):
+                arguments.append([])
+                i += 1
+                continue
+
+            end = i
+            if token.type is TokenType.PUNCTUATION and token.value in BRACKETS:
+                nested_closing = self.closing(i)
+                if nested_closing is not None and nested_closing < closing:
+                    end = nested_closing
+            arguments[-1].extend(self.tokens[i : end + 1])
+            i = end + 1
+
+        return arguments
+
+    def text(self, start: int, end: int) -> str:
+        """The code from the start of the token at start to the end of the
+        token at end, including both"""
+        return self.content[self.tokens[start].start : self.tokens[end].end]
@@ -15,12 +15,20 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import mmap
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
-from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.content_store import ContentStore, FileContent
+from troubadix.helper.description_block import find_description_block
+from troubadix.helper.feed_index import FeedIndex
+from troubadix.helper.remove_comments import remove_comments
+from troubadix.helper.script_tag_index import ScriptTagIndex
+from troubadix.helper.text_utils import LineIndex
+from troubadix.helper.tokenizer import Tokens
 
 
 @dataclass
@@ -51,18 +59,40 @@ class FilePluginContext:
         *,
         root: Path,
         nasl_file: Path,
+        content_store: ContentStore | None = None,
+        feed_index: FeedIndex | None = None,
     ) -> None:
         self.root = root
         self.nasl_file = nasl_file
+        self.content_store = content_store if content_store is not None else ContentStore()
+        # the VTs this one depends on, shared by all files of a worker
+        self.feed_index = (
+            feed_index if feed_index is not None else FeedIndex(root, self.content_store)
+        )
 
-        self._file_content: str | None = None
+        self._content: FileContent | None = None
         self._lines: list[str] | None = None
+        self._script_tags: ScriptTagIndex | None = None
+        self._line_index: LineIndex | None = None
+        self._code_without_comments: str | None = None
+        self._tokens: Tokens | None = None
+        self._description_span: tuple[int, int] | None = None
+
+    @property
+    def content(self) -> FileContent:
+        if not self._content:
+            self._content = self.content_store.get(self.nasl_file)
+        return self._content
+
+    @property
+    def file_bytes(self) -> bytes | mmap.mmap:
+        """The raw content of the file, e.g. to look at its newlines. Large
+        files are memory-mapped, see FileContent."""
+        return self.content.raw
 
     @property
     def file_content(self) -> str:
-        if not self._file_content:
-            self._file_content = self.nasl_file.read_text(encoding=CURRENT_ENCODING)
-        return self._file_content
+        return self.content.text
 
     @property
     def lines(self) -> list[str]:
@@ -70,11 +100,68 @@ class FilePluginContext:
             self._lines = self.file_content.splitlines()
         return self._lines
 
+    @property
+    def script_tags(self) -> ScriptTagIndex:
+        """The script tag calls of the file, shared by all plugins"""
+        if not self._script_tags:
+            self._script_tags = ScriptTagIndex(self.file_content)
+        return self._script_tags
+
+    @property
+    def line_index(self) -> LineIndex:
+        """The line numbers of the file content, e.g. to get the line of a
+        match by `line_index.line(match.start())`"""
+        if not self._line_index:
+            self._line_index = LineIndex(self.file_content)
+        return self._line_index
+
+    @property
+    def code_without_comments(self) -> str:
+        """The file content with all comments removed, see
+        `remove_comments`"""
+        if self._code_without_comments is None:
+            self._code_without_comments = remove_comments(self.file_content)
+        return self._code_without_comments
+
+    @property
+    def tokens(self) -> Tokens:
+        """The NASL tokens of the file content, for plugins checking the
+        structure of the code"""
+        if self._tokens is None:
+            self._tokens = Tokens(self.file_content)
+        return self._tokens
+
+    @property
+    def description_span(self) -> tuple[int, int]:
+        """The start and end offset of the `if(description)` block. The
+        whole content, if the file has no description block, e.g. an
+        include."""
+        if self._description_span is None:
+            self._description_span = find_description_block(self.file_content) or (
+                0,
+                len(self.file_content),
+            )
+        return self._description_span
+
+    @property
+    def description_block(self) -> str:
+        """The `if(description)` block, for plugins only checking the
+        script tags. See `description_span`."""
+        start, end = self.description_span
+        return self.file_content[start:end]
+
 
 class FilesPluginContext:
-    def __init__(self, *, root: Path, nasl_files: Iterable[Path]) -> None:
+    def __init__(
+        self,
+        *,
+        root: Path,
+        nasl_files: Iterable[Path],
+        content_store: ContentStore | None = None,
+    ) -> None:
         self.root = root
         self.nasl_files = nasl_files
+        self.content_store = content_store if content_store is not None else ContentStore()
 
 
 class Plugin(ABC):
@@ -89,6 +176,13 @@ class Plugin(ABC):
     def fix(self) -> Iterator[LinterResult]:
         return iter([])
 
+    @classmethod
+    def input_files(cls, context: FilePluginContext) -> Iterable[Path]:
+        """Other files the results of this plugin for the file of the
+        context depend on. Cached results are invalidated if one of them
+        changes."""
+        return ()
+
 
 class FilesPlugin(Plugin):
     """A plugin that does checks over all files"""
@@ -96,6 +190,44 @@ class FilesPlugin(Plugin):
     def __init__(self, context: FilesPluginContext) -> None:
         self.context = context
 
+    @classmethod
+    def split(cls, context: FilesPluginContext, parts: int) -> list[FilesPluginContext]:
+        """Split the context into up to parts contexts, which are checked in
+        parallel. The results of the parts are merged in the order of the
+        returned contexts and need to be the same as for the whole context.
+        By default the plugin is not split."""
+        return [context]
+
+
+class MapReducePlugin(FilesPlugin):
+    """A plugin that does checks over all files in two steps
+
+    `map` collects facts from every single file. It runs in the pool
+    workers on the context that is shared with the file plugins, so the
+    files are not read a second time. `reduce` checks the facts collected
+    from all files.
+    """
+
+    @classmethod
+    @abstractmethod
+    def map(cls, context: FilePluginContext) -> Iterator[Any]:
+        """Collect the facts of a single file. The facts need to be
+        picklable as they are sent from the workers to the runner and JSON
+        serializable to be stored in the result cache."""
+
+    @abstractmethod
+    def reduce(self, facts: Iterable[tuple[Path, Any]]) -> Iterator[LinterResult]:
+        """Check the facts collected from all files. The facts are passed
+        as (file, fact) tuples in the order of the checked files."""
+
+    def run(self) -> Iterator[LinterResult]:
+        facts = [
+            (nasl_file, fact)
+            for nasl_file in self.context.nasl_files
+            for fact in self.map(FilePluginContext(root=self.context.root, nasl_file=nasl_file))
+        ]
+        return self.reduce(facts)
+
 
 class FilePlugin(Plugin):
     """A plugin that does checks on single files"""
@@ -7,12 +7,7 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from troubadix.helper import is_ignore_file
-from troubadix.helper.patterns import (
-    ScriptTag,
-    SpecialScriptTag,
-    get_script_tag_pattern,
-    get_special_script_tag_pattern,
-)
+from troubadix.helper.patterns import ScriptTag, SpecialScriptTag
 from troubadix.plugin import (
     FileContentPlugin,
     LinterError,
@@ -63,8 +58,7 @@ class CheckCopyrightYear(FileContentPlugin):
         if nasl_file.suffix == ".inc" or is_ignore_file(nasl_file, _IGNORE_FILES):
             return
         # extract creation year from script tag
-        creation_date_pattern = get_script_tag_pattern(ScriptTag.CREATION_DATE)
-        creation_date_match = creation_date_pattern.search(file_content)
+        creation_date_match = self.context.script_tags.search(ScriptTag.CREATION_DATE)
         if not creation_date_match:
             yield LinterError(
                 "Missing creation_date statement in VT",
@@ -75,8 +69,7 @@ class CheckCopyrightYear(FileContentPlugin):
         creation_year = int(creation_date_match.group("value")[:4])
 
         # extract year in value of script_copyright tag
-        script_copyright_pattern = get_special_script_tag_pattern(SpecialScriptTag.COPYRIGHT)
-        script_copyright_match = script_copyright_pattern.search(file_content)
+        script_copyright_match = self.context.script_tags.search(SpecialScriptTag.COPYRIGHT)
         if not script_copyright_match:
             yield LinterError(
                 "Missing copyright tag in VT",
@@ -22,7 +22,7 @@ from troubadix.helper.date_format import (
     check_date,
     compare_date_with_last_modification_date,
 )
-from troubadix.helper.patterns import ScriptTag, get_script_tag_pattern
+from troubadix.helper.patterns import ScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 
@@ -40,10 +40,9 @@ class CheckCreationDate(FileContentPlugin):
         ):
             return
 
-        creation_date_pattern = get_script_tag_pattern(ScriptTag.CREATION_DATE)
-        last_modification_pattern = get_script_tag_pattern(ScriptTag.LAST_MODIFICATION)
+        script_tags = self.context.script_tags
 
-        if not (match_creation_date := creation_date_pattern.search(file_content)):
+        if not (match_creation_date := script_tags.search(ScriptTag.CREATION_DATE)):
             yield LinterError(
                 "No creation_date has been found.",
                 file=nasl_file,
@@ -58,7 +57,7 @@ class CheckCreationDate(FileContentPlugin):
             self.name,
         )
 
-        if match_last_mod_date := last_modification_pattern.search(file_content):
+        if match_last_mod_date := script_tags.search(ScriptTag.LAST_MODIFICATION):
             yield from compare_date_with_last_modification_date(
                 match_creation_date.group("value"),
                 "creation_date",
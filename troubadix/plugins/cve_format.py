@@ -20,7 +20,7 @@ from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
-from troubadix.helper import ScriptTag, get_script_tag_pattern
+from troubadix.helper import ScriptTag
 from troubadix.plugin import (
     FileContentPlugin,
     LinterError,
@@ -43,11 +43,9 @@ class CheckCVEFormat(FileContentPlugin):
         ):
             return
 
-        tag_pattern = get_script_tag_pattern(ScriptTag.CVSS_BASE)
-
         # don't need to check detection scripts since they don't refer to CVEs.
         # all detection scripts have a cvss of 0.0
-        cvss_detect = tag_pattern.search(file_content)
+        cvss_detect = self.context.script_tags.search(ScriptTag.CVSS_BASE)
         if cvss_detect and cvss_detect.group("value") == "0.0":
             return
 
@@ -61,6 +59,7 @@ class CheckCVEFormat(FileContentPlugin):
             )
             return
 
+        line = self.context.line_index.line(match_result.start())
         found_cves = []
         matches = match_result.group(0).split(",")
         current_year = datetime.now(tz=UTC).year
@@ -71,6 +70,7 @@ class CheckCVEFormat(FileContentPlugin):
                     "VT uses an invalid CVE format.",
                     file=nasl_file,
                     plugin=self.name,
+                    line=line,
                 )
                 return
 
@@ -82,6 +82,7 @@ class CheckCVEFormat(FileContentPlugin):
                     "must not start with a 0 if there are more than 4 digits.",
                     file=nasl_file,
                     plugin=self.name,
+                    line=line,
                 )
 
             year = cve.split("-")
@@ -90,6 +91,7 @@ class CheckCVEFormat(FileContentPlugin):
                     "VT uses an invalid year in CVE format.",
                     file=nasl_file,
                     plugin=self.name,
+                    line=line,
                 )
 
             if cve in found_cves:
@@ -97,6 +99,7 @@ class CheckCVEFormat(FileContentPlugin):
                     f"VT is using CVE {cve} multiple times.",
                     file=nasl_file,
                     plugin=self.name,
+                    line=line,
                 )
 
             found_cves.append(cve)
@@ -18,7 +18,7 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper import ScriptTag, get_script_tag_pattern
+from troubadix.helper import ScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 
@@ -36,17 +36,16 @@ class CheckCVSSFormat(FileContentPlugin):
         ):
             return
 
-        cvss_base_pattern = get_script_tag_pattern(ScriptTag.CVSS_BASE)
-        cvss_base_vector_pattern = get_script_tag_pattern(ScriptTag.CVSS_BASE_VECTOR)
+        script_tags = self.context.script_tags
 
-        if not cvss_base_pattern.search(file_content):
+        if not script_tags.search(ScriptTag.CVSS_BASE):
             yield LinterError(
                 "VT has a missing or invalid cvss_base value.",
                 file=nasl_file,
                 plugin=self.name,
             )
 
-        if not cvss_base_vector_pattern.search(file_content):
+        if not script_tags.search(ScriptTag.CVSS_BASE_VECTOR):
             yield LinterError(
                 "VT has a missing or invalid cvss_base_vector value.",
                 file=nasl_file,
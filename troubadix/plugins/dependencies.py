@@ -18,36 +18,79 @@
 # pylint: disable=fixme
 
 import re
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+from troubadix.helper import SpecialScriptTag
+from troubadix.helper.feed_index import split_dependencies
 from troubadix.helper.helper import FEED_VERSIONS, is_enterprise_folder
-from troubadix.helper.patterns import _get_special_script_tag_pattern
+from troubadix.helper.patterns import (
+    _get_special_script_tag_pattern,
+    get_special_script_tag_pattern,
+)
 from troubadix.plugin import (
     FilePlugin,
+    FilePluginContext,
     LinterError,
     LinterResult,
     LinterWarning,
 )
 
 
-def split_dependencies(value: str) -> list[str]:
+def get_dependencies(file_content: str) -> list[str]:
+    """
+    Get the script dependencies of the given file content, including
+    multiline script_dependencies tags with inline comments
+    """
+    dependencies_pattern = _get_special_script_tag_pattern(
+        "dependencies", flags=re.DOTALL | re.MULTILINE
+    )
+    return [
+        dep
+        for match in dependencies_pattern.finditer(file_content)
+        for dep in split_dependencies(match.group("value"))
+    ]
+
+
+def get_single_line_dependencies(file_content: str) -> list[str]:
+    """
+    Get the script dependencies of the given file content as found by the
+    checks of the metadata of the dependencies, which only consider
+    script_dependencies tags on a single line
+    """
+    dependencies_pattern = get_special_script_tag_pattern(SpecialScriptTag.DEPENDENCIES)
+    return [
+        dep
+        for match in dependencies_pattern.finditer(file_content)
+        # Remove single and/or double quotes, spaces
+        # and create a list by using the comma as a separator
+        for dep in re.sub(r'[\'"\s]', "", match.group("value")).split(",")
+    ]
+
+
+def dependency_paths(root: Path, dependencies: Iterable[str]) -> list[Path]:
     """
-    Remove single and/or double quotes, spaces
-    and create a list by using the comma as a separator
-    additionally, check and filter for inline comments
+    Get all paths within the feed versions at which the given
+    script dependencies may be located
     """
-    dependencies = []
-    for line in value.splitlines():
-        subject = line[: line.index("#")] if "#" in line else line
-        _dependencies = re.sub(r'[\'"\s]', "", subject).split(",")
-        dependencies += [dep for dep in _dependencies if dep != ""]
-    return dependencies
+    return [root / vers / dep for dep in dependencies for vers in FEED_VERSIONS]
+
+
+def get_dependency_paths(root: Path, file_content: str) -> list[Path]:
+    """
+    Get all paths within the feed versions at which the script
+    dependencies of the given file content may be located
+    """
+    return dependency_paths(root, get_dependencies(file_content))
 
 
 class CheckDependencies(FilePlugin):
     name = "check_dependencies"
 
+    @classmethod
+    def input_files(cls, context: FilePluginContext) -> Iterable[Path]:
+        return get_dependency_paths(context.root, context.file_content)
+
     def run(
         self,
     ) -> Iterator[LinterResult]:
@@ -64,49 +107,41 @@ class CheckDependencies(FilePlugin):
         if "# troubadix: disable=template_nd_test_files_fps" in file_content:
             return
 
-        dependencies_pattern = _get_special_script_tag_pattern(
-            "dependencies", flags=re.DOTALL | re.MULTILINE
-        )
-
-        root = self.context.root
-
-        matches = dependencies_pattern.finditer(file_content)
-
-        for match in matches:
-            if match:
-                for dep in split_dependencies(match.group("value")):
-                    if not any((root / vers / dep).exists() for vers in FEED_VERSIONS):
-                        yield LinterError(
-                            f"The script dependency {dep} could not be found within the VTs.",
-                            file=self.context.nasl_file,
-                            plugin=self.name,
-                        )
-                        continue
-
-                    dependency = Path(dep)
-                    parts = dependency.parts
-
-                    if is_enterprise_folder(parts[0]):
-                        # strip parent enterprise folder
-                        parts = parts[1:]
-
-                    if len(parts) < 2:
-                        # only the filename is contained in parts means
-                        # no parent directory
-                        continue
-
-                    parent_folder = parts[0]
-                    if parent_folder in ["Policy", "GSHB"]:
-                        yield LinterWarning(
-                            f"The script dependency {dep} is in a "
-                            "subdirectory, which might be misplaced.",
-                            file=self.context.nasl_file,
-                            plugin=self.name,
-                        )
-                    else:
-                        yield LinterError(
-                            f"The script dependency {dep} is within "
-                            "a subdirectory, which is not allowed.",
-                            file=self.context.nasl_file,
-                            plugin=self.name,
-                        )
+        feed_index = self.context.feed_index
+
+        for dep in get_dependencies(file_content):
+            if not feed_index.get(dep):
+                yield LinterError(
+                    f"The script dependency {dep} could not be found within the VTs.",
+                    file=self.context.nasl_file,
+                    plugin=self.name,
+                )
+                continue
+
+            dependency = Path(dep)
+            parts = dependency.parts
+
+            if is_enterprise_folder(parts[0]):
+                # strip parent enterprise folder
+                parts = parts[1:]
+
+            if len(parts) < 2:
+                # only the filename is contained in parts means
+                # no parent directory
+                continue
+
+            parent_folder = parts[0]
+            if parent_folder in ["Policy", "GSHB"]:
+                yield LinterWarning(
+                    f"The script dependency {dep} is in a "
+                    "subdirectory, which might be misplaced.",
+                    file=self.context.nasl_file,
+                    plugin=self.name,
+                )
+            else:
+                yield LinterError(
+                    f"The script dependency {dep} is within "
+                    "a subdirectory, which is not allowed.",
+                    file=self.context.nasl_file,
+                    plugin=self.name,
+                )
@@ -18,14 +18,19 @@
 # pylint: disable=fixme
 
 import re
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from enum import IntEnum
 from pathlib import Path
 
-from troubadix.helper import CURRENT_ENCODING, SpecialScriptTag
-from troubadix.helper.helper import FEED_VERSIONS
+from troubadix.helper import SpecialScriptTag
 from troubadix.helper.patterns import get_special_script_tag_pattern
-from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
+from troubadix.plugin import (
+    FileContentPlugin,
+    FilePluginContext,
+    LinterError,
+    LinterResult,
+)
+from troubadix.plugins.dependencies import dependency_paths, get_single_line_dependencies
 
 
 # See https://shorturl.at/jBGJT for a list of the category numbers.
@@ -71,6 +76,10 @@ def check_category(content: str, pattern: re.Pattern, script: str) -> LinterErro
 class CheckDependencyCategoryOrder(FileContentPlugin):
     name = "check_dependency_category_order"
 
+    @classmethod
+    def input_files(cls, context: FilePluginContext) -> Iterable[Path]:
+        return dependency_paths(context.root, get_single_line_dependencies(context.file_content))
+
     def check_content(
         self,
         nasl_file: Path,
@@ -108,71 +117,46 @@ class CheckDependencyCategoryOrder(FileContentPlugin):
             )
             return
 
-        dependencies_pattern = get_special_script_tag_pattern(SpecialScriptTag.DEPENDENCIES)
-        matches = dependencies_pattern.finditer(file_content)
-
-        if not matches:
-            return
-
-        root = self.context.root
-
-        for match in matches:
-            if match:
-                # Remove single and/or double quotes, spaces
-                # and create a list by using the comma as a separator
-                dependencies = re.sub(r'[\'"\s]', "", match.group("value")).split(",")
-
-                for dep in dependencies:
-                    dependency_path = None
-                    for vers in FEED_VERSIONS:
-                        if (root / vers / dep).exists():
-                            dependency_path = root / vers / dep
-
-                    if not dependency_path:
-                        yield LinterError(
-                            f"The script dependency {dep} could not be found within the VTs.",
-                            file=nasl_file,
-                            plugin=self.name,
-                        )
-                    else:
-                        dependency_content = dependency_path.read_text(encoding=CURRENT_ENCODING)
-
-                        try:
-                            dependency_category = check_category(
-                                content=dependency_content,
-                                pattern=category_pattern,
-                                script=dependency_path.name,
-                            )
-                        except CategoryError as e:
-                            yield LinterError(
-                                str(e),
-                                file=nasl_file,
-                                plugin=self.name,
-                            )
-
-                        if category.value < dependency_category.value:
-                            yield LinterError(
-                                f"Script category {category.name}"
-                                f"({category.value}) is lower than "
-                                f"the category {dependency_category.name}"
-                                f"({dependency_category.value}) of the "
-                                f"dependency {dep}.",
-                                file=nasl_file,
-                                plugin=self.name,
-                            )
-                        # nb: Currently not sure about the
-                        # host_alive_detection.nasl dependency so
-                        # excluding them for now.
-                        if (
-                            dependency_category.name == "ACT_SCANNER"
-                            and dep != "host_alive_detection.nasl"
-                        ):
-                            yield LinterError(
-                                f"Script depends on {dep} which has the "
-                                f"category {dependency_category.name}"
-                                f"({dependency_category.value}), but no VT"
-                                " is allowed to have a direct dependency "
-                                "to VTs in this category.",
-                                file=nasl_file,
-                                plugin=self.name,
-                            )
+        feed_index = self.context.feed_index
+
+        for dep in get_single_line_dependencies(file_content):
+            dependency = feed_index.get(dep)
+
+            if not dependency:
+                yield LinterError(
+                    f"The script dependency {dep} could not be found within the VTs.",
+                    file=nasl_file,
+                    plugin=self.name,
+                )
+            elif not dependency.category:
+                yield LinterError(
+                    f"{dependency.path.name}: Script category is missing or unsupported.",
+                    file=nasl_file,
+                    plugin=self.name,
+                )
+            else:
+                dependency_category = VTCategory[dependency.category]
+
+                if category.value < dependency_category.value:
+                    yield LinterError(
+                        f"Script category {category.name}"
+                        f"({category.value}) is lower than "
+                        f"the category {dependency_category.name}"
+                        f"({dependency_category.value}) of the "
+                        f"dependency {dep}.",
+                        file=nasl_file,
+                        plugin=self.name,
+                    )
+                # nb: Currently not sure about the
+                # host_alive_detection.nasl dependency so
+                # excluding them for now.
+                if dependency_category.name == "ACT_SCANNER" and dep != "host_alive_detection.nasl":
+                    yield LinterError(
+                        f"Script depends on {dep} which has the "
+                        f"category {dependency_category.name}"
+                        f"({dependency_category.value}), but no VT"
+                        " is allowed to have a direct dependency "
+                        "to VTs in this category.",
+                        file=nasl_file,
+                        plugin=self.name,
+                    )
@@ -17,18 +17,21 @@
 
 # pylint: disable=fixme
 
-import re
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
-from troubadix.helper import CURRENT_ENCODING, SpecialScriptTag
-from troubadix.helper.helper import FEED_VERSIONS
-from troubadix.helper.patterns import get_special_script_tag_pattern
-from troubadix.plugin import FilePlugin, LinterError, LinterResult
+from troubadix.helper.feed_index import DEPRECATED_PATTERN
+from troubadix.plugin import FilePlugin, FilePluginContext, LinterError, LinterResult
+from troubadix.plugins.dependencies import dependency_paths, get_single_line_dependencies
 
 
 class CheckDeprecatedDependency(FilePlugin):
     name = "check_deprecated_dependency"
 
+    @classmethod
+    def input_files(cls, context: FilePluginContext) -> Iterable[Path]:
+        return dependency_paths(context.root, get_single_line_dependencies(context.file_content))
+
     def run(self) -> Iterator[LinterResult]:
         """No VT should depend on other VTs that are marked as deprecated via:
 
@@ -47,48 +50,24 @@ class CheckDeprecatedDependency(FilePlugin):
         ):
             return
 
-        dependencies_pattern = get_special_script_tag_pattern(SpecialScriptTag.DEPENDENCIES)
-        matches = dependencies_pattern.finditer(file_content)
-        if not matches:
-            return
-
-        deprecated_pattern = re.compile(
-            r"^\s*exit\s*\(\s*66\s*\)\s*;|script_tag\s*\(\s*name\s*:\s*"
-            r"(?P<quote>[\"'])deprecated(?P=quote)\s*,\s*value\s*:\s*TRUE"
-            r"\s*\)\s*;",
-            re.MULTILINE,
-        )
-        deprecated = deprecated_pattern.search(file_content)
+        deprecated = DEPRECATED_PATTERN.search(file_content)
         if deprecated:
             return
 
-        root = self.context.root
-
-        for match in matches:
-            if match:
-                # Remove single and/or double quotes, spaces
-                # and create a list by using the comma as a separator
-                dependencies = re.sub(r'[\'"\s]', "", match.group("value")).split(",")
-
-                for dep in dependencies:
-                    dependency_path = None
-                    for vers in FEED_VERSIONS:
-                        if (root / vers / dep).exists():
-                            dependency_path = root / vers / dep
-
-                    if not dependency_path:
-                        yield LinterError(
-                            f"The script dependency {dep} could not be found within the VTs.",
-                            file=self.context.nasl_file,
-                            plugin=self.name,
-                        )
-                    else:
-                        dependency_content = dependency_path.read_text(encoding=CURRENT_ENCODING)
-
-                        dependency_deprecated = deprecated_pattern.search(dependency_content)
-                        if dependency_deprecated:
-                            yield LinterError(
-                                f"VT depends on {dep}, which is marked as deprecated.",
-                                file=self.context.nasl_file,
-                                plugin=self.name,
-                            )
+        feed_index = self.context.feed_index
+
+        for dep in get_single_line_dependencies(file_content):
+            dependency = feed_index.get(dep)
+
+            if not dependency:
+                yield LinterError(
+                    f"The script dependency {dep} could not be found within the VTs.",
+                    file=self.context.nasl_file,
+                    plugin=self.name,
+                )
+            elif dependency.deprecated:
+                yield LinterError(
+                    f"VT depends on {dep}, which is marked as deprecated.",
+                    file=self.context.nasl_file,
+                    plugin=self.name,
+                )
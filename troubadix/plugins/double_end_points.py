@@ -42,7 +42,7 @@ class CheckDoubleEndPoints(FilePlugin):
         if self.context.nasl_file.suffix == ".inc":
             return
 
-        tag_matches = get_common_tag_patterns().finditer(self.context.file_content)
+        tag_matches = get_common_tag_patterns().finditer(self.context.description_block)
 
         if tag_matches is not None:
             for tag_match in tag_matches:
@@ -16,44 +16,45 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import re
-from collections.abc import Iterator
-
-from troubadix.helper import (
-    CURRENT_ENCODING,
-    SpecialScriptTag,
-    get_path_from_root,
-    get_special_script_tag_pattern,
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from troubadix.helper import SpecialScriptTag, get_path_from_root
+from troubadix.plugin import (
+    FilePluginContext,
+    LinterError,
+    LinterResult,
+    MapReducePlugin,
 )
-from troubadix.plugin import FilesPlugin, LinterError, LinterResult
 
 OID_RE = re.compile(r"^1\.3\.6\.1\.4\.1\.25623\.1\.[0-9]+\.[\d.]+$")
 
 
-class CheckDuplicateOID(FilesPlugin):
+class CheckDuplicateOID(MapReducePlugin):
     name = "check_duplicate_oid"
 
-    def run(self) -> Iterator[LinterResult]:
-        """Run PRE_RUN_COLLECTOR."""
-
-        mapping = {}
+    @classmethod
+    def map(cls, context: FilePluginContext) -> Iterator[str | None]:
+        """Collect the OID of a VT or None if the VT has no OID"""
+        if not context.nasl_file.suffix == ".nasl":
+            return
 
-        for nasl_file in self.context.nasl_files:
-            if not nasl_file.suffix == ".nasl":
-                continue
+        content = context.file_content
 
-            content = nasl_file.read_text(encoding=CURRENT_ENCODING)
+        if "# troubadix: disable=template_nd_test_files_fps" in content:
+            return
 
-            if "# troubadix: disable=template_nd_test_files_fps" in content:
-                continue
+        match = context.script_tags.search(SpecialScriptTag.OID)
 
-            nasl_file_root = get_path_from_root(nasl_file, self.context.root)
+        yield match.group("oid") if match else None
 
-            oid = None
+    def reduce(self, facts: Iterable[tuple[Path, str | None]]) -> Iterator[LinterResult]:
+        """Check that the collected OIDs are valid and unique"""
 
-            match = get_special_script_tag_pattern(SpecialScriptTag.OID).search(content)
+        mapping = {}
 
-            if match:
-                oid = match.group("oid")
+        for nasl_file, oid in facts:
+            nasl_file_root = get_path_from_root(nasl_file, self.context.root)
 
             if not oid:
                 yield LinterError(
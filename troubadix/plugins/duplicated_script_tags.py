@@ -17,10 +17,7 @@
 
 from collections.abc import Iterator
 
-from troubadix.helper.patterns import (
-    get_script_tag_patterns,
-    get_special_script_tag_patterns,
-)
+from troubadix.helper.patterns import ScriptTag, SpecialScriptTag
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
 allowed_dup_dependencies = [
@@ -40,9 +37,9 @@ class CheckDuplicatedScriptTags(FilePlugin):
         if "# troubadix: disable=template_nd_test_files_fps" in file_content:
             return
 
-        special_script_tag_patterns = get_special_script_tag_patterns()
+        script_tags = self.context.script_tags
 
-        for tag, pattern in special_script_tag_patterns.items():
+        for tag in SpecialScriptTag:
             # TBD: script_name might also look like this:
             # script_name("MyVT (Windows)");
 
@@ -54,7 +51,7 @@ class CheckDuplicatedScriptTags(FilePlugin):
                 if any(f in file_path for f in allowed_dup_dependencies):
                     continue
 
-            match = pattern.finditer(file_content)
+            match = script_tags.finditer(tag)
 
             if match:
                 # This is allowed, see e.g.
@@ -71,11 +68,11 @@ class CheckDuplicatedScriptTags(FilePlugin):
                         f"{tag.value}' multiple number of times.",
                         file=self.context.nasl_file,
                         plugin=self.name,
+                        line=self.context.line_index.line(match[1].start()),
                     )
 
-        script_tag_patterns = get_script_tag_patterns()
-        for tag, pattern in script_tag_patterns.items():
-            match = pattern.finditer(file_content)
+        for tag in ScriptTag:
+            match = script_tags.finditer(tag)
 
             if match:
                 match = list(match)
@@ -84,4 +81,5 @@ class CheckDuplicatedScriptTags(FilePlugin):
                         f"The VT is using the script tag '{tag.value}' multiple number of times.",
                         file=self.context.nasl_file,
                         plugin=self.name,
+                        line=self.context.line_index.line(match[1].start()),
                     )
@@ -1,6 +1,7 @@
 # Copyright (C) 2022 Greenbone AG
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import re
 from collections.abc import Iterator
 
 import magic
@@ -17,6 +18,23 @@ from troubadix.plugin import (
 # US-ASCII is also allowed since it's a subset of ISO-8859-1.
 ALLOWED_ENCODINGS = ["iso-8859-1", "us-ascii"]
 
+# Detects UTF-8 multibyte sequences by checking the first two bytes.
+# UTF-8 multibyte sequences start with a lead byte followed by continuation bytes.
+#
+# Lead byte ranges:
+# - 2-byte: 0xC2–0xDF (110xxxxx, excluding 0xC0–0xC1 to avoid overlongs)
+# - 3-byte: 0xE0–0xEF (1110xxxx)
+# - 4-byte: 0xF0–0xF4 (11110xxx)
+# These ranges are continuous, so we can check 0xC2–0xF4 as a single range.
+# 11000010  C2  --  F4  11110111
+#
+# Continuation bytes: 0x80–0xBF (10yyyyyy)
+# 10000000  80  --  BF  10111111
+#
+# Lead and continuation byte values are either not valid Latin-1 or special symbols
+# that are unlikely to be following each other in normal use.
+UTF8_MULTIBYTE_PATTERN = re.compile(rb"[\xc2-\xf4][\x80-\xbf]")
+
 
 class CheckEncoding(FilePlugin):
     """
@@ -28,11 +46,13 @@ class CheckEncoding(FilePlugin):
     name = "check_encoding"
 
     def run(self) -> Iterator[LinterResult]:
-        with open(self.context.nasl_file, "rb") as f:
-            raw = f.read()
+        raw = self.context.file_bytes
 
-        # Use magic to detect encoding
-        detected_encoding = magic.Magic(mime_encoding=True).from_buffer(raw)
+        # Use magic to detect encoding. libmagic only looks at the first
+        # bytes_max bytes, so there is no need to pass the whole file.
+        detector = magic.Magic(mime_encoding=True)
+        bytes_max = detector.getparam(magic.MAGIC_PARAM_BYTES_MAX)
+        detected_encoding = detector.from_buffer(bytes(raw[:bytes_max]))
 
         if detected_encoding not in ALLOWED_ENCODINGS:
             yield LinterError(
@@ -41,38 +61,21 @@ class CheckEncoding(FilePlugin):
                 plugin=self.name,
             )
 
-        def has_utf8_multibyte(data: bytes) -> bool:
-            """
-            Function to detect UTF-8 multibyte sequences by checking the first two bytes.
-            UTF-8 multibyte sequences start with a lead byte followed by continuation bytes.
-
-            Lead byte ranges:
-            - 2-byte: 0xC2–0xDF (110xxxxx, excluding 0xC0–0xC1 to avoid overlongs)
-            - 3-byte: 0xE0–0xEF (1110xxxx)
-            - 4-byte: 0xF0–0xF4 (11110xxx)
-            These ranges are continuous, so we can check 0xC2–0xF4 as a single range.
-            11000010  C2  --  F4  11110111
-
-            Continuation bytes: 0x80–0xBF (10yyyyyy)
-            10000000  80  --  BF  10111111
-
-            Lead and continuation byte values are either not valid Latin-1 or special symbols
-            that are unlikely to be following each other in normal use.
-            """
-
-            for i in range(len(data) - 1):
-                first = data[i]
-                second = data[i + 1]
-                if 0xC2 <= first <= 0xF4 and 0x80 <= second <= 0xBF:
-                    return True
-            return False
-
-        lines = raw.split(b"\n")
-        for i, line_bytes in enumerate(lines, start=1):
-            if has_utf8_multibyte(line_bytes):
-                yield LinterError(
-                    f"Likely UTF-8 multibyte sequence found in line {i}",
-                    file=self.context.nasl_file,
-                    plugin=self.name,
-                    line=i,
-                )
+        # The lines are only counted for the matches, instead of checking
+        # every line byte by byte
+        line = 1
+        line_start = 0
+        reported_line = 0
+        for match in UTF8_MULTIBYTE_PATTERN.finditer(raw):
+            line += raw[line_start : match.start()].count(b"\n")
+            line_start = match.start()
+            if line == reported_line:
+                continue
+
+            reported_line = line
+            yield LinterError(
+                f"Likely UTF-8 multibyte sequence found in line {line}",
+                file=self.context.nasl_file,
+                plugin=self.name,
+                line=line,
+            )
@@ -19,11 +19,13 @@ import re
 from collections.abc import Iterator
 
 from troubadix.helper.linguistic_exception_handler import (
+    LinguisticExceptionMatcher,
     PatternCheck,
     TextCheck,
     TextInFileCheck,
-    handle_linguistic_checks,
 )
+from troubadix.helper.patterns import compile_pattern
+from troubadix.helper.text_utils import find_lines_with
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
 exceptions = [
@@ -116,100 +118,106 @@ exceptions = [
     TextCheck("and Or Cohen"),
 ]
 
+exception_matcher = LinguisticExceptionMatcher(exceptions)
+
+
+# The grammar problems, which are reported with the line they are found in
+GRAMMAR_PROBLEMS_PATTERN = re.compile(
+    r"("
+    r"refer\s+(the\s+)?Reference|"
+    r"\s+an?\s+(multiple|errors)|"
+    r"the\s+(References?\s+link|multiple\s+flaw)|"
+    r"multiple\s+(unknown\s+)?("
+    r"vulnerability|flaw|error|problem|issue|feature|request)(\.|\s+)|"
+    # Various which can be caused by e.g. CP mistakes like e.g.:
+    # Update to version 7.2.8, 7.3.1 or or later.
+    r"\s+(with\s+with|and\s+and|this\s+this|for\s+for|as\s+as|a\s+a"
+    r"|of\s+of|to\s+to|an\s+an|the\s+the|is\s+is|in\s+in|are\s+are|have"
+    r"\s+have|has\s+has|that\s+that|or\s+or|and\s+or|or\s+and)\s+|"
+    r"vulnerabilit(y|ies)\s+vulnerabilit(y|ies)|"
+    r"links\s+mentioned\s+in(\s+the)?\s+reference|"
+    r"\s+an?(\s+remote)?(\s+(un)?authenticated)?\s+attackers|"
+    # e.g. "this flaws"
+    r"this\s+(vulnerabilities|(flaw|error|problem|issue|feature|file|request)s)|"
+    # e.g. "these flaw "
+    r"these\s+(vulnerability|(flaw|error|problem|issue|feature|file|request)\s+)|"
+    r"\s+or\s+not\.?(\"\);)?$|"
+    r"from(\s+the)?(\s+below)?mentioned\s+References?\s+link|"
+    r"software\s+it\s+fail|"
+    r"references\s+(advisor|link)|"
+    r"The\s+multiple\s+(vulnerabilit|flaw|error|problem|issue|feature)|"
+    r"(vulnerability|flaw|error|problem|issue|feature)\s+exist\s+|"
+    r"(vulnerabilitie|flaw|error|problem|issue|feature)s\s+exists|"
+    r"multiple\s+[^\s]+((and\s+)?[^\s]+)?\s+("
+    r"vulnerability|flaw|error|problem|issue|feature|request)(\.|\s+)|"
+    r"(\s+|^|\"|- )A\s+[^\s]*((and\s+)?[^\s]+\s+)?("
+    r"vulnerabilitie|flaw|error|problem|issue|feature|request)s|"
+    r"(\s+|^|\"|- )An?\+(unspecified|multiple|unknown)\s+("
+    r"vulnerabilitie|flaw|error|problem|issue)s|"
+    r"is\s+(prone|vulnerable|affected)\s+(to|by)\s+("
+    r"unspecified|XML\s+External\s+Entity|integer\s+(und|ov)erflow|"
+    r"DLL\s+hijacking|(hardcoded?|default)\s+credentials?|open[\s-]+"
+    r"redirect(ion)?|user\s+enumeration|arbitrary\s+file\s+read|memory"
+    r"\s+corruption|use[\s-]+after[\s-]+free|man[\s-]+in[\s-]+the[\s-]"
+    r"+middle(\s+attack)?|cross[\s-]+site[\s-]+(scripting(\s+\(XSS\))?"
+    r"|request[\s-]+forgery(\s+\(CSRF\))?)|denial[\s-]+of[\s-]+service"
+    r"|information\s+disclosure|(path|directory)\s+traversal|"
+    r"(arbitrary\s+|remote\s+)?((code|command)\s+(execution|injection)"
+    r"|file\s+inclusion)|SQL\s+injection|security|(local )?privilege"
+    r"[\s-]+(escalation|elevation)|(authentication|security|access)"
+    r"\s+bypass|(buffer|heap)\s+overflow)\s+vulnerability|"
+    # e.g.:
+    # "is prone a to denial of service (DoS) vulnerability"
+    # "is prone an information disclosure vulnerability"
+    r"\s+(is|are)\s+(prone|vulnerable|affected)\s+an?\s+|"
+    # e.g.:
+    # "Sends multiple HTTP request and checks the responses."
+    # "Sends multiple HTTP GET request and checks the responses."
+    r"multiple\s+([^ ]+\s+)?([^ ]+\s+)?request\s+|"
+    # nb: These are added here because codespell can only handle single
+    # words currently. Basically:
+    # cross-side scripting -> cross-site scripting
+    # cross-side request forgery -> cross-site request forgery
+    # server-site request forgery -> server-side request forgery
+    # server-site template injection -> server-side template injection
+    r"cross[\s-]+side[\s-]+(request[\s-]+forgery|scripting)|"
+    r"server[\s-]+site[\s-]+(request[\s-]+forgery|template)[\s-]+injection|"
+    # e.g.:
+    # Successful exploitation may allows an attacker to run arbitrary
+    # An error in INSTALL_JAR procedure might allows remote authenticated
+    r"(could|may|will|might|should|can)\s+allows\s+|"
+    # e.g.:
+    # - Inadequate checks in com_contact could allowed mail submission
+    r"(could|may|will|might|should|can)\s+allowed\s+|"
+    # e.g.:
+    # This allow an attacker to gain administrative access to the
+    r"This\s+allow\s+|"
+    # nb: Next few could happen when copy'n'paste some text parts around
+    # like e.g.:
+    # is prone to a to a remote denial-of-service vulnerability
+    # CVE-2022-31702: Command injection in the in the vRNI REST API
+    # MariaDB versions prior to prior to 10.3.32, 10.4.x prior to
+    # Update to update to version 1.2.3
+    # Update to version to version 1.2.3
+    r"in the in the|to an? to a|prior to prior to|to version to version|" r"update to update to|"
+    # e.g.:
+    #
+    # MyProduct versions prior to version 1.2.3.
+    # MyProduct version prior to version 1.2.3.
+    #
+    # but NOT:
+    #
+    # Subversion prior to version 1.2.3.
+    r"\s+versions? prior to version|"
+    # e.g. "is prone to a security bypass vulnerabilities"
+    r"is\s+prone\s+to\s+an?\s+[^\s]+\s+([^\s]+\s+)?vulnerabilities)",
+    re.IGNORECASE,
+)
+
 
 def get_grammer_pattern() -> re.Pattern:
-    return re.compile(
-        r".*("
-        r"refer\s+(the\s+)?Reference|"
-        r"\s+an?\s+(multiple|errors)|"
-        r"the\s+(References?\s+link|multiple\s+flaw)|"
-        r"multiple\s+(unknown\s+)?("
-        r"vulnerability|flaw|error|problem|issue|feature|request)(\.|\s+)|"
-        # Various which can be caused by e.g. CP mistakes like e.g.:
-        # Update to version 7.2.8, 7.3.1 or or later.
-        r"\s+(with\s+with|and\s+and|this\s+this|for\s+for|as\s+as|a\s+a"
-        r"|of\s+of|to\s+to|an\s+an|the\s+the|is\s+is|in\s+in|are\s+are|have"
-        r"\s+have|has\s+has|that\s+that|or\s+or|and\s+or|or\s+and)\s+|"
-        r"vulnerabilit(y|ies)\s+vulnerabilit(y|ies)|"
-        r"links\s+mentioned\s+in(\s+the)?\s+reference|"
-        r"\s+an?(\s+remote)?(\s+(un)?authenticated)?\s+attackers|"
-        # e.g. "this flaws"
-        r"this\s+(vulnerabilities|(flaw|error|problem|issue|feature|file|request)s)|"
-        # e.g. "these flaw "
-        r"these\s+(vulnerability|(flaw|error|problem|issue|feature|file|request)\s+)|"
-        r"\s+or\s+not\.?(\"\);)?$|"
-        r"from(\s+the)?(\s+below)?mentioned\s+References?\s+link|"
-        r"software\s+it\s+fail|"
-        r"references\s+(advisor|link)|"
-        r"The\s+multiple\s+(vulnerabilit|flaw|error|problem|issue|feature)|"
-        r"(vulnerability|flaw|error|problem|issue|feature)\s+exist\s+|"
-        r"(vulnerabilitie|flaw|error|problem|issue|feature)s\s+exists|"
-        r"multiple\s+[^\s]+((and\s+)?[^\s]+)?\s+("
-        r"vulnerability|flaw|error|problem|issue|feature|request)(\.|\s+)|"
-        r"(\s+|^|\"|- )A\s+[^\s]*((and\s+)?[^\s]+\s+)?("
-        r"vulnerabilitie|flaw|error|problem|issue|feature|request)s|"
-        r"(\s+|^|\"|- )An?\+(unspecified|multiple|unknown)\s+("
-        r"vulnerabilitie|flaw|error|problem|issue)s|"
-        r"is\s+(prone|vulnerable|affected)\s+(to|by)\s+("
-        r"unspecified|XML\s+External\s+Entity|integer\s+(und|ov)erflow|"
-        r"DLL\s+hijacking|(hardcoded?|default)\s+credentials?|open[\s-]+"
-        r"redirect(ion)?|user\s+enumeration|arbitrary\s+file\s+read|memory"
-        r"\s+corruption|use[\s-]+after[\s-]+free|man[\s-]+in[\s-]+the[\s-]"
-        r"+middle(\s+attack)?|cross[\s-]+site[\s-]+(scripting(\s+\(XSS\))?"
-        r"|request[\s-]+forgery(\s+\(CSRF\))?)|denial[\s-]+of[\s-]+service"
-        r"|information\s+disclosure|(path|directory)\s+traversal|"
-        r"(arbitrary\s+|remote\s+)?((code|command)\s+(execution|injection)"
-        r"|file\s+inclusion)|SQL\s+injection|security|(local )?privilege"
-        r"[\s-]+(escalation|elevation)|(authentication|security|access)"
-        r"\s+bypass|(buffer|heap)\s+overflow)\s+vulnerability|"
-        # e.g.:
-        # "is prone a to denial of service (DoS) vulnerability"
-        # "is prone an information disclosure vulnerability"
-        r"\s+(is|are)\s+(prone|vulnerable|affected)\s+an?\s+|"
-        # e.g.:
-        # "Sends multiple HTTP request and checks the responses."
-        # "Sends multiple HTTP GET request and checks the responses."
-        r"multiple\s+([^ ]+\s+)?([^ ]+\s+)?request\s+|"
-        # nb: These are added here because codespell can only handle single
-        # words currently. Basically:
-        # cross-side scripting -> cross-site scripting
-        # cross-side request forgery -> cross-site request forgery
-        # server-site request forgery -> server-side request forgery
-        # server-site template injection -> server-side template injection
-        r"cross[\s-]+side[\s-]+(request[\s-]+forgery|scripting)|"
-        r"server[\s-]+site[\s-]+(request[\s-]+forgery|template)[\s-]+injection|"
-        # e.g.:
-        # Successful exploitation may allows an attacker to run arbitrary
-        # An error in INSTALL_JAR procedure might allows remote authenticated
-        r"(could|may|will|might|should|can)\s+allows\s+|"
-        # e.g.:
-        # - Inadequate checks in com_contact could allowed mail submission
-        r"(could|may|will|might|should|can)\s+allowed\s+|"
-        # e.g.:
-        # This allow an attacker to gain administrative access to the
-        r"This\s+allow\s+|"
-        # nb: Next few could happen when copy'n'paste some text parts around
-        # like e.g.:
-        # is prone to a to a remote denial-of-service vulnerability
-        # CVE-2022-31702: Command injection in the in the vRNI REST API
-        # MariaDB versions prior to prior to 10.3.32, 10.4.x prior to
-        # Update to update to version 1.2.3
-        # Update to version to version 1.2.3
-        r"in the in the|to an? to a|prior to prior to|to version to version|"
-        r"update to update to|"
-        # e.g.:
-        #
-        # MyProduct versions prior to version 1.2.3.
-        # MyProduct version prior to version 1.2.3.
-        #
-        # but NOT:
-        #
-        # Subversion prior to version 1.2.3.
-        r"\s+versions? prior to version|"
-        # e.g. "is prone to a security bypass vulnerabilities"
-        r"is\s+prone\s+to\s+an?\s+[^\s]+\s+([^\s]+\s+)?vulnerabilities).*",
-        re.IGNORECASE,
-    )
+    """The pattern matching the lines with a grammar problem in group 1"""
+    return compile_pattern(rf".*{GRAMMAR_PROBLEMS_PATTERN.pattern}.*", re.IGNORECASE)
 
 
 class CheckGrammar(FilePlugin):
@@ -224,24 +232,19 @@ class CheckGrammar(FilePlugin):
             file_content: The content of the file that is going to be
                           checked
         """
-        pattern = get_grammer_pattern()
-
-        for match in pattern.finditer(self.context.file_content):
-            if match:
-                # nb: No strip() here for so that the exclusions can be handled
-                # more strict with e.g. leading or trailing newlines.
-                full_line = match.group(0)
-
-                if handle_linguistic_checks(str(self.context.nasl_file), full_line, exceptions):
-                    continue
+        for full_line, hit in find_lines_with(GRAMMAR_PROBLEMS_PATTERN, self.context.file_content):
+            # nb: No strip() here for so that the exclusions can be handled
+            # more strict with e.g. leading or trailing newlines.
+            if exception_matcher.matches(str(self.context.nasl_file), full_line):
+                continue
 
-                stripped_line = full_line.strip()
-                stripped_hit = match.group(1).strip()
+            stripped_line = full_line.strip()
+            stripped_hit = hit.group().strip()
 
-                yield LinterError(
-                    "VT/Include has the following grammar problem:"
-                    f"\n- Hit: {stripped_hit}"
-                    f"\n- Full line: {stripped_line}",
-                    file=self.context.nasl_file,
-                    plugin=self.name,
-                )
+            yield LinterError(
+                "VT/Include has the following grammar problem:"
+                f"\n- Hit: {stripped_hit}"
+                f"\n- Full line: {stripped_line}",
+                file=self.context.nasl_file,
+                plugin=self.name,
+            )
@@ -22,8 +22,11 @@ from typing import AnyStr
 
 from troubadix.helper import SpecialScriptTag, get_common_tag_patterns
 from troubadix.helper.patterns import get_special_script_tag_pattern
+from troubadix.helper.text_utils import find_lines_with
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
+HTTP_LINK_PATTERN = re.compile(r"((http|ftp)s?://|(www|\s+ftp)\.)")
+
 
 class CheckHttpLinksInTags(FilePlugin):
     name = "check_http_links_in_tags"
@@ -52,30 +55,23 @@ class CheckHttpLinksInTags(FilePlugin):
                             checked
         """
 
-        file_content = self.context.file_content
         pattern = get_common_tag_patterns()
-        tag_matches: Iterator[re.Match] = pattern.finditer(file_content)
+        tag_matches: Iterator[re.Match] = pattern.finditer(self.context.description_block)
 
         for tag_match in tag_matches:
             if tag_match:
-                http_link_matches = re.finditer(
-                    r".*((http|ftp)s?://|(www|\s+ftp)\.).*",
-                    tag_match.group("value"),
-                )
-                if http_link_matches:
-                    for http_link_match in http_link_matches:
-                        if http_link_match:
-                            if self.check_to_continue(http_link_match.group(0)):
-                                continue
-
-                            yield LinterError(
-                                "One script_tag in the VT is using a HTTP "
-                                "link/URL which should be moved to a separate "
-                                '\'script_xref(name:"URL", value:"");\''
-                                f" tag instead: '{tag_match.group(0)}'",
-                                file=self.context.nasl_file,
-                                plugin=self.name,
-                            )
+                for line, _ in find_lines_with(HTTP_LINK_PATTERN, tag_match.group("value")):
+                    if self.check_to_continue(line):
+                        continue
+
+                    yield LinterError(
+                        "One script_tag in the VT is using a HTTP "
+                        "link/URL which should be moved to a separate "
+                        '\'script_xref(name:"URL", value:"");\''
+                        f" tag instead: '{tag_match.group(0)}'",
+                        file=self.context.nasl_file,
+                        plugin=self.name,
+                    )
 
     def contains_nvd_mitre_link_in_xref(self) -> Iterator[LinterResult]:
         """
@@ -95,9 +91,8 @@ class CheckHttpLinksInTags(FilePlugin):
                                 checked
         """
 
-        file_content = self.context.file_content
         pattern = get_special_script_tag_pattern(SpecialScriptTag.XREF)
-        tag_matches = pattern.finditer(file_content)
+        tag_matches = pattern.finditer(self.context.description_block)
 
         for match in tag_matches:
             if match:
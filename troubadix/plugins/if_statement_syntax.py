@@ -6,7 +6,6 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from troubadix.helper.if_block_parser import find_if_statements
-from troubadix.helper.remove_comments import remove_comments
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 
@@ -29,13 +28,12 @@ class CheckIfStatementSyntax(FileContentPlugin):
         file_content: str,
     ) -> Iterator[LinterResult]:
         """Check the file content for if statement syntax errors."""
-        # Remove comments to avoid false positives from commented code
-        comment_free_content = remove_comments(file_content)
-
-        result = find_if_statements(comment_free_content)
+        # the tokens don't contain comments, so commented code is ignored
+        result = find_if_statements(file_content, self.context.tokens)
         for error in result.errors:
             yield LinterError(
                 error.error_type.value.format(line=error.line),
                 file=nasl_file,
                 plugin=self.name,
+                line=error.line,
             )
@@ -1,23 +1,19 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # SPDX-FileCopyrightText: 2026 Greenbone AG
 
-import re
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper.remove_comments import remove_comments
+from troubadix.helper.tokenizer import Token, TokenType
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult, LinterWarning
 
 FN_CALL_EXPRESSION = "get_app_version_and_location"
 ALLOWED_KEYS = {"cpe", "port", "version", "location", "proto"}
 ALLOWED_VARS = {"infos"}
 
-# Matches variable assignments: var = get_app_version_and_location
-# Also matches: if (!var = get_app_version_and_location(...))
-ASSIGN_RE = re.compile(rf"(?P<var_name>\w+)\s*=\s*{FN_CALL_EXPRESSION}")
 
-# Matches array access: var[key]
-ACCESS_PATTERN = r"\b{var_name}\s*\[(?P<key>[^\]]+)\]"
+def _is_identifier(token: Token, name: str) -> bool:
+    return token.type is TokenType.IDENTIFIER and token.value == name
 
 
 class CheckInfosArrayKeys(FileContentPlugin):
@@ -28,14 +24,24 @@ class CheckInfosArrayKeys(FileContentPlugin):
         if nasl_file.name == "host_details.inc":
             return
 
-        clean_content = remove_comments(file_content)
+        tokens = self.context.tokens
 
-        if FN_CALL_EXPRESSION not in clean_content:
+        if not any(_is_identifier(token, FN_CALL_EXPRESSION) for token in tokens):
             return
 
         found_vars = set()
-        for match in ASSIGN_RE.finditer(clean_content):
-            var_name = match.group("var_name")
+        for i, token in enumerate(tokens):
+            # var = get_app_version_and_location
+            # also matches: if (!var = get_app_version_and_location(...))
+            if (
+                i < 2
+                or not _is_identifier(token, FN_CALL_EXPRESSION)
+                or not tokens[i - 1].is_punctuation("=")
+                or tokens[i - 2].type is not TokenType.IDENTIFIER
+            ):
+                continue
+
+            var_name = tokens[i - 2].value
             found_vars.add(var_name)
             if var_name not in ALLOWED_VARS:
                 yield LinterWarning(
@@ -54,15 +60,25 @@ class CheckInfosArrayKeys(FileContentPlugin):
             )
             return
 
-        for var_name in found_vars:
-            access_re = re.compile(ACCESS_PATTERN.format(var_name=var_name))
-            for match in access_re.finditer(clean_content):
-                key = match.group("key").strip(" \"'")
-
-                if key not in ALLOWED_KEYS:
-                    yield LinterError(
-                        f'Usage of {var_name} array with invalid key "{key}". '
-                        f"Allowed keys are: {', '.join(ALLOWED_KEYS)}.",
-                        file=nasl_file,
-                        plugin=self.name,
-                    )
+        for i, token in enumerate(tokens):
+            # var[key]
+            if (
+                token.type is not TokenType.IDENTIFIER
+                or token.value not in found_vars
+                or i + 1 >= len(tokens)
+                or not tokens[i + 1].is_punctuation("[")
+            ):
+                continue
+
+            closing = tokens.closing(i + 1)
+            if closing is None or closing == i + 2:
+                continue
+
+            key = file_content[tokens[i + 1].end : tokens[closing].start].strip(" \"'")
+            if key not in ALLOWED_KEYS:
+                yield LinterError(
+                    f'Usage of {token.value} array with invalid key "{key}". '
+                    f"Allowed keys are: {', '.join(ALLOWED_KEYS)}.",
+                    file=nasl_file,
+                    plugin=self.name,
+                )
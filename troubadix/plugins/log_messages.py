@@ -19,7 +19,6 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from troubadix.helper import ScriptTag
-from troubadix.helper.patterns import get_script_tag_pattern
 from troubadix.plugin import (
     FileContentPlugin,
     LinterError,
@@ -66,8 +65,7 @@ class CheckLogMessages(FileContentPlugin):
 
         # don't need to check detection scripts since they are for sure using
         # a log_message. all detection scripts have a cvss of 0.0
-        cvss_pattern = get_script_tag_pattern(ScriptTag.CVSS_BASE)
-        cvss_detect = cvss_pattern.search(file_content)
+        cvss_detect = self.context.script_tags.search(ScriptTag.CVSS_BASE)
 
         if cvss_detect and cvss_detect.group("value") == "0.0":
             return
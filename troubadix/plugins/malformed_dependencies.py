@@ -20,9 +20,12 @@
 import re
 from collections.abc import Iterator
 
-from troubadix.helper.patterns import _get_special_script_tag_pattern
+from troubadix.helper.patterns import SpecialScriptTag, _get_special_script_tag_pattern
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
+DEPENDENCIES_PATTERN = _get_special_script_tag_pattern(
+    SpecialScriptTag.DEPENDENCIES.value, flags=re.DOTALL | re.MULTILINE
+)
 DEPENDENCY_ENTRY_PATTERN = re.compile(r'(?P<quote>[\'"])(?P<value>[^\'"]*)(?P=quote)')
 WHITESPACE_PATTERN = re.compile(r"\s")
 
@@ -41,14 +44,10 @@ class CheckMalformedDependencies(FilePlugin):
         if self.context.nasl_file.suffix == ".inc":
             return
 
-        dependencies_pattern = _get_special_script_tag_pattern(
-            "dependencies", flags=re.DOTALL | re.MULTILINE
+        matches = self.context.script_tags.finditer(
+            SpecialScriptTag.DEPENDENCIES, DEPENDENCIES_PATTERN
         )
 
-        file_content = self.context.file_content
-
-        matches = dependencies_pattern.finditer(file_content)
-
         for match in matches:
             if not match:
                 continue
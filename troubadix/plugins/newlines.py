@@ -20,6 +20,22 @@ from collections.abc import Iterator
 
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
+TAGS = ["name", "copyright"]
+
+WHITESPACES_PATTERNS = {
+    tag: re.compile(
+        rf'script_{tag}(?P<w1>\s*)\((?P<w2>\s*)(?P<quote>[\'"])'
+        r"?.+?(?P=quote)?(?P<w3>\s*)\)(?P<w4>\s*);"
+    )
+    for tag in TAGS
+}
+NEWLINE_PATTERNS = {
+    tag: re.compile(
+        rf'(script_{tag}\((?P<quote>[\'"])[^\'"\n;]*)[\n]+\s*' r'([^\'"\n;]*(?P=quote)\);)'
+    )
+    for tag in TAGS
+}
+
 
 class CheckNewlines(FilePlugin):
     name = "check_wrong_newlines"
@@ -31,8 +47,8 @@ class CheckNewlines(FilePlugin):
         - Search for (\r or \r\n).
         - Search for whitespaces in script_name( "myname") or script_copyright
         """
-        # Need to be loaded as bytes or \r is converted to \n
-        data = self.context.nasl_file.read_bytes()
+        # Need to be checked as bytes or \r is converted to \n
+        data = self.context.file_bytes
         if b"\r" in data or b"\r\n" in data:
             yield LinterError("Found \\r or \\r\\n newline.")
 
@@ -41,12 +57,8 @@ class CheckNewlines(FilePlugin):
         # A few remaining have script_name( "myname") instead of
         # script_name("myname").
         # NEW: Remove whitespaces and newlines in script_name, script_copyright
-        for tag in ["name", "copyright"]:
-            whitespaces_match = re.search(
-                rf'script_{tag}(?P<w1>\s*)\((?P<w2>\s*)(?P<quote>[\'"])'
-                r"?.+?(?P=quote)?(?P<w3>\s*)\)(?P<w4>\s*);",
-                file_content,
-            )
+        for tag in TAGS:
+            whitespaces_match = WHITESPACES_PATTERNS[tag].search(file_content)
             if whitespaces_match:
                 for i in range(1, 5):
                     if whitespaces_match.group(f"w{i}") != "":
@@ -57,10 +69,7 @@ class CheckNewlines(FilePlugin):
                         )
                         break
 
-            newline_match = re.search(
-                rf'(script_{tag}\((?P<quote>[\'"])[^\'"\n;]*)[\n]+\s*' r'([^\'"\n;]*(?P=quote)\);)',
-                file_content,
-            )
+            newline_match = NEWLINE_PATTERNS[tag].search(file_content)
             if newline_match:
                 yield LinterError(
                     f"Found a newline within the tag script_{tag}.",
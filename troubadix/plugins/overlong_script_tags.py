@@ -6,7 +6,7 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from troubadix.helper import is_ignore_file
-from troubadix.helper.patterns import get_script_tag_patterns
+from troubadix.helper.patterns import ScriptTag
 
 from ..plugin import FileContentPlugin, LinterError, LinterResult
 
@@ -52,9 +52,8 @@ class CheckOverlongScriptTags(FileContentPlugin):
         if is_ignore_file(nasl_file, IGNORE_FILES):
             return
 
-        script_tag_patterns = get_script_tag_patterns()
-        for tag, pattern in script_tag_patterns.items():
-            for match in pattern.finditer(file_content):
+        for tag in ScriptTag:
+            for match in self.context.script_tags.finditer(tag):
                 if len(match.group("value")) > VALUE_LIMIT:
                     yield LinterError(
                         f"Tag {tag.value} is to long"
@@ -62,4 +61,5 @@ class CheckOverlongScriptTags(FileContentPlugin):
                         f"Max {VALUE_LIMIT}",
                         file=nasl_file,
                         plugin=self.name,
+                        line=self.context.line_index.line(match.start()),
                     )
@@ -18,10 +18,7 @@ import re
 from collections.abc import Iterator
 
 from troubadix.helper import ScriptTag, SpecialScriptTag, is_ignore_file
-from troubadix.helper.patterns import (
-    _get_special_script_tag_pattern,
-    get_script_tag_pattern,
-)
+from troubadix.helper.patterns import _get_special_script_tag_pattern
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
 IGNORE_FILES = []
@@ -64,17 +61,20 @@ class CheckProdSvcDetectInVulnvt(FilePlugin):
             return
 
         file_content = self.context.file_content
+        script_tags = self.context.script_tags
         # Don't need to check VTs having a cvss of 0.0
-        cvss_base_pattern = get_script_tag_pattern(ScriptTag.CVSS_BASE)
-        cvss_detect = cvss_base_pattern.search(file_content)
+        cvss_detect = script_tags.search(ScriptTag.CVSS_BASE)
 
         if cvss_detect is not None and cvss_detect.group("value") == "0.0":
             return
 
-        match_family = _get_special_script_tag_pattern(
-            name=SpecialScriptTag.FAMILY.value,
-            value=r"(Product|Service) detection",
-        ).search(file_content)
+        match_family = script_tags.search(
+            SpecialScriptTag.FAMILY,
+            _get_special_script_tag_pattern(
+                name=SpecialScriptTag.FAMILY.value,
+                value=r"(Product|Service) detection",
+            ),
+        )
         if match_family and match_family.group("value"):
             yield LinterError(
                 "VT has a severity but is placed in the family '"
@@ -18,7 +18,7 @@
 import re
 from collections.abc import Iterator
 
-from troubadix.helper.patterns import ScriptTag, get_script_tag_pattern
+from troubadix.helper.patterns import ScriptTag
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
 VALID_QOD_NUM_VALUES = [
@@ -75,10 +75,8 @@ class CheckQod(FilePlugin):
         if "# troubadix: disable=template_nd_test_files_fps" in file_content:
             return
 
-        qod_type_pattern = get_script_tag_pattern(ScriptTag.QOD_TYPE)
-
         match_qod = list(QOD_WITH_QUOTES_PATTERN.finditer(file_content))
-        match_qod_type = list(qod_type_pattern.finditer(file_content))
+        match_qod_type = list(self.context.script_tags.finditer(ScriptTag.QOD_TYPE))
 
         num_matches = len(match_qod) + len(match_qod_type)
         if num_matches < 1:
@@ -109,12 +107,14 @@ class CheckQod(FilePlugin):
                         f" {', '.join(x for x in VALID_QOD_NUM_VALUES)}",
                         file=self.context.nasl_file,
                         plugin=self.name,
+                        line=self.context.line_index.line(match.start()),
                     )
             else:
                 yield LinterError(
                     f"QOD value not properly enclosed in double quotes in {full_match}",
                     file=self.context.nasl_file,
                     plugin=self.name,
+                    line=self.context.line_index.line(match.start()),
                 )
 
         for match in match_qod_type:
@@ -125,4 +125,5 @@ class CheckQod(FilePlugin):
                     f" QoD type. Allowed are {', '.join(VALID_QOD_TYPES)}",
                     file=self.context.nasl_file,
                     plugin=self.name,
+                    line=self.context.line_index.line(match.start()),
                 )
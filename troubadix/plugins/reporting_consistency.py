@@ -20,7 +20,7 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from troubadix.helper import is_ignore_file
-from troubadix.helper.patterns import ScriptTag, get_script_tag_pattern
+from troubadix.helper.patterns import ScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 # nb: Those are files which are correctly using a log_message() to do e.g. some
@@ -83,8 +83,7 @@ class CheckReportingConsistency(FileContentPlugin):
             re.MULTILINE | re.DOTALL,
         ).search(file_content)
 
-        cvss_base_pattern = get_script_tag_pattern(ScriptTag.CVSS_BASE)
-        cvss_base = cvss_base_pattern.search(file_content)
+        cvss_base = self.context.script_tags.search(ScriptTag.CVSS_BASE)
 
         if not cvss_base:
             yield LinterError(
@@ -74,7 +74,7 @@ class CheckScriptAddPreferenceType(FileContentPlugin):
         # Primary regex to capture all script_add_preference calls
         preferences_matches = _get_special_script_tag_pattern(
             name=SpecialScriptTag.ADD_PREFERENCE.value,
-        ).finditer(file_content)
+        ).finditer(self.context.description_block)
 
         # Secondary regex to extract type from the captured value (parameter list)
         for preferences_match in preferences_matches:
@@ -47,7 +47,8 @@ class CheckScriptCallsEmptyValues(FileContentPlugin):
         ):
             return
 
-        matches = _get_tag_pattern(name=r".*", value=r"").finditer(file_content)
+        description_block = self.context.description_block
+        matches = _get_tag_pattern(name=r".*", value=r"").finditer(description_block)
         for match in matches:
             yield LinterError(
                 f"{match.group(0)} does not contain a value",
@@ -55,7 +56,7 @@ class CheckScriptCallsEmptyValues(FileContentPlugin):
                 plugin=self.name,
             )
 
-        matches = get_xref_pattern(name=r".*", value=r"").finditer(file_content)
+        matches = get_xref_pattern(name=r".*", value=r"").finditer(description_block)
         for match in matches:
             yield LinterError(
                 f"{match.group(0)} does not contain a value",
@@ -65,7 +66,7 @@ class CheckScriptCallsEmptyValues(FileContentPlugin):
 
         for call in SPECIAL_SCRIPT_TAG_LIST:
             matches = _get_special_script_tag_pattern(name=call.value, value="").finditer(
-                file_content
+                description_block
             )
             for match in matches:
                 yield LinterError(
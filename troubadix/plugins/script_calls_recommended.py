@@ -20,11 +20,30 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from troubadix.helper.patterns import (
+    ScriptTag,
+    SpecialScriptTag,
     _get_special_script_tag_pattern,
     _get_tag_pattern,
 )
 from troubadix.plugin import FileContentPlugin, LinterResult, LinterWarning
 
+EXCLUDED_CATEGORY_PATTERN = _get_special_script_tag_pattern(
+    name=SpecialScriptTag.CATEGORY.value, value=r"ACT_(SETTINGS|SCANNER|INIT)"
+)
+DEPRECATED_PATTERN = _get_tag_pattern(name=ScriptTag.DEPRECATED.value, value=r"TRUE")
+
+RECOMMENDED_SINGLE_CALL = [SpecialScriptTag.DEPENDENCIES]
+RECOMMENDED_MANY_CALL = [
+    SpecialScriptTag.REQUIRE_PORTS,
+    SpecialScriptTag.REQUIRE_UDP_PORTS,
+    SpecialScriptTag.REQUIRE_KEYS,
+    SpecialScriptTag.MANDATORY_KEYS,
+]
+RECOMMENDED_CALL_PATTERNS = {
+    call: _get_special_script_tag_pattern(name=call.value, value=r".*?", flags=re.DOTALL)
+    for call in RECOMMENDED_SINGLE_CALL + RECOMMENDED_MANY_CALL
+}
+
 
 class CheckScriptCallsRecommended(FileContentPlugin):
     name = "check_script_calls_recommended"
@@ -55,38 +74,26 @@ class CheckScriptCallsRecommended(FileContentPlugin):
         ):
             return
 
-        if _get_special_script_tag_pattern(
-            name=r"category", value=r"ACT_(SETTINGS|SCANNER|INIT)"
-        ).search(file_content) or _get_tag_pattern(name=r"deprecated", value=r"TRUE").search(
-            file_content
-        ):
+        script_tags = self.context.script_tags
+        if script_tags.search(
+            SpecialScriptTag.CATEGORY, EXCLUDED_CATEGORY_PATTERN
+        ) or script_tags.search(ScriptTag.DEPRECATED, DEPRECATED_PATTERN):
             return
 
-        recommended_single_call = [r"dependencies"]
-        recommended_many_call = [
-            r"require_ports",
-            r"require_udp_ports",
-            r"require_keys",
-            r"mandatory_keys",
-        ]
-
-        if not _get_special_script_tag_pattern(
-            name=rf"({'|'.join(recommended_many_call)})",
-            value=".*?",
-            flags=re.DOTALL,
-        ).search(file_content):
+        if not any(
+            script_tags.search(call, RECOMMENDED_CALL_PATTERNS[call])
+            for call in RECOMMENDED_MANY_CALL
+        ):
             yield LinterWarning(
                 "VT contains none of the following recommended calls: "
-                f"{', '.join(recommended_many_call)}",
+                f"{', '.join(call.value for call in RECOMMENDED_MANY_CALL)}",
                 file=nasl_file,
                 plugin=self.name,
             )
-        for call in recommended_single_call:
-            if not _get_special_script_tag_pattern(name=call, value=".*", flags=re.DOTALL).search(
-                file_content
-            ):
+        for call in RECOMMENDED_SINGLE_CALL:
+            if not script_tags.search(call, RECOMMENDED_CALL_PATTERNS[call]):
                 yield LinterWarning(
-                    f"VT does not contain the following recommended call: 'script_{call}'",
+                    f"VT does not contain the following recommended call: 'script_{call.value}'",
                     file=nasl_file,
                     plugin=self.name,
                 )
@@ -18,10 +18,7 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper.patterns import (
-    SpecialScriptTag,
-    get_special_script_tag_pattern,
-)
+from troubadix.helper.patterns import SpecialScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 VALID_FAMILIES = [
@@ -109,8 +106,7 @@ class CheckScriptFamily(FileContentPlugin):
         ):
             return
 
-        family_pattern = get_special_script_tag_pattern(SpecialScriptTag.FAMILY)
-        matches = list(family_pattern.finditer(file_content))
+        matches = list(self.context.script_tags.finditer(SpecialScriptTag.FAMILY))
 
         if not matches:
             yield LinterError(
@@ -125,6 +121,7 @@ class CheckScriptFamily(FileContentPlugin):
                 "More then one script family exist",
                 file=nasl_file,
                 plugin=self.name,
+                line=self.context.line_index.line(matches[1].start()),
             )
             return
 
@@ -133,4 +130,5 @@ class CheckScriptFamily(FileContentPlugin):
                 f"Invalid or misspelled script family '{matches[0].group('value')}'",
                 file=nasl_file,
                 plugin=self.name,
+                line=self.context.line_index.line(matches[0].start()),
             )
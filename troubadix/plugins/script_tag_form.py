@@ -37,7 +37,7 @@ class CheckScriptTagForm(FileContentPlugin):
         if nasl_file.suffix == ".inc":
             return
 
-        matches = re.finditer(r"script_tag\(.*\);", file_content)
+        matches = re.finditer(r"script_tag\(.*\);", self.context.description_block)
         for match in matches:
             if match:
                 if not _get_tag_pattern(name=r".*", value=r".*").match(match.group(0)):
@@ -28,6 +28,13 @@ from troubadix.helper.patterns import (
 )
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
+# The name and a quoted value end at the first closing quote, an unquoted
+# value at the first quote. Unlike ".+?" they can't reach past the end of
+# an unterminated call into the following ones, which backtracked for
+# minutes on files with many of them.
+_NAME = r"(?:(?!(?P=quote)).)+"
+_VALUE = r"(?(quote2)(?:(?!(?P=quote2)).)+|[^'\"]+?)"
+
 
 class CheckScriptTagWhitespaces(FileContentPlugin):
     name = "check_script_tag_whitespaces"
@@ -44,13 +51,18 @@ class CheckScriptTagWhitespaces(FileContentPlugin):
         if nasl_file.suffix == ".inc":
             return
 
-        tag_matches = _get_tag_pattern(name=r".+?", flags=re.DOTALL).finditer(file_content)
+        description_block = self.context.description_block
+        tag_matches = _get_tag_pattern(name=_NAME, value=_VALUE, flags=re.DOTALL).finditer(
+            description_block
+        )
 
         name_matches = _get_special_script_tag_pattern(name=SpecialScriptTag.NAME.value).finditer(
-            file_content
+            description_block
         )
 
-        xref_matches = get_xref_pattern(name=r".+?", flags=re.DOTALL).finditer(file_content)
+        xref_matches = get_xref_pattern(name=_NAME, value=_VALUE, flags=re.DOTALL).finditer(
+            description_block
+        )
 
         matches = chain(tag_matches, name_matches, xref_matches)
 
@@ -18,12 +18,7 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper.patterns import (
-    ScriptTag,
-    SpecialScriptTag,
-    get_script_tag_pattern,
-    get_special_script_tag_pattern,
-)
+from troubadix.helper.patterns import ScriptTag, SpecialScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 MANDATORY_TAGS = [
@@ -66,8 +61,9 @@ class CheckScriptTagsMandatory(FileContentPlugin):
         ):
             return
 
+        script_tags = self.context.script_tags
         for tag in MANDATORY_TAGS:
-            if not get_script_tag_pattern(tag).search(file_content):
+            if not script_tags.search(tag):
                 yield LinterError(
                     f"VT does not contain the following mandatory tag: 'script_{tag.value}'",
                     file=nasl_file,
@@ -75,7 +71,7 @@ class CheckScriptTagsMandatory(FileContentPlugin):
                 )
 
         for special_tag in MANDATORY_SPECIAL_TAGS:
-            if not get_special_script_tag_pattern(special_tag).search(file_content):
+            if not script_tags.search(special_tag):
                 yield LinterError(
                     "VT does not contain the following mandatory tag: "
                     f"'script_{special_tag.value}'",
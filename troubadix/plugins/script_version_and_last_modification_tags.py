@@ -26,8 +26,6 @@ from troubadix.helper.patterns import (
     SCRIPT_VERSION_ANY_VALUE_PATTERN,
     ScriptTag,
     SpecialScriptTag,
-    get_script_tag_pattern,
-    get_special_script_tag_pattern,
 )
 from troubadix.plugin import (
     FileContentPlugin,
@@ -38,6 +36,9 @@ from troubadix.plugin import (
 
 VERSION_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
+_SCRIPT_VERSION_ANY_VALUE_PATTERN = re.compile(SCRIPT_VERSION_ANY_VALUE_PATTERN)
+_LAST_MODIFICATION_ANY_VALUE_PATTERN = re.compile(LAST_MODIFICATION_ANY_VALUE_PATTERN)
+
 
 class CheckScriptVersionAndLastModificationTags(FileContentPlugin):
     name = "check_script_version_and_last_modification_tags"
@@ -68,9 +69,9 @@ class CheckScriptVersionAndLastModificationTags(FileContentPlugin):
 
         self.fix_last_modification_and_version = False
 
-        match_script_version_any = re.search(
-            pattern=SCRIPT_VERSION_ANY_VALUE_PATTERN,
-            string=file_content,
+        script_tags = self.context.script_tags
+        match_script_version_any = script_tags.search(
+            SpecialScriptTag.VERSION, _SCRIPT_VERSION_ANY_VALUE_PATTERN
         )
         if not match_script_version_any:
             yield LinterError(
@@ -84,8 +85,7 @@ class CheckScriptVersionAndLastModificationTags(FileContentPlugin):
         self.old_script_version_value = match_script_version_any.group("value")
 
         # script_version("2019-03-21T12:19:01+0000");")
-        version_pattern = get_special_script_tag_pattern(SpecialScriptTag.VERSION)
-        version_match = version_pattern.search(file_content)
+        version_match = script_tags.search(SpecialScriptTag.VERSION)
 
         if not version_match:
             self.fix_last_modification_and_version = True
@@ -105,9 +105,8 @@ class CheckScriptVersionAndLastModificationTags(FileContentPlugin):
                     plugin=self.name,
                 )
 
-        match_last_modification_any_value = re.search(
-            pattern=LAST_MODIFICATION_ANY_VALUE_PATTERN,
-            string=file_content,
+        match_last_modification_any_value = script_tags.search(
+            ScriptTag.LAST_MODIFICATION, _LAST_MODIFICATION_ANY_VALUE_PATTERN
         )
 
         if not match_last_modification_any_value:
@@ -124,8 +123,7 @@ class CheckScriptVersionAndLastModificationTags(FileContentPlugin):
 
         # script_tag(name:"last_modification",
         # value:"2019-03-21 12:19:01 +0000 (Thu, 21 Mar 2019)");
-        last_modification_pattern = get_script_tag_pattern(ScriptTag.LAST_MODIFICATION)
-        match_last_modified = last_modification_pattern.search(file_content)
+        match_last_modified = script_tags.search(ScriptTag.LAST_MODIFICATION)
 
         if not match_last_modified:
             self.fix_last_modification_and_version = True
@@ -37,7 +37,7 @@ class CheckScriptXrefForm(FileContentPlugin):
         if nasl_file.suffix == ".inc":
             return
 
-        matches = re.finditer(r"script_xref\(.*\);", file_content)
+        matches = re.finditer(r"script_xref\(.*\);", self.context.description_block)
         if matches:
             for match in matches:
                 if match:
@@ -60,7 +60,9 @@ class CheckScriptXrefUrl(FileContentPlugin):
         if nasl_file.suffix == ".inc":
             return
 
-        matches = get_xref_pattern(name="URL", value=r".+?").finditer(file_content)
+        matches = get_xref_pattern(name="URL", value=r".+?").finditer(
+            self.context.description_block
+        )
         for match in matches:
             if match:
                 url_value = match.group("value")
@@ -17,7 +17,7 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper.patterns import ScriptTag, get_script_tag_pattern
+from troubadix.helper.patterns import ScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 SECURITY_MESSAGE_IMPLEMENTATIONS = [
@@ -53,8 +53,7 @@ class CheckSecurityMessages(FileContentPlugin):
             nasl_file (Path): The VTs path
             file_content (str): The content of the VT
         """
-        deprecated_pattern = get_script_tag_pattern(script_tag=ScriptTag.DEPRECATED)
-        if deprecated_pattern.search(file_content):
+        if self.context.script_tags.search(ScriptTag.DEPRECATED):
             return
 
         if not _file_contains_security_message(file_content):
@@ -93,8 +92,7 @@ class CheckSecurityMessages(FileContentPlugin):
         Args:
             file_content (str): The content of the VT
         """
-        cvss_base_pattern = get_script_tag_pattern(ScriptTag.CVSS_BASE)
-        cvss_detect = cvss_base_pattern.search(file_content)
+        cvss_detect = self.context.script_tags.search(ScriptTag.CVSS_BASE)
 
         return cvss_detect and cvss_detect.group("value") != "0.0"
 
@@ -14,11 +14,15 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
-import re
 from collections.abc import Iterator
 
+from troubadix.helper.tokenizer import TokenType
 from troubadix.plugin import FilePlugin, LinterError, LinterResult
 
+SET_FUNCTIONS = {"set_kb_item", "replace_kb_item"}
+GET_FUNCTIONS = {"get_kb_item", "get_kb_list"}
+PARAMETERS = {"name", "value"}
+
 
 class CheckWrongSetGetKBCalls(FilePlugin):
     name = "check_set_get_kb_calls"
@@ -42,42 +46,46 @@ class CheckWrongSetGetKBCalls(FilePlugin):
         - replace_kb_item(name:"kb/key", name:"kb/key");
         - get_kb_item(name:"kb/key");
 
-        Args:
-            nasl_file: The VT/Include that is going to be checked
-            file_content: The content of the nasl_file
-
         """
-        file_content = self.context.file_content
-        param_re = re.compile(r"(name|value) ?:")
+        tokens = self.context.tokens
+
+        for i, token in enumerate(tokens):
+            if (
+                token.type is not TokenType.IDENTIFIER
+                or token.value not in SET_FUNCTIONS | GET_FUNCTIONS
+                or i + 1 >= len(tokens)
+                or not tokens[i + 1].is_punctuation("(")
+            ):
+                continue
+
+            closing = tokens.closing(i + 1)
+            if (
+                closing is None
+                or closing + 1 >= len(tokens)
+                or not tokens[closing + 1].is_punctuation(";")
+            ):
+                continue
 
-        set_matches = re.finditer(
-            r"(set|replace)_kb_item\s*\(([^)]+)\)\s*;",
-            file_content,
-            re.MULTILINE,
-        )
-        if set_matches is not None:
-            for set_match in set_matches:
-                if set_match is not None and set_match.group(2) is not None:
-                    set_param_match = re.findall(param_re, set_match.group(2))
-                    if not set_param_match or len(set_param_match) != 2:
-                        yield LinterError(
-                            "The VT/Include is missing a 'name:' and/or "
-                            f"'value:' parameter: {set_match.group(0)}",
-                            file=self.context.nasl_file,
-                            plugin=self.name,
-                        )
+            call = tokens.text(i, closing + 1)
+            params = [
+                argument
+                for argument in tokens.arguments(i + 1)
+                if len(argument) > 1
+                and argument[0].type is TokenType.IDENTIFIER
+                and argument[0].value in PARAMETERS
+                and argument[1].is_punctuation(":")
+            ]
 
-        get_matches = re.finditer(
-            r"get_kb_(item|list)\s*\(([^)]+)\)\s*;", file_content, re.MULTILINE
-        )
-        if get_matches is not None:
-            for get_match in get_matches:
-                if get_match is not None and get_match.group(2) is not None:
-                    get_param_match = re.findall(param_re, get_match.group(2))
-                    if get_param_match and len(get_param_match) > 0:
-                        yield LinterError(
-                            "The VT/Include is using a non-existent 'name:' "
-                            f"and/or 'value:' parameter: {get_match.group(0)}",
-                            file=self.context.nasl_file,
-                            plugin=self.name,
-                        )
+            if token.value in SET_FUNCTIONS and len(params) != 2:
+                yield LinterError(
+                    "The VT/Include is missing a 'name:' and/or " f"'value:' parameter: {call}",
+                    file=self.context.nasl_file,
+                    plugin=self.name,
+                )
+            elif token.value in GET_FUNCTIONS and params:
+                yield LinterError(
+                    "The VT/Include is using a non-existent 'name:' "
+                    f"and/or 'value:' parameter: {call}",
+                    file=self.context.nasl_file,
+                    plugin=self.name,
+                )
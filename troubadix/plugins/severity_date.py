@@ -4,7 +4,7 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper import ScriptTag, get_script_tag_pattern
+from troubadix.helper import ScriptTag
 from troubadix.helper.date_format import (
     check_date,
     compare_date_with_last_modification_date,
@@ -23,10 +23,9 @@ class CheckSeverityDate(FileContentPlugin):
         if nasl_file.suffix == ".inc":
             return
 
-        severity_date_pattern = get_script_tag_pattern(ScriptTag.SEVERITY_DATE)
-        last_modification_pattern = get_script_tag_pattern(ScriptTag.LAST_MODIFICATION)
+        script_tags = self.context.script_tags
 
-        if not (match_severity_date := severity_date_pattern.search(file_content)):
+        if not (match_severity_date := script_tags.search(ScriptTag.SEVERITY_DATE)):
             return
 
         yield from check_date(
@@ -36,7 +35,7 @@ class CheckSeverityDate(FileContentPlugin):
             self.name,
         )
 
-        if match_last_mod_date := last_modification_pattern.search(file_content):
+        if match_last_mod_date := script_tags.search(ScriptTag.LAST_MODIFICATION):
             yield from compare_date_with_last_modification_date(
                 match_severity_date.group("value"),
                 "severity_date",
@@ -4,7 +4,7 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper import ScriptTag, get_script_tag_pattern
+from troubadix.helper import ScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 
@@ -19,9 +19,7 @@ class CheckSeverityFormat(FileContentPlugin):
         if nasl_file.suffix == ".inc" or "severity_vector" not in file_content:
             return
 
-        severity_vector_pattern = get_script_tag_pattern(ScriptTag.SEVERITY_VECTOR)
-
-        severity_vector_match = severity_vector_pattern.search(file_content)
+        severity_vector_match = self.context.script_tags.search(ScriptTag.SEVERITY_VECTOR)
         if not severity_vector_match:
             yield LinterError(
                 "VT has an invalid severity_vector value.",
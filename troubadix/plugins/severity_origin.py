@@ -4,7 +4,7 @@
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper import ScriptTag, get_script_tag_pattern
+from troubadix.helper import ScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 
@@ -19,9 +19,7 @@ class CheckSeverityOrigin(FileContentPlugin):
         if nasl_file.suffix == ".inc" or "severity_origin" not in file_content:
             return
 
-        severity_origin_pattern = get_script_tag_pattern(ScriptTag.SEVERITY_ORIGIN)
-
-        severity_origin_match = severity_origin_pattern.search(file_content)
+        severity_origin_match = self.context.script_tags.search(ScriptTag.SEVERITY_ORIGIN)
         if not severity_origin_match:
             yield LinterError(
                 "VT has an invalid severity_origin value.",
@@ -98,8 +98,11 @@ class CheckSolutionText(FilePlugin):
         )
         file_content = self.context.file_content
 
-        if _get_tag_pattern(name=ScriptTag.SOLUTION_TYPE.value, value="NoneAvailable").search(
-            file_content
+        script_tags = self.context.script_tags
+
+        if script_tags.search(
+            ScriptTag.SOLUTION_TYPE,
+            _get_tag_pattern(name=ScriptTag.SOLUTION_TYPE.value, value="NoneAvailable"),
         ) and not re.search(correct_none_available_pattern, file_content):
             yield LinterError(
                 "The VT with solution type 'NoneAvailable' is using an "
@@ -108,8 +111,9 @@ class CheckSolutionText(FilePlugin):
                 file=self.context.nasl_file,
                 plugin=self.name,
             )
-        elif _get_tag_pattern(name=ScriptTag.SOLUTION_TYPE.value, value="WillNotFix").search(
-            file_content
+        elif script_tags.search(
+            ScriptTag.SOLUTION_TYPE,
+            _get_tag_pattern(name=ScriptTag.SOLUTION_TYPE.value, value="WillNotFix"),
         ) and not re.search(correct_will_not_fix_pattern, file_content):
             yield LinterError(
                 "The VT with solution type 'WillNotFix' is using an incorrect "
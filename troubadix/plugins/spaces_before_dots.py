@@ -6,10 +6,7 @@ from pathlib import Path
 
 from troubadix.helper import CURRENT_ENCODING
 from troubadix.helper.helper import is_ignore_file
-from troubadix.helper.patterns import (
-    ScriptTag,
-    get_script_tag_pattern,
-)
+from troubadix.helper.patterns import ScriptTag
 from troubadix.plugin import (
     FileContentPlugin,
     LinterFix,
@@ -80,8 +77,7 @@ class CheckSpacesBeforeDots(FileContentPlugin):
         if nasl_file.suffix == ".inc" or is_ignore_file(nasl_file, IGNORE):
             return
         for tag in TAGS:
-            pattern = get_script_tag_pattern(tag)
-            match = pattern.search(file_content)
+            match = self.context.script_tags.search(tag)
             if not match:
                 continue
 
@@ -15,28 +15,30 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import io
 import re
-from collections.abc import Iterator
-from contextlib import redirect_stdout
+import traceback
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-from codespell_lib import main as codespell_main
-
 from troubadix.helper.linguistic_exception_handler import (
+    LinguisticExceptionMatcher,
     PatternInFileCheck,
     PatternInFilePatternCheck,
     PatternInFilesCheck,
     PatternsCheck,
     PatternsInFileCheck,
     PatternsInFilePatternCheck,
-    handle_linguistic_checks,
 )
-from troubadix.plugin import FilesPlugin, LinterError, LinterResult
+from troubadix.helper.spell_checker import get_spell_checker
+from troubadix.plugin import FilesPlugin, FilesPluginContext, LinterError, LinterResult
 
 plugin_path = Path(__file__).parent.resolve()
 codespell_config_path = (plugin_path.parent / "codespell").resolve()
 
+# codespell used to check the files in batches of this size and to report
+# the files of a batch sorted by their path, which is kept for the results
+BATCH_SIZE = 10_000
+
 
 exceptions = [
     # From /Policy which is just a huge blob of text
@@ -167,20 +169,54 @@ exceptions = [
     ),
 ]
 
+exception_matcher = LinguisticExceptionMatcher(exceptions)
+
+
+def _codespell_file(name: str) -> Path:
+    """The codespell file of the local repository if it exists, the one of
+    troubadix otherwise"""
+    local_file = Path(name)
+    if local_file.exists():
+        return local_file.resolve()
+    return codespell_config_path / name
 
-class CheckSpelling(FilesPlugin):
-    name = "check_spelling"
 
-    def _parse_codespell_line(self, line: str) -> tuple[str, str]:
-        if "==>" not in line:
-            raise ValueError("Invalid codespell line")
+def _sorted_batches(nasl_files: Iterable[Path]) -> list[list[Path]]:
+    """The files in batches sorted by their path, the order of the files
+    reported by the former codespell runs per batch"""
+    nasl_files = list(nasl_files)
+    return [
+        sorted(nasl_files[i : i + BATCH_SIZE], key=str)
+        for i in range(0, len(nasl_files), BATCH_SIZE)
+    ]
 
-        file, _, correction = line.split(":")
 
-        return file, correction.strip()
+class CheckSpelling(FilesPlugin):
+    name = "check_spelling"
+
+    @classmethod
+    def split(cls, context: FilesPluginContext, parts: int) -> list[FilesPluginContext]:
+        """Split the files into slices of about the same size. The slices
+        are taken from the sorted batches, to merge into the same results as
+        for all files at once."""
+        batches = _sorted_batches(context.nasl_files)
+        parts_per_batch = -(-parts // len(batches)) if batches else 1
+
+        contexts = []
+        for batch in batches:
+            size = -(-len(batch) // parts_per_batch)
+            contexts.extend(
+                FilesPluginContext(
+                    root=context.root,
+                    nasl_files=batch[i : i + size],
+                    content_store=context.content_store,
+                )
+                for i in range(0, len(batch), size)
+            )
+        return contexts or [context]
 
     def run(self) -> Iterator[LinterResult]:
-        """This script checks, via the codespell library, whether
+        """This script checks, via the dictionaries of codespell, whether
         the provided nasl files contain spelling errors.
         Certain errors are ignored based on listed exceptions
 
@@ -189,57 +225,26 @@ class CheckSpelling(FilesPlugin):
         """
 
         # Overwrite with local repository files if exist
-        if Path("codespell.additions").exists():
-            codespell_additions = Path("codespell.additions").resolve()
-        else:
-            codespell_additions = f"{codespell_config_path}/codespell.additions"
-        if Path("codespell.exclude").exists():
-            codespell_exclude = Path("codespell.exclude").resolve()
-        else:
-            codespell_exclude = f"{codespell_config_path}/codespell.exclude"
-        if Path("codespell.ignore").exists():
-            codespell_ignore = Path("codespell.ignore").resolve()
-        else:
-            codespell_ignore = f"{codespell_config_path}/codespell.ignore"
-
-        batch_size = 10_000
-        for i in range(0, len(self.context.nasl_files), batch_size):
-            files_parameters = [
-                str(nasl_file) for nasl_file in self.context.nasl_files[i : i + batch_size]
-            ]
-            codespell_arguments = [
-                "--quiet-level=1",
-                "--dictionary=-",
-                f"--dictionary={codespell_additions}",
-                f"--exclude-file={codespell_exclude}",
-                f"--ignore-words={codespell_ignore}",
-                "--disable-colors",
-                "--uri-ignore-words-list=*",
-            ] + files_parameters
-
-            with redirect_stdout(io.StringIO()) as codespell_stream:
-                codespell_main(*codespell_arguments)
-
-            codespell_output = codespell_stream.getvalue()
-
-            if "Traceback (most recent call last):" in codespell_output:
-                yield LinterError(
-                    codespell_output,
-                    plugin=self.name,
-                )
-
-                continue
-
-            codespell_entries = [
-                line
-                for line in codespell_output.splitlines()
-                if not handle_linguistic_checks(*self._parse_codespell_line(line), exceptions)
-            ]
-
-            for codespell_entry in codespell_entries:
-                if "==>" in codespell_entry:
-                    yield LinterError(
-                        codespell_entry,
-                        file=codespell_entry.split(":")[0],
-                        plugin=self.name,
-                    )
+        try:
+            spell_checker = get_spell_checker(
+                dictionaries=[_codespell_file("codespell.additions")],
+                exclude_files=[_codespell_file("codespell.exclude")],
+                ignore_words_files=[_codespell_file("codespell.ignore")],
+            )
+        except Exception:  # ruff:ignore[BLE001]
+            yield LinterError(
+                f"Building the codespell dictionaries failed:\n{traceback.format_exc()}",
+                plugin=self.name,
+            )
+            return
+
+        content_store = self.context.content_store
+        for batch in _sorted_batches(self.context.nasl_files):
+            for nasl_file in batch:
+                for spelling_error in spell_checker.check_file(nasl_file, content_store):
+                    if not exception_matcher.matches(spelling_error.file, spelling_error.text):
+                        yield LinterError(
+                            str(spelling_error),
+                            file=spelling_error.file,
+                            plugin=self.name,
+                        )
@@ -2,12 +2,14 @@
 # SPDX-FileCopyrightText: 2025 Greenbone AG
 
 import re
+from bisect import bisect_right
 from collections.abc import Iterator
+from operator import attrgetter
 from pathlib import Path
 
 from troubadix.helper.if_block_parser import find_if_statements
 from troubadix.helper.remove_comments import remove_comments
-from troubadix.helper.text_utils import index_to_linecol, is_position_in_string
+from troubadix.helper.tokenizer import Tokens, TokenType
 from troubadix.plugin import (
     FileContentPlugin,
     LinterError,
@@ -26,6 +28,16 @@ EXCLUDED_FILES = {
 }
 
 
+def _in_code(tokens: Tokens, position: int) -> bool:
+    """Whether the position is within a code token, not within a string or
+    a comment, which are no tokens"""
+    index = bisect_right(tokens.tokens, position, key=attrgetter("start")) - 1
+    if index < 0:
+        return False
+    token = tokens[index]
+    return position < token.end and token.type is not TokenType.STRING
+
+
 class CheckUsingDisplay(FileContentPlugin):
     name = "check_using_display"
 
@@ -37,20 +49,21 @@ class CheckUsingDisplay(FileContentPlugin):
         if nasl_file.name in EXCLUDED_FILES:
             return
 
-        comment_free_content = remove_comments(file_content)
-
-        display_matches = list(DISPLAY_PATTERN.finditer(comment_free_content))
+        display_matches = list(DISPLAY_PATTERN.finditer(file_content))
 
         if not display_matches:
             return
 
-        if_statements = find_if_statements(comment_free_content).statements
+        tokens = self.context.tokens
+        line_index = self.context.line_index
+        if_statements = find_if_statements(file_content, tokens).statements
+        code_lines = None
 
         for display_match in display_matches:
             display_pos = display_match.start()
 
-            # Skip if this match is inside a string literal
-            if is_position_in_string(comment_free_content, display_pos):
+            # Skip if this match is inside a string literal or a comment
+            if not _in_code(tokens, display_pos):
                 continue
 
             # Check if this display is inside any if statement
@@ -63,17 +76,17 @@ class CheckUsingDisplay(FileContentPlugin):
 
             # Case 1: Not in any if statement - ERROR
             if not containing_if:
-                line_start = comment_free_content.rfind("\n", 0, display_pos) + 1
-                line_end = comment_free_content.find("\n", display_pos)
-                if line_end == -1:
-                    line_end = len(comment_free_content)
-
-                context = comment_free_content[line_start:line_end].strip()
-                line, _ = index_to_linecol(comment_free_content, display_pos)
+                line = line_index.line(display_pos)
+                # the line of the code without comments, as a line starting
+                # within a string can't be told apart from code on its own
+                if code_lines is None:
+                    code_lines = self.context.code_without_comments.splitlines()
+                context = code_lines[line - 1].strip() if line <= len(code_lines) else ""
                 yield LinterError(
                     f"VT is using a display() without any if statement at line {line}: {context}",
                     file=nasl_file,
                     plugin=self.name,
+                    line=line,
                 )
                 continue
 
@@ -89,11 +102,12 @@ class CheckUsingDisplay(FileContentPlugin):
 
             # Case 3: In an if but not in a debug if - WARNING
             if not in_debug_if:
-                line, _ = index_to_linecol(comment_free_content, display_pos)
+                line = line_index.line(display_pos)
                 yield LinterWarning(
                     "VT is using a display() inside an if statement"
                     f" but without debug check at line {line}\n"
-                    + comment_free_content[containing_if.if_start : containing_if.if_end],
+                    + remove_comments(file_content[containing_if.if_start : containing_if.if_end]),
                     file=nasl_file,
                     plugin=self.name,
+                    line=line,
                 )
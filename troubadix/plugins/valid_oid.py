@@ -19,10 +19,7 @@ import re
 from collections.abc import Iterator
 from pathlib import Path
 
-from troubadix.helper.patterns import (
-    SpecialScriptTag,
-    get_special_script_tag_pattern,
-)
+from troubadix.helper.patterns import SpecialScriptTag
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
 
@@ -61,8 +58,8 @@ class CheckValidOID(FileContentPlugin):
         is_using_reserved = "is using an OID that is reserved for"
         invalid_oid = "is using an invalid OID"
 
-        oid_pattern = get_special_script_tag_pattern(SpecialScriptTag.OID)
-        oid_match = oid_pattern.search(file_content)
+        script_tags = self.context.script_tags
+        oid_match = script_tags.search(SpecialScriptTag.OID)
         if oid_match is None or oid_match.group("oid") is None:
             yield LinterError(
                 "No valid script_oid() call found",
@@ -81,8 +78,7 @@ class CheckValidOID(FileContentPlugin):
             )
             return
 
-        family_pattern = get_special_script_tag_pattern(SpecialScriptTag.FAMILY)
-        family_match = family_pattern.search(file_content)
+        family_match = script_tags.search(SpecialScriptTag.FAMILY)
 
         if family_match is None or family_match.group("value") is None:
             yield LinterError(
@@ -319,8 +315,7 @@ class CheckValidOID(FileContentPlugin):
 
         # product-specific OIDs
         if "1.3.6.1.4.1.25623.1.2." in oid:
-            name_pattern = get_special_script_tag_pattern(SpecialScriptTag.NAME)
-            name_match = name_pattern.search(file_content)
+            name_match = script_tags.search(SpecialScriptTag.NAME)
             if not name_match or not name_match.group("value"):
                 yield LinterError(
                     "VT is missing a script name!",
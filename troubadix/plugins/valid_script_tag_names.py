@@ -88,7 +88,9 @@ class CheckValidScriptTagNames(FileContentPlugin):
             "solution_method",
         ]
 
-        matches = _get_tag_pattern(name=r".+?", flags=re.DOTALL).finditer(file_content)
+        matches = _get_tag_pattern(name=r".+?", flags=re.DOTALL).finditer(
+            self.context.description_block
+        )
 
         if matches:
             for match in matches:
@@ -15,12 +15,45 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import re
+from bisect import bisect_left
 from collections.abc import Iterator
 from pathlib import Path
 
+from troubadix.helper.tokenizer import Token, Tokens, TokenType
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
 
+# tokens a (sub) condition starts after
+CONDITION_STARTS = {"(", "||", "&&"}
+
+
+def _is_constant(token: Token) -> bool:
+    return (
+        token.type is TokenType.STRING
+        or token.is_keyword("TRUE")
+        or (token.type is TokenType.NUMBER and token.value[0] in "01")
+    )
+
+
+def _find_assignments(tokens: Tokens) -> list[int]:
+    """The indexes of the tokens starting a (sub) condition with an
+    assignment of a constant, e.g. `variable = "content"`"""
+    return [
+        i
+        for i in range(1, len(tokens) - 2)
+        if tokens[i].type is TokenType.IDENTIFIER
+        and tokens[i - 1].type is TokenType.PUNCTUATION
+        and tokens[i - 1].value in CONDITION_STARTS
+        and tokens[i + 1].is_punctuation("=")
+        and _is_constant(tokens[i + 2])
+    ]
+
+
+def _has_assignment(assignments: list[int], start: int, end: int) -> bool:
+    """Whether one of the assignments starts within the tokens from start
+    to end, with the constant before end"""
+    position = bisect_left(assignments, start)
+    return position < len(assignments) and assignments[position] < end - 2
+
 
 class CheckVariableAssignedInIf(FileContentPlugin):
     """This script checks the passed VT/Include if it is using
@@ -47,44 +80,37 @@ class CheckVariableAssignedInIf(FileContentPlugin):
 
         Returns:
         """
-        # TO DO: Find a better way to parse if calls as this would
-        # miss something like e.g.:
-        #
-        # if((foo =~ "bar" || bar =~ "foo") || foobar = "foo"){}
-        #
-        # nb: We can't use { as an ending delimiter as there could
-        # be also something like e.g.:
-        #
-        # if((foo =~ "bar || bar =~ "foo") || foobar = "foo")
-        #   bar = "foo"; (no ending {)
-        matches = re.finditer(r"^\s*(if|}?\s*else if)\s*\(([^)]+)", file_content, re.MULTILINE)
-        if matches is None:
-            return
-
+        tokens = self.context.tokens
+        # found once for all if statements, which may be nested
+        assignments = _find_assignments(tokens)
         lint_error = False
         output = (
             f"VT/Include '{nasl_file.name}' is using a variable assignment"
             " within an if() call in the following line(s):\n"
         )
 
-        for match in matches:
-            if match is not None and match.group(1) is not None:
-                var_assign_match = re.search(
-                    r"((if|}?\s*else if)\s*\(\s*?|\|{2}\s*|&{2}\s*)"
-                    r'[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*("|\'|TRUE|0|1)',
-                    match.group(0),
-                )
-                if var_assign_match is not None and var_assign_match.group(1) is not None:
-                    # nb: Can't be fixed because it would mean a change
-                    # of a default behavior.
-                    if (
-                        "policy_file_checksums_win.nasl" in nasl_file.name
-                        and "install = " in match.group(0)
-                    ):
-                        continue
-
-                    output = f"{output} {match.group(0)}\n"
-                    lint_error = True
+        for i, token in enumerate(tokens):
+            if (
+                not token.is_keyword("if")
+                or i + 1 >= len(tokens)
+                or not tokens[i + 1].is_punctuation("(")
+            ):
+                continue
+
+            closing = tokens.closing(i + 1)
+            if closing is None or not _has_assignment(assignments, i + 2, closing):
+                continue
+
+            line_start = file_content.rfind("\n", 0, token.start) + 1
+            if_statement = file_content[line_start : tokens[closing].end]
+
+            # nb: Can't be fixed because it would mean a change
+            # of a default behavior.
+            if "policy_file_checksums_win.nasl" in nasl_file.name and "install = " in if_statement:
+                continue
+
+            output = f"{output} {if_statement}\n"
+            lint_error = True
 
         if lint_error:
             yield LinterError(
@@ -1,14 +1,21 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # SPDX-FileCopyrightText: 2024 Greenbone AG
 
-import re
 from collections.abc import Iterator
 from pathlib import Path
 
+from troubadix.helper.tokenizer import Token, TokenType
 from troubadix.plugin import FileContentPlugin, LinterResult, LinterWarning
 
-FOREACH_PATTERN = re.compile(r"foreach\s+(?P<ident>\w+)\s*\((?P<iter>.+)\)")
-MAKE_LIST_PATTERN = re.compile(r"^(?:make_list|make_list_unique)\((?P<params>.+)\)$")
+MAKE_LIST_FUNCTIONS = {"make_list", "make_list_unique"}
+
+
+def _is_identifier(tokens: list[Token], identifier: str) -> bool:
+    return (
+        len(tokens) == 1
+        and tokens[0].type is TokenType.IDENTIFIER
+        and tokens[0].value == identifier
+    )
 
 
 class CheckVariableRedefinitionInForeach(FileContentPlugin):
@@ -25,32 +32,47 @@ class CheckVariableRedefinitionInForeach(FileContentPlugin):
         foreach foo(make_list_unique(bar,foo)){}
         """
 
-        for foreach_match in FOREACH_PATTERN.finditer(file_content):
-            identifier = foreach_match.group("ident")
+        tokens = self.context.tokens
+
+        for i, token in enumerate(tokens):
+            if (
+                not token.is_keyword("foreach")
+                or i + 2 >= len(tokens)
+                or tokens[i + 1].type is not TokenType.IDENTIFIER
+                or not tokens[i + 2].is_punctuation("(")
+            ):
+                continue
+
+            closing = tokens.closing(i + 2)
+            if closing is None:
+                continue
 
-            # replace instead of strip, because the iterator can contain
-            # whitespace as part of the expression.
-            # Saving from further strip calls
-            # make_list( bar , foo )
-            iterator = foreach_match.group("iter").replace(" ", "")
+            identifier = tokens[i + 1].value
+            iterator = tokens.tokens[i + 3 : closing]
+            foreach_loop = tokens.text(i, closing)
 
-            if make_list_match := MAKE_LIST_PATTERN.fullmatch(iterator):
-                make_list_params = make_list_match.group("params").split(",")
-                if identifier in make_list_params:
+            if (
+                len(iterator) > 2
+                and iterator[0].type is TokenType.IDENTIFIER
+                and iterator[0].value in MAKE_LIST_FUNCTIONS
+                and iterator[1].is_punctuation("(")
+                and tokens.closing(i + 4) == closing - 1
+            ):
+                make_list_params = tokens.arguments(i + 4)
+                if any(_is_identifier(param, identifier) for param in make_list_params):
                     yield LinterWarning(
                         f"The variable '{identifier}' "
                         f"is used as identifier and\n"
                         f"as part of the iterator in the"
-                        f" same foreach loop\n'{foreach_match.group()}'",
-                        plugin=self.name,
-                        file=nasl_file,
-                    )
-            else:
-                if identifier == iterator:
-                    yield LinterWarning(
-                        f"The variable '{identifier}' is redefined "
-                        f"by being the identifier\nand the iterator in the"
-                        f" same foreach loop '{foreach_match.group()}'",
+                        f" same foreach loop\n'{foreach_loop}'",
                         plugin=self.name,
                         file=nasl_file,
                     )
+            elif _is_identifier(iterator, identifier):
+                yield LinterWarning(
+                    f"The variable '{identifier}' is redefined "
+                    f"by being the identifier\nand the iterator in the"
+                    f" same foreach loop '{foreach_loop}'",
+                    plugin=self.name,
+                    file=nasl_file,
+                )
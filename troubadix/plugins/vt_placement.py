@@ -20,7 +20,7 @@ from collections.abc import Iterator
 from itertools import chain
 from pathlib import Path
 
-from troubadix.helper import ScriptTag, SpecialScriptTag, get_script_tag_pattern
+from troubadix.helper import ScriptTag, SpecialScriptTag
 from troubadix.helper.helper import ENTERPRISE_FOLDERS, FEED_VERSIONS
 from troubadix.helper.patterns import _get_special_script_tag_pattern
 from troubadix.plugin import FileContentPlugin, LinterError, LinterResult
@@ -57,17 +57,20 @@ class CheckVTPlacement(FileContentPlugin):
 
         root = self.context.root
 
-        match = _get_special_script_tag_pattern(
-            name=SpecialScriptTag.FAMILY.value,
-            value=r"(Product|Service) detection",
-            flags=re.MULTILINE,
-        ).search(file_content)
+        script_tags = self.context.script_tags
+
+        match = script_tags.search(
+            SpecialScriptTag.FAMILY,
+            _get_special_script_tag_pattern(
+                name=SpecialScriptTag.FAMILY.value,
+                value=r"(Product|Service) detection",
+                flags=re.MULTILINE,
+            ),
+        )
         if match is None:
             return
 
-        tag_pattern = get_script_tag_pattern(ScriptTag.DEPRECATED)
-
-        match = tag_pattern.search(file_content)
+        match = script_tags.search(ScriptTag.DEPRECATED)
         if match is not None:
             return
 
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Timing of plugins and files for the profiling mode of troubadix."""
+
+import json
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+
+from troubadix.__version__ import __version__
+from troubadix.helper.helper import get_path_from_root
+from troubadix.helper.patterns import pattern_registry
+from troubadix.results import FileResults, Results, Timing
+
+
+@contextmanager
+def measure() -> Iterator[Timing]:
+    """Measure the wall and CPU time of a single call and the use of the
+    pattern registry"""
+    timing = Timing(calls=1)
+    compiles = pattern_registry.compiles
+    hits = pattern_registry.hits
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield timing
+    finally:
+        timing.wall = time.perf_counter() - wall
+        timing.cpu = time.process_time() - cpu
+        timing.compiles = pattern_registry.compiles - compiles
+        timing.pattern_hits = pattern_registry.hits - hits
+
+
+class Profile:
+    """Aggregates the timings of the plugins reported by the workers"""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.plugins: dict[str, Timing] = defaultdict(Timing)
+        self.files: dict[Path, Timing] = defaultdict(Timing)
+
+    def add(self, results: Results) -> None:
+        for plugin_name, timing in results.plugin_timings.items():
+            self.plugins[plugin_name].add(timing)
+
+            if isinstance(results, FileResults):
+                self.files[results.file_path].add(timing)
+
+    def top_plugins(self, count: int) -> list[tuple[str, Timing]]:
+        """The slowest plugins by wall time"""
+        return sorted(self.plugins.items(), key=lambda item: item[1].wall, reverse=True)[:count]
+
+    def top_files(self, count: int) -> list[tuple[Path, Timing]]:
+        """The slowest files by wall time"""
+        return sorted(self.files.items(), key=lambda item: item[1].wall, reverse=True)[:count]
+
+    def to_dict(self) -> dict:
+        return {
+            "version": __version__,
+            "plugins": {name: asdict(timing) for name, timing in sorted(self.plugins.items())},
+            "files": {
+                str(get_path_from_root(file_path, self.root)): asdict(timing)
+                for file_path, timing in sorted(self.files.items())
+            },
+        }
+
+    def write(self, profile_file: Path) -> None:
+        """Write the profile as JSON, to be compared between releases"""
+        profile_file.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
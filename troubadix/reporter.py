@@ -23,8 +23,12 @@ from pontos.terminal import Terminal
 from troubadix.helper.helper import get_path_from_root
 from troubadix.plugin import LinterError, LinterFix, LinterResult, LinterWarning
 from troubadix.plugins import Plugins
+from troubadix.profiling import Profile
 from troubadix.results import FileResults, ResultCounts, Results
 
+# Number of the slowest plugins and files shown by a profiling run
+PROFILE_TOP_COUNT = 20
+
 
 class Reporter:
     def __init__(
@@ -222,6 +226,33 @@ class Reporter:
         self._term.info(line)
         self._log_statistic_append(line)
 
+    def report_profile(self, profile: Profile, count: int = PROFILE_TOP_COUNT) -> None:
+        """Print/log the slowest plugins and files of a profiling run"""
+        for title, entries in (
+            ("Plugin", profile.top_plugins(count)),
+            ("File", [(get_path_from_root(f, self._root), t) for f, t in profile.top_files(count)]),
+        ):
+            line = (
+                f"{title:48} {'Calls':>6} {'Wall (s)':>9} {'CPU (s)':>9}"
+                f" {'Compiles':>9} {'Hits':>9}"
+            )
+            length = "-" * 95
+            self._term.print(line)
+            self._log_append(line)
+            self._term.print(length)
+            self._log_append(length)
+
+            for name, timing in entries:
+                line = (
+                    f"{str(name):48} {timing.calls:6} {timing.wall:9.3f} {timing.cpu:9.3f}"
+                    f" {timing.compiles:9} {timing.pattern_hits:9}"
+                )
+                self._term.print(line)
+                self._log_append(line)
+
+            self._term.print()
+            self._log_append("")
+
     def _log_append(self, message: str):
         if self._log_file:
             with self._log_file.open(mode="a", encoding="utf-8") as f:
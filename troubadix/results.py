@@ -16,16 +16,73 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
 
-from troubadix.plugin import LinterResult, LinterWarning
+from troubadix.plugin import LinterError, LinterFix, LinterResult, LinterWarning
+
+_RESULT_TYPES = {
+    result_type.__name__: result_type
+    for result_type in (LinterResult, LinterWarning, LinterError, LinterFix)
+}
+
+
+def result_to_json(result: LinterResult) -> dict[str, Any]:
+    """The result as JSON compatible dict"""
+    return {
+        "type": type(result).__name__,
+        "message": result.message,
+        "file": None if result.file is None else str(result.file),
+        "plugin": result.plugin,
+        "line": result.line,
+    }
+
+
+def result_from_json(data: dict[str, Any]) -> LinterResult:
+    """Create a result from a dict created by `result_to_json`
+
+    Raises:
+        ValueError: if the data is not a result
+    """
+    try:
+        result_type = _RESULT_TYPES[data["type"]]
+        return result_type(
+            str(data["message"]),
+            file=None if data["file"] is None else Path(data["file"]),
+            plugin=data["plugin"],
+            line=data["line"],
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid result {data!r}") from e
+
+
+@dataclass
+class Timing:
+    """Wall and CPU time in seconds spent in a number of calls, with the
+    patterns compiled and taken from the pattern registry meanwhile"""
+
+    wall: float = 0.0
+    cpu: float = 0.0
+    calls: int = 0
+    compiles: int = 0
+    pattern_hits: int = 0
+
+    def add(self, other: "Timing") -> "Timing":
+        self.wall += other.wall
+        self.cpu += other.cpu
+        self.calls += other.calls
+        self.compiles += other.compiles
+        self.pattern_hits += other.pattern_hits
+        return self
 
 
 class Results:
     def __init__(self, ignore_warnings: bool = False) -> None:
         self.plugin_results: dict[str, list[LinterResult]] = defaultdict(list)
         self.has_plugin_results = False
+        self.plugin_timings: dict[str, Timing] = {}
         self._ignore_warnings = ignore_warnings
 
     def add_plugin_results(self, plugin_name: str, results: Iterator[LinterResult]) -> "Results":
@@ -38,17 +95,166 @@ class Results:
         self.plugin_results[plugin_name] += results
         return self
 
+    def add_plugin_timing(self, plugin_name: str, timing: Timing) -> "Results":
+        if plugin_name in self.plugin_timings:
+            self.plugin_timings[plugin_name].add(timing)
+        else:
+            self.plugin_timings[plugin_name] = timing
+        return self
+
+    def merge(self, other: "Results") -> "Results":
+        """Add the results and timings of another part of the same run"""
+        for plugin_name, results in other.plugin_results.items():
+            self.plugin_results[plugin_name] += results
+        self.has_plugin_results = self.has_plugin_results or other.has_plugin_results
+        for plugin_name, timing in other.plugin_timings.items():
+            self.add_plugin_timing(plugin_name, timing)
+        return self
+
     def __bool__(self):
         return self.has_plugin_results
 
+    def to_json(self) -> dict[str, Any]:
+        """The results and timings as JSON compatible dict"""
+        return {
+            "plugin_results": {
+                plugin_name: [result_to_json(result) for result in results]
+                for plugin_name, results in self.plugin_results.items()
+            },
+            "plugin_timings": {
+                plugin_name: asdict(timing) for plugin_name, timing in self.plugin_timings.items()
+            },
+        }
+
+    def _add_json(self, data: dict[str, Any]) -> "Results":
+        try:
+            for plugin_name, results in data["plugin_results"].items():
+                self.add_plugin_results(
+                    plugin_name, [result_from_json(result) for result in results]
+                )
+            for plugin_name, timing in data["plugin_timings"].items():
+                self.add_plugin_timing(plugin_name, Timing(**timing))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError("Invalid results") from e
+        return self
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "Results":
+        """Create the results from a dict created by `to_json`
+
+        Raises:
+            ValueError: if the data are no results
+        """
+        return Results()._add_json(data)
+
 
 class FileResults(Results):
     """Class to store results from different plugins for a file"""
 
     def __init__(self, file_path: Path, ignore_warnings: bool = False):
         self.file_path = file_path
+        self.plugin_facts: dict[str, list[Any]] = {}
+        self.cached = False
         super().__init__(ignore_warnings)
 
+    def add_plugin_facts(self, plugin_name: str, facts: Iterable[Any]) -> "FileResults":
+        """Add the facts collected by the map step of a map reduce plugin"""
+        self.plugin_facts[plugin_name] = list(facts)
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        """The results, timings and facts as JSON compatible dict. The facts
+        need to be JSON serializable, tuples are turned into lists."""
+        return super().to_json() | {
+            "file_path": str(self.file_path),
+            "plugin_facts": self.plugin_facts,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "FileResults":
+        """Create the results from a dict created by `to_json`
+
+        Raises:
+            ValueError: if the data are no file results
+        """
+        try:
+            results = FileResults(Path(data["file_path"]))
+            results._add_json(data)
+            for plugin_name, facts in data["plugin_facts"].items():
+                results.add_plugin_facts(plugin_name, facts)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError("Invalid file results") from e
+        return results
+
+
+class BatchResults:
+    """Class to store the results of a batch of files checked by a single
+    worker process together with the time the worker spent on them"""
+
+    def __init__(
+        self,
+        file_results: Iterable[FileResults],
+        *,
+        worker: int,
+        start: float,
+        end: float,
+    ):
+        self.file_results = list(file_results)
+        self.worker = worker
+        self.start = start
+        self.end = end
+
+    def __iter__(self) -> Iterator[FileResults]:
+        return iter(self.file_results)
+
+
+class FilesResults:
+    """Class to store the results of a files plugin, or a part of it, run
+    by a single worker process together with the time the worker spent on
+    it"""
+
+    def __init__(self, results: Results, *, worker: int, start: float, end: float):
+        self.results = results
+        self.worker = worker
+        self.start = start
+        self.end = end
+
+
+class WorkerTimes:
+    """Class that collects the busy times of the worker processes to
+    compute the core utilisation and the idle tail of a run"""
+
+    def __init__(self, n_jobs: int):
+        self.n_jobs = n_jobs
+        self.busy_time: dict[int, float] = defaultdict(float)
+        self.last_end: dict[int, float] = {}
+        self.start: float | None = None
+        self.end: float | None = None
+
+    def add(self, task: BatchResults | FilesResults):
+        """Add the time a worker spent on a task, a batch of files or a
+        files plugin"""
+        self.busy_time[task.worker] += task.end - task.start
+        self.last_end[task.worker] = max(self.last_end.get(task.worker, task.end), task.end)
+        self.start = task.start if self.start is None else min(self.start, task.start)
+        self.end = task.end if self.end is None else max(self.end, task.end)
+
+    @property
+    def utilisation(self) -> float:
+        """Share of the available worker time spent on checking files,
+        including the time of the files plugins"""
+        if self.start is None or self.end <= self.start:
+            return 0.0
+        return sum(self.busy_time.values()) / (self.n_jobs * (self.end - self.start))
+
+    @property
+    def idle_tail(self) -> float:
+        """Seconds between the first and the last worker running out of
+        work at the end of the run"""
+        if not self.last_end:
+            return 0.0
+        return max(self.last_end.values()) - min(self.last_end.values())
+
 
 def resultsdict():
     return defaultdict(int)
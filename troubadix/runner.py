@@ -16,30 +16,94 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import datetime
-import signal
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from multiprocessing.pool import Pool as ProcessPool
 from pathlib import Path
+from typing import Any
 
+from troubadix.cache import DEFAULT_MAX_BYTES as DEFAULT_CACHE_MAX_BYTES
+from troubadix.cache import ResultCache
+from troubadix.helper.oid_index import OIDIndex
 from troubadix.helper.patterns import (
     init_script_tag_patterns,
     init_special_script_tag_patterns,
 )
-from troubadix.plugin import FilePluginContext, FilesPluginContext, Plugin
+from troubadix.plugin import FilesPluginContext, MapReducePlugin
 from troubadix.plugins import StandardPlugins
+from troubadix.plugins.duplicate_oid import CheckDuplicateOID
+from troubadix.profiling import Profile, measure
 from troubadix.reporter import Reporter
-from troubadix.results import FileResults, Results
+from troubadix.results import Results, WorkerTimes
+from troubadix.shard import ShardResults, select_shard
+from troubadix.time_budget import DEFAULT_PLUGIN_TIMEOUT
+from troubadix.worker import Worker, check_file_batch, check_files, initializer
 
 CHUNKSIZE = 1  # default 1
 
+# Bounds for the amount of file content bundled into a single pool task
+MIN_BATCH_BYTES = 16 * 1024
+MAX_BATCH_BYTES = 1024 * 1024
+# Upper limit for the number of files in a single pool task
+MAX_BATCH_FILES = 64
+# Number of batches per job aimed for, to balance the load of the workers
+BATCHES_PER_JOB = 16
+
 
 class TroubadixException(Exception):
     """Generic Exception for Troubadix"""
 
 
-def initializer():
-    """Ignore CTRL+C in the worker process."""
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
+def _file_size(file_path: Path) -> int:
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def create_batches(files: Iterable[Path], n_jobs: int) -> list[list[Path]]:
+    """Split the files into batches for the pool workers
+
+    The files are sorted by size, largest first, so that huge files do not
+    end up at the end of the run and leave the other workers idle. Small
+    files are bundled into batches of similar total size to reduce the
+    number of pool tasks.
+
+    Arguments:
+        files       the files to check
+        n_jobs      the number of pool processes
+
+    Returns
+        List of batches in the order they should be dispatched
+    """
+    sized_files = sorted(
+        ((_file_size(file_path), file_path) for file_path in files),
+        key=lambda sized_file: sized_file[0],
+        reverse=True,
+    )
+    total_size = sum(size for size, _ in sized_files)
+    batch_bytes = min(
+        MAX_BATCH_BYTES,
+        max(MIN_BATCH_BYTES, total_size // (max(1, n_jobs) * BATCHES_PER_JOB)),
+    )
+
+    batches: list[list[Path]] = []
+    batch: list[Path] = []
+    size_of_batch = 0
+    for size, file_path in sized_files:
+        batch.append(file_path)
+        size_of_batch += size
+
+        if size_of_batch >= batch_bytes or len(batch) >= MAX_BATCH_FILES:
+            batches.append(batch)
+            batch = []
+            size_of_batch = 0
+
+    if batch:
+        batches.append(batch)
+
+    return batches
 
 
 class Runner:
@@ -53,6 +117,13 @@ class Runner:
         included_plugins: Iterable[str] | None = None,
         fix: bool = False,
         ignore_warnings: bool = False,
+        profile: bool = False,
+        cache_dir: Path | None = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        shard: tuple[int, int] | None = None,
+        plugin_timeout: float | None = DEFAULT_PLUGIN_TIMEOUT,
+        oid_index: bool = False,
+        feed_index_file: Path | None = None,
     ) -> None:
         # plugins initialization
         self.plugins = StandardPlugins(excluded_plugins, included_plugins)
@@ -65,66 +136,203 @@ class Runner:
         self._root = root
         self._fix = fix
         self._ignore_warnings = ignore_warnings
+        self._plugin_timeout = plugin_timeout
+        self._feed_index_file = feed_index_file
+        self._worker_times = WorkerTimes(n_jobs)
+        self.profile = Profile(root) if profile else None
+        # fixing changes the files, so the results can't be reused
+        self._cache = ResultCache(cache_dir, cache_max_bytes) if cache_dir and not fix else None
+        self._cached_count = 0
+        self._collect_oid_index = oid_index
+        # set by the reduce step, as the OIDs are collected by the workers
+        self.oid_index: OIDIndex | None = None
+
+        self._map_reduce_plugins = tuple(
+            plugin for plugin in self.plugins.files_plugins if issubclass(plugin, MapReducePlugin)
+        )
+        self._files_plugins = tuple(
+            plugin
+            for plugin in self.plugins.files_plugins
+            if not issubclass(plugin, MapReducePlugin)
+        )
+
+        self.shard = (
+            ShardResults(
+                root,
+                *shard,
+                map_reduce_plugins=[plugin.name for plugin in self._map_reduce_plugins],
+                fix=fix,
+                ignore_warnings=ignore_warnings,
+            )
+            if shard
+            else None
+        )
 
         init_script_tag_patterns()
         init_special_script_tag_patterns()
 
-    def _check(self, plugin: Plugin, results: Results) -> Results:
-        """Run a single plugin and collect the results"""
-        results.add_plugin_results(plugin.name, plugin.run())
+    def _create_worker(self) -> Worker:
+        """Create the worker that is kept by every pool process"""
+        return Worker(
+            self.plugins.file_plugins,
+            self._map_reduce_plugins,
+            root=self._root,
+            fix=self._fix,
+            ignore_warnings=self._ignore_warnings,
+            profile=self.profile is not None,
+            cache=self._cache,
+            plugin_timeout=self._plugin_timeout,
+            feed_index_file=self._feed_index_file,
+        )
+
+    def _report_by_plugin(self, results: Results) -> None:
+        if self.profile:
+            self.profile.add(results)
+        if self.shard:
+            self.shard.add(results)
 
-        if self._fix:
-            results.add_plugin_results(plugin.name, plugin.fix())
+        self._reporter.report_by_plugin(results)
 
-        return results
+    def _report_files_results(
+        self, pending: list[list[AsyncResult]], *, wait: bool = False
+    ) -> list[list[AsyncResult]]:
+        """Report the results of the finished files plugins. The results of
+        a plugin split into parts are merged in the order of the parts and
+        reported once all parts are finished.
 
-    def _check_files(self, plugin: Plugin) -> Results:
-        """Run a files plugin and collect the results"""
-        results = Results(ignore_warnings=self._ignore_warnings)
-        return self._check(plugin, results)
+        Arguments:
+            pending     the async results of the parts of the running files
+                        plugins
+            wait        wait for all files plugins to finish
 
-    def _check_file(self, file_path: Path) -> FileResults:
-        """Run all file plugins on a single file and collect the results"""
-        results = FileResults(file_path, ignore_warnings=self._ignore_warnings)
-        context = FilePluginContext(root=self._root, nasl_file=file_path.resolve())
+        Returns
+            The async results of the files plugins that are still running
+        """
+        running = []
+        for async_results in pending:
+            if wait or all(async_result.ready() for async_result in async_results):
+                parts = [async_result.get() for async_result in async_results]
+                results = parts[0].results
+                for part in parts[1:]:
+                    results.merge(part.results)
+                for part in parts:
+                    self._worker_times.add(part)
+                self._report_by_plugin(results)
+            else:
+                running.append(async_results)
+        return running
+
+    def _reduce(
+        self,
+        context: FilesPluginContext,
+        facts: dict[tuple[Path, str], list[Any]],
+    ) -> None:
+        """Run the reduce step of the map reduce plugins on the facts
+        collected by the workers and report the results
 
-        for plugin_class in self.plugins.file_plugins:
+        Arguments:
+            context     the context of the files plugins
+            facts       the facts per file and plugin name
+        """
+        if self._collect_oid_index:
+            self.oid_index = OIDIndex.from_facts(
+                (
+                    (nasl_file, oid)
+                    for nasl_file in context.nasl_files
+                    for oid in facts.get((nasl_file, CheckDuplicateOID.name), [])
+                ),
+                self._root,
+            )
+
+        for plugin_class in self._map_reduce_plugins:
             plugin = plugin_class(context)
+            plugin_facts = [
+                (nasl_file, fact)
+                for nasl_file in context.nasl_files
+                for fact in facts.get((nasl_file, plugin.name), [])
+            ]
+
+            results = Results(ignore_warnings=self._ignore_warnings)
+            with measure() as timing:
+                results.add_plugin_results(plugin.name, plugin.reduce(plugin_facts))
+
+                if self._fix:
+                    results.add_plugin_results(plugin.name, plugin.fix())
 
-            self._check(plugin, results)
+            if self.profile:
+                results.add_plugin_timing(plugin.name, timing)
+
+            self._report_by_plugin(results)
+
+    def create_pool(self) -> ProcessPool:
+        """Create a process pool, whose workers are set up for the plugins
+        and options of this runner"""
+        return Pool(
+            processes=self._n_jobs,
+            initializer=initializer,
+            initargs=(self._create_worker(),),
+        )
 
-        return results
+    def _run_pooled(self, files: Iterable[Path], context: FilesPluginContext, pool: ProcessPool):
+        """Run all plugins on the pool
 
-    def _run_pooled(self, files: Iterable[Path]):
-        """Run all plugins that check single files"""
+        The files plugins are submitted first, as they are usually the
+        longest running tasks. Plugins supporting it are split into a part
+        per job. The remaining workers check the single files
+        in the meantime and the results of both are reported as soon as they
+        are available. The map reduce plugins collect their facts while the
+        single files are checked and are reduced at the end.
+
+        If running a shard, only the first shard runs the files plugins and
+        the reduce step is left to the merge of the shards."""
         self._reporter.set_files_count(len(files))
-        with Pool(processes=self._n_jobs, initializer=initializer) as pool:
-            try:
-                # run files plugins
-                context = FilesPluginContext(root=self._root, nasl_files=files)
-                files_plugins = [
-                    plugin_class(context) for plugin_class in self.plugins.files_plugins
-                ]
-
-                for results in pool.imap_unordered(
-                    self._check_files, files_plugins, chunksize=CHUNKSIZE
-                ):
-                    self._reporter.report_by_plugin(results)
-
-                # run file plugins
-                for i, results in enumerate(
-                    iterable=pool.imap_unordered(self._check_file, files, chunksize=CHUNKSIZE),
-                    start=1,
-                ):
-                    self._reporter.report_by_file_plugin(file_results=results, pos=i)
-
-            except KeyboardInterrupt:
-                pool.terminate()
-                pool.join()
-
-    def run(self, files: Iterable[Path]) -> bool:
+
+        # start files plugins
+        files_plugins = self._files_plugins if not self.shard or self.shard.index == 1 else ()
+        pending = [
+            [
+                pool.apply_async(check_files, (plugin_class, part))
+                for part in plugin_class.split(context, self._n_jobs)
+            ]
+            for plugin_class in files_plugins
+        ]
+        facts: dict[tuple[Path, str], list[Any]] = {}
+
+        # run file plugins
+        i = 0
+        for batch_results in pool.imap_unordered(
+            check_file_batch, create_batches(files, self._n_jobs), chunksize=CHUNKSIZE
+        ):
+            pending = self._report_files_results(pending)
+
+            self._worker_times.add(batch_results)
+            for results in batch_results:
+                i += 1
+                self._cached_count += results.cached
+                self._reporter.report_by_file_plugin(file_results=results, pos=i)
+
+                if self.profile:
+                    self.profile.add(results)
+                if self.shard:
+                    self.shard.add(results)
+
+                for plugin_name, plugin_facts in results.plugin_facts.items():
+                    facts[results.file_path, plugin_name] = plugin_facts
+
+        self._report_files_results(pending, wait=True)
+        if not self.shard:
+            self._reduce(context, facts)
+
+    def run(self, files: Iterable[Path], pool: ProcessPool | None = None) -> bool:
         """The function that should be executed to run
-        the Plugins over all files"""
+        the Plugins over all files
+
+        Arguments:
+            files       the files to check
+            pool        a pool created by `create_pool` of a runner with the
+                        same plugins and options, to be reused for several
+                        runs. A new pool is used if not given.
+        """
         if not len(self.plugins):
             raise TroubadixException("No Plugin found.")
 
@@ -135,13 +343,78 @@ class Runner:
             included=self._included_plugins,
         )
 
+        # the files plugins always look at all files
+        context = FilesPluginContext(root=self._root, nasl_files=files)
+        if self.shard:
+            files = select_shard(files, self._root, self.shard.index, self.shard.count)
+            self._reporter.report_info(
+                f"Shard {self.shard.index}/{self.shard.count}: {len(files)} of "
+                f"{len(context.nasl_files)} files"
+            )
+
         start = datetime.datetime.now()  # ruff:ignore[DTZ005]
-        self._run_pooled(files)
+        if pool:
+            self._run_pooled(files, context, pool)
+        else:
+            with self.create_pool() as own_pool:
+                try:
+                    self._run_pooled(files, context, own_pool)
+                except KeyboardInterrupt:
+                    own_pool.terminate()
+                    own_pool.join()
+
+        if self._cache:
+            self._cache.evict()
+            self._reporter.report_info(
+                f"Result cache: {self._cached_count} of {len(files)} files unchanged"
+            )
 
         self._reporter.report_info(
             f"Time elapsed: {datetime.datetime.now() - start}"  # ruff:ignore[DTZ005]
+            f" (core utilisation: {self._worker_times.utilisation:.1%},"
+            f" idle tail: {datetime.timedelta(seconds=self._worker_times.idle_tail)})"
         )
         self._reporter.report_statistic()
 
+        if self.profile:
+            self._reporter.report_profile(self.profile)
+
+        # Return true if no error exists
+        return self._reporter.get_error_count() == 0
+
+    def merge(self, shards: Sequence[ShardResults]) -> bool:
+        """Report the results of all shards of a run split by `--shard` and
+        run the reduce step of the map reduce plugins on their facts
+
+        Arguments:
+            shards      the results of all shards, moved to the root of this
+                        runner
+        """
+        file_results = [results for shard in shards for results in shard.file_results]
+        self._reporter.set_files_count(len(file_results))
+
+        facts: dict[tuple[Path, str], list[Any]] = {}
+        for i, results in enumerate(file_results, start=1):
+            self._reporter.report_by_file_plugin(file_results=results, pos=i)
+
+            for plugin_name, plugin_facts in results.plugin_facts.items():
+                facts[results.file_path, plugin_name] = plugin_facts
+
+        for shard in shards:
+            for results in shard.results:
+                self._report_by_plugin(results)
+
+        context = FilesPluginContext(
+            root=self._root, nasl_files=[results.file_path for results in file_results]
+        )
+        self._map_reduce_plugins = tuple(
+            plugin
+            for plugin in self._map_reduce_plugins
+            if plugin.name in shards[0].map_reduce_plugins
+        )
+        self._reduce(context, facts)
+
+        self._reporter.report_statistic()
+
         # Return true if no error exists
         return self._reporter.get_error_count() == 0
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Long living troubadix server and its client.
+
+Every run of troubadix pays for the imports, the plugin discovery, the
+compilation of the patterns and the start of the process pool. The server
+does all of this once and keeps the pool, including the content and results
+cached by its workers, for all requests. The client sends the files to check
+over a Unix socket and prints the output of the reporter as it is streamed
+back.
+
+The protocol uses a JSON object per line. The client sends a single request
+with the files and the reporting options. The server answers with any number
+of `{"output": <text>}` messages followed by either `{"success": <bool>}` or
+`{"error": <message>}`.
+"""
+
+import io
+import json
+import socket
+import socketserver
+import sqlite3
+import sys
+from collections.abc import Iterable
+from contextlib import redirect_stdout
+from multiprocessing.pool import Pool as ProcessPool
+from pathlib import Path
+from typing import Any, TextIO
+
+from pontos.terminal.terminal import ConsoleTerminal
+
+from troubadix.helper.feed_index import FeedIndexFile
+from troubadix.reporter import Reporter
+from troubadix.runner import Runner
+
+
+class _OutputWriter(io.TextIOBase):
+    """Sends everything written to it as output messages"""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        if text:
+            _send(self._stream, output=text)
+        return len(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+def _send(stream: TextIO, **message: Any) -> None:
+    stream.write(json.dumps(message) + "\n")
+    stream.flush()
+
+
+def _optional_path(value: str | None) -> Path | None:
+    return Path(value) if value else None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self) -> None:
+        with (
+            io.TextIOWrapper(self.rfile, encoding="utf-8") as rfile,
+            io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True) as wfile,
+        ):
+            try:
+                request = json.loads(rfile.readline())
+                files = [Path(file) for file in request["files"]]
+            except (ValueError, KeyError, TypeError) as e:
+                _send(wfile, error=f"Invalid request: {e}")
+                return
+
+            with redirect_stdout(_OutputWriter(wfile)):
+                reporter = Reporter(
+                    term=ConsoleTerminal(),
+                    root=self.server.root,
+                    fix=self.server.runner_options.get("fix", False),
+                    log_file=_optional_path(request.get("log_file")),
+                    log_file_statistic=_optional_path(request.get("log_file_statistic")),
+                    statistic=request.get("statistic", True),
+                    verbose=request.get("verbose", 0),
+                    ignore_warnings=self.server.runner_options.get("ignore_warnings", False),
+                )
+                if self.server.feed_index_file:
+                    try:
+                        self.server.refresh_feed_index(reporter)
+                    except sqlite3.Error as e:
+                        _send(
+                            wfile,
+                            error=(
+                                f"Unable to refresh the feed index "
+                                f"{self.server.feed_index_file}: {e}"
+                            ),
+                        )
+                        return
+
+                try:
+                    success = self.server.create_runner(reporter).run(files, pool=self.server.pool)
+                except Exception as e:  # ruff:ignore[BLE001]
+                    self.server.recreate_pool()
+                    _send(wfile, error=f"{type(e).__name__}: {e}")
+                    return
+
+            _send(wfile, success=success)
+
+
+class Server(socketserver.UnixStreamServer):
+    """Serves the requests of the clients one after the other on a single
+    warm process pool. All requests are checked with the plugins and options
+    the server was started with. A persistent index of the feed is
+    refreshed for every request, as the files may change between them."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        *,
+        root: Path,
+        n_jobs: int,
+        feed_index_file: Path | None = None,
+        **runner_options,
+    ) -> None:
+        """
+        Arguments:
+            socket_path     path of the Unix socket to listen on
+            root            root directory of the nasl files
+            n_jobs          number of pool processes
+            feed_index_file persistent index of the feed used by the workers
+            runner_options  further keyword arguments for the `Runner`
+        """
+        self.socket_path = socket_path
+        self.root = root
+        self.n_jobs = n_jobs
+        self.feed_index_file = feed_index_file
+        self.runner_options = runner_options
+        self.pool = None
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def create_runner(self, reporter: Reporter) -> Runner:
+        return Runner(
+            n_jobs=self.n_jobs,
+            reporter=reporter,
+            root=self.root,
+            feed_index_file=self.feed_index_file,
+            **self.runner_options,
+        )
+
+    def refresh_feed_index(self, reporter: Reporter) -> None:
+        """Bring the persistent index of the feed up to date with the files
+
+        Raises:
+            sqlite3.Error: if the index can't be written
+        """
+        with FeedIndexFile(self.feed_index_file, self.root) as feed_index:
+            statistic = feed_index.refresh(self.n_jobs)
+        reporter.report_info(
+            f"Feed index: {statistic.parsed} of {statistic.total} VTs parsed, "
+            f"{statistic.removed} removed"
+        )
+
+    def create_pool(self) -> ProcessPool:
+        runner = self.create_runner(Reporter(term=ConsoleTerminal(), root=self.root))
+        return runner.create_pool()
+
+    def recreate_pool(self) -> None:
+        """Replace the pool after a failed request. Its workers may have
+        died and tasks of the failed request may still be pending."""
+        self.pool.terminate()
+        self.pool.join()
+        self.pool = self.create_pool()
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        self.pool = self.create_pool()
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self.pool.terminate()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def run_client(
+    socket_path: Path,
+    files: Iterable[Path],
+    *,
+    output: TextIO = sys.stdout,
+    log_file: Path | None = None,
+    log_file_statistic: Path | None = None,
+    statistic: bool = True,
+    verbose: int = 0,
+) -> bool:
+    """Let the server listening on the socket check the files and write the
+    output of the server
+
+    Returns
+        True if no error was found
+
+    Raises:
+        OSError: if the server can't be reached
+        RuntimeError: if the server rejected the request, failed to check
+        the files or closed the connection early
+    """
+    request = {
+        "files": [str(file.resolve()) for file in files],
+        "log_file": str(log_file.resolve()) if log_file else None,
+        "log_file_statistic": (str(log_file_statistic.resolve()) if log_file_statistic else None),
+        "statistic": statistic,
+        "verbose": verbose,
+    }
+
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(str(socket_path))
+        with sock.makefile("rw", encoding="utf-8") as stream:
+            _send(stream, **request)
+
+            for line in stream:
+                message = json.loads(line)
+                if "output" in message:
+                    output.write(message["output"])
+                elif "error" in message:
+                    raise RuntimeError(message["error"])
+                else:
+                    return message["success"]
+
+    raise RuntimeError("Connection closed by the server")
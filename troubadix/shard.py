@@ -0,0 +1,279 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Splitting a run into shards, e.g. for several CI machines.
+
+Every shard checks a deterministic, size balanced part of the files and
+writes its results into a shard results file. The files plugins, which need
+all files, only run on the first shard. The map reduce plugins only run
+their map step on the shards, the reduce step runs when merging the shard
+results into a single report with `troubadix-merge-shards`.
+"""
+
+import heapq
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from pontos.terminal.terminal import ConsoleTerminal
+
+from troubadix.__version__ import __version__
+from troubadix.argparser import file_type, file_type_existing
+from troubadix.helper.helper import get_path_from_root
+from troubadix.reporter import Reporter
+from troubadix.results import FileResults, Results
+
+
+def _file_size(file_path: Path) -> int:
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def select_shard(files: Iterable[Path], root: Path, index: int, count: int) -> list[Path]:
+    """Select the files of a shard
+
+    The files are distributed over the shards by size, largest first, always
+    to the shard with the least content so far. The order only depends on the
+    size and the path relative to root, so all shards agree on the
+    distribution for the same checkout.
+
+    Arguments:
+        files   all files to check
+        root    the root directory of the files
+        index   the shard to select, starting at 1
+        count   the number of shards
+
+    Returns
+        The files of the shard, largest first
+    """
+    sized_files = sorted(
+        (-_file_size(file_path), str(get_path_from_root(file_path, root)), file_path)
+        for file_path in files
+    )
+
+    shards = [(0, i) for i in range(1, count + 1)]
+    selected = []
+    for negative_size, _, file_path in sized_files:
+        size, shard = heapq.heappop(shards)
+        if shard == index:
+            selected.append(file_path)
+        heapq.heappush(shards, (size - negative_size, shard))
+
+    return selected
+
+
+class ShardResults:
+    """The results of a single shard, to be merged with the other shards"""
+
+    def __init__(
+        self,
+        root: Path,
+        index: int,
+        count: int,
+        *,
+        map_reduce_plugins: Iterable[str] = (),
+        fix: bool = False,
+        ignore_warnings: bool = False,
+    ) -> None:
+        self.version = __version__
+        self.root = root
+        self.index = index
+        self.count = count
+        self.map_reduce_plugins = list(map_reduce_plugins)
+        self.fix = fix
+        self.ignore_warnings = ignore_warnings
+        self.file_results: list[FileResults] = []
+        self.results: list[Results] = []
+
+    def add(self, results: Results) -> None:
+        if isinstance(results, FileResults):
+            self.file_results.append(results)
+        else:
+            self.results.append(results)
+
+    def rebase(self, root: Path) -> None:
+        """Move the checked files to another root directory, e.g. if the
+        shard ran in another checkout"""
+        for results in self.file_results:
+            results.file_path = root / results.file_path.relative_to(self.root)
+        self.root = root
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "root": str(self.root),
+            "index": self.index,
+            "count": self.count,
+            "map_reduce_plugins": self.map_reduce_plugins,
+            "fix": self.fix,
+            "ignore_warnings": self.ignore_warnings,
+            "file_results": [results.to_json() for results in self.file_results],
+            "results": [results.to_json() for results in self.results],
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "ShardResults":
+        shard_results = ShardResults(
+            Path(data["root"]),
+            data["index"],
+            data["count"],
+            map_reduce_plugins=data["map_reduce_plugins"],
+            fix=data["fix"],
+            ignore_warnings=data["ignore_warnings"],
+        )
+        shard_results.version = data["version"]
+        shard_results.file_results = [
+            FileResults.from_json(results) for results in data["file_results"]
+        ]
+        shard_results.results = [Results.from_json(results) for results in data["results"]]
+        return shard_results
+
+    def write(self, shard_file: Path) -> None:
+        """Write the shard results as JSON. The facts of the map reduce
+        plugins need to be JSON serializable."""
+        shard_file.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+    @staticmethod
+    def read(shard_file: Path) -> "ShardResults":
+        """Read the shard results written by `write`
+
+        Raises:
+            ValueError: if the file is no valid JSON or from another version
+            TypeError: if the file does not contain shard results
+        """
+        data = json.loads(shard_file.read_bytes())
+        if not isinstance(data, dict) or data.get("version") is None:
+            raise TypeError(f"{shard_file} is not a shard results file")
+        if data["version"] != __version__:
+            raise ValueError(
+                f"{shard_file} was created by troubadix {data['version']}, not {__version__}"
+            )
+        try:
+            return ShardResults.from_dict(data)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise TypeError(f"{shard_file} is not a shard results file") from e
+
+
+def check_shards(shards: Sequence[ShardResults]) -> None:
+    """Make sure that the shards belong together and are complete
+
+    Raises:
+        ValueError: if shards are missing or duplicated
+    """
+    if not shards:
+        raise ValueError("No shard results given")
+
+    count = shards[0].count
+    if any(shard.count != count for shard in shards):
+        raise ValueError("The shard results are from runs with different shard counts")
+
+    indexes = sorted(shard.index for shard in shards)
+    if indexes != list(range(1, count + 1)):
+        missing = sorted(set(range(1, count + 1)).difference(indexes))
+        if missing:
+            raise ValueError(
+                f"Missing results of shard(s) {', '.join(f'{i}/{count}' for i in missing)}"
+            )
+        raise ValueError("Duplicate shard results given")
+
+
+def parse_args(args: Sequence[str]) -> Namespace:
+    parser = ArgumentParser(
+        description="Merge the results of a troubadix run split by --shard into a single report.",
+    )
+    parser.add_argument(
+        "shard_files",
+        nargs="+",
+        type=file_type_existing,
+        metavar="SHARD_FILE",
+        help="The shard results files of all shards",
+    )
+    parser.add_argument(
+        "-r",
+        "--root",
+        type=Path,
+        help=(
+            "Root directory for the nasl files, if it differs from the one of the shard runs. "
+            "Default: The root of the first shard."
+        ),
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="count",
+        default=0,
+        help="-v verbose, -vv more verbose, -vvv debug",
+    )
+    parser.add_argument("--log-file", type=file_type, help="Log file path")
+    parser.add_argument(
+        "--log-file-statistic",
+        type=file_type,
+        help="Log file path for troubadix statistic",
+    )
+    parser.add_argument(
+        "--oid-index",
+        type=file_type,
+        metavar="OID_INDEX_FILE",
+        help="Write the OIDs of the VTs of all shards and their files as JSON to the given file",
+    )
+    parser.add_argument(
+        "--no-statistic",
+        action="store_true",
+        help="Don't print the statistic",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Sequence[str] | None = None) -> None:
+    # pylint: disable=import-outside-toplevel
+    from troubadix.runner import Runner
+
+    parsed_args = parse_args(sys.argv[1:] if args is None else args)
+    term = ConsoleTerminal()
+
+    try:
+        shards = [ShardResults.read(shard_file) for shard_file in parsed_args.shard_files]
+        check_shards(shards)
+    except (OSError, ValueError, TypeError) as e:
+        term.error(str(e))
+        sys.exit(1)
+
+    root = parsed_args.root or shards[0].root
+    for shard in shards:
+        shard.rebase(root)
+
+    reporter = Reporter(
+        term=term,
+        root=root,
+        fix=shards[0].fix,
+        log_file=parsed_args.log_file,
+        log_file_statistic=parsed_args.log_file_statistic,
+        statistic=not parsed_args.no_statistic,
+        verbose=parsed_args.verbose,
+        ignore_warnings=shards[0].ignore_warnings,
+    )
+    runner = Runner(
+        n_jobs=1,
+        reporter=reporter,
+        root=root,
+        included_plugins=shards[0].map_reduce_plugins,
+        ignore_warnings=shards[0].ignore_warnings,
+        oid_index=bool(parsed_args.oid_index),
+    )
+
+    success = runner.merge(shards)
+
+    if parsed_args.oid_index:
+        runner.oid_index.write(parsed_args.oid_index)
+        term.info(f"OID index written to {parsed_args.oid_index}")
+
+    if not success:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,10 @@ from subprocess import CalledProcessError
 from pontos.terminal.terminal import ConsoleTerminal
 
 from troubadix.argparser import file_type
+from troubadix.helper.feed_index import CVE_PATTERN
 from troubadix.helper.patterns import _get_special_script_tag_pattern
 from troubadix.standalone_plugins.common import get_merge_base, git
 
-CVE_PATTERN = re.compile(r"CVE-\d{4}-\d{4,}")
-
 
 def compare(old_content: str, current_content: str) -> tuple[list[str], list[str]]:
     old_cves = get_cves_from_content(old_content)
@@ -24,6 +24,8 @@ from collections.abc import Iterable
 from pathlib import Path
 
 from troubadix.argparser import file_type_existing
+from troubadix.helper.feed_index import FeedIndexFile
+from troubadix.helper.oid_index import OIDIndex
 from troubadix.standalone_plugins.common import git
 
 
@@ -52,6 +54,20 @@ def parse_args(args: Iterable[str]) -> Namespace:
             "List of files to diff. If empty use all files added or modified in the commit range."
         ),
     )
+    oid_index_group = parser.add_mutually_exclusive_group()
+    oid_index_group.add_argument(
+        "--oid-index",
+        type=file_type_existing,
+        help=(
+            "OID index written by troubadix --oid-index, to report changed "
+            "OIDs that are already used by another VT."
+        ),
+    )
+    oid_index_group.add_argument(
+        "--feed-index",
+        type=file_type_existing,
+        help="Feed index written by troubadix --feed-index, used like --oid-index.",
+    )
     return parser.parse_args(args=args)
 
 
@@ -71,6 +87,13 @@ def check_oid(args: Namespace) -> bool:
             for f in git("diff", "--name-only", "--diff-filter=d", args.commit_range).splitlines()
         ]
 
+    oid_index = None
+    if args.oid_index:
+        oid_index = OIDIndex.read(args.oid_index)
+    elif args.feed_index:
+        with FeedIndexFile(args.feed_index, read_only=True) as feed_index:
+            oid_index = feed_index.oid_index()
+
     rcode = False
     for nasl_file in args.files:
         if nasl_file.suffix != ".nasl" or not nasl_file.exists():
@@ -112,9 +135,24 @@ def check_oid(args: Namespace) -> bool:
                 file=sys.stderr,
             )
             rcode = True
+
+            new_oid = oid_added.group("oid")
+            indexed_file = oid_index.get(new_oid) if oid_index else None
+            if indexed_file and not _is_same_file(nasl_file, indexed_file):
+                print(
+                    f"OID NEW {new_oid} of VT {nasl_file} is already used by {indexed_file}.",
+                    file=sys.stderr,
+                )
     return rcode
 
 
+def _is_same_file(nasl_file: Path, indexed_file: Path) -> bool:
+    """The files of the index are relative to the root of the VTs, which
+    may be a subdirectory of the repository"""
+    parts = indexed_file.parts
+    return nasl_file.parts[-len(parts) :] == parts
+
+
 def main() -> int:
     args = sys.argv[1:]
 
@@ -29,6 +29,14 @@ def parse_args() -> Namespace:
         default=Feed.COMMON,
         help="Feed selection",
     )
+    parser.add_argument(
+        "--feed-index",
+        action="store_true",
+        help=(
+            "Take the scripts from the feed index within the root, refreshed "
+            "before, instead of reading all of them"
+        ),
+    )
     parser.add_argument(
         "--log",
         type=str.upper,
@@ -10,6 +10,11 @@ from pathlib import Path
 import networkx as nx
 
 from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.feed_index import (
+    ENTERPRISE_FEED_CHECK_PATTERN,
+    FEED_INDEX_FILE,
+    FeedIndexFile,
+)
 from troubadix.helper.helper import is_enterprise_folder
 from troubadix.helper.patterns import (
     ScriptTag,
@@ -37,10 +42,6 @@ from .models import Dependency, Result, Script
 DEPENDENCY_PATTERN = _get_special_script_tag_pattern("dependencies", flags=re.DOTALL | re.MULTILINE)
 CATEGORY_PATTERN = get_special_script_tag_pattern(SpecialScriptTag.CATEGORY)
 DEPRECATED_PATTERN = get_script_tag_pattern(ScriptTag.DEPRECATED)
-ENTERPRISE_FEED_CHECK_PATTERN = re.compile(
-    r'if\s*\(FEED_NAME\s*==\s*"GSF"\s*\|\|\s*FEED_NAME\s*==\s*"GEF"\s*\|\|\s*FEED_NAME\s*==\s*"SCM"\)\s*'
-    r"(?:\{[^}]*\}\s*|[^\{;]*;)"
-)  # Matches specific if blocks used to gate code to run only for enterprise feeds
 
 logging.basicConfig(format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -89,6 +90,43 @@ def get_scripts(directory: Path) -> list[Script]:
     return scripts
 
 
+def get_feed_from_index(feed_index: FeedIndexFile, feed: Feed) -> list[Script]:
+    """Like `get_feed`, but takes the scripts from the feed index instead of
+    reading all of them"""
+    directories = [Path("common")]
+    if feed != Feed.COMMON:
+        directories.append(Path(feed.value))
+
+    vts = list(feed_index)
+    scripts = []
+    for directory in directories:
+        for vt in vts:
+            relative_path = vt.path.relative_to(feed_index.root)
+            if relative_path.parts[0] != directory.name:
+                continue
+
+            relative_path = relative_path.relative_to(directory)
+            if not vt.category or vt.category not in VTCategory.__members__:
+                logger.error(f"Error processing {vt.path}: Script category is missing")
+                continue
+
+            scripts.append(
+                Script(
+                    str(relative_path),
+                    determine_feed(relative_path),
+                    [
+                        Dependency(name, is_enterprise_feed)
+                        for name, is_enterprise_feed in vt.dependencies
+                    ],
+                    VTCategory[vt.category],
+                    # only the script tag, like get_scripts
+                    vt.deprecated_tag,
+                )
+            )
+
+    return scripts
+
+
 def determine_feed(script_relative_path: Path) -> str:
     parts = script_relative_path.parts
     if is_enterprise_folder(parts[0]):
@@ -149,7 +187,12 @@ def main():
 
     logger.info("starting troubadix dependency analysis")
 
-    scripts = get_feed(args.root, args.feed)
+    if args.feed_index:
+        with FeedIndexFile(args.root / FEED_INDEX_FILE) as feed_index:
+            feed_index.refresh()
+            scripts = get_feed_from_index(feed_index, args.feed)
+    else:
+        scripts = get_feed(args.root, args.feed)
     graph = create_graph(scripts)
 
     logger.info(f"nodes (scripts) in graph: {graph.number_of_nodes()}")
@@ -13,6 +13,8 @@ from pathlib import Path
 from pontos.terminal.terminal import ConsoleTerminal
 
 from troubadix.argparser import directory_type, file_type, file_type_existing
+from troubadix.helper.feed_index import FeedIndexFile
+from troubadix.helper.oid_index import OIDIndex
 from troubadix.helper.patterns import (
     ScriptTag,
     SpecialScriptTag,
@@ -139,6 +141,7 @@ def _get_summary(content: str) -> str | None:
 def find_replacement_oid(
     file: DeprecatedFile,
     oid_mapping: dict[str, str] | None = None,
+    oid_index: OIDIndex | None = None,
 ) -> str | None:
     # Get replacement OID if available
     if not oid_mapping:
@@ -154,6 +157,10 @@ def find_replacement_oid(
     replacement_oid = oid_mapping.get(oid)
     if not replacement_oid:
         raise ValueError(f"No replacement OID found for {oid} in {file.name}.")
+    if oid_index is not None and replacement_oid not in oid_index:
+        raise ValueError(
+            f"Replacement OID {replacement_oid} for {file.name} is not used by any VT."
+        )
     return replacement_oid
 
 
@@ -162,6 +169,7 @@ def deprecate(
     to_deprecate: list[DeprecatedFile],
     deprecation_reason: str,
     oid_mapping: dict[str, str] | None = None,
+    oid_index: OIDIndex | None = None,
 ) -> None:
     """Deprecate the selected VTs by removing unnecessary keys, updating the
     summary, and adding the deprecated tag.
@@ -173,6 +181,8 @@ def deprecate(
         deprecation_reason: The reason this VT is being deprecated,
         from a list of options.
         oid_mapping: Optional mapping of file paths to replacement OIDs
+        oid_index: Optional index of the OIDs of the feed, to make sure
+            that the replacement OIDs exist
     """
     output_path.mkdir(parents=True, exist_ok=True)
     for file in to_deprecate:
@@ -180,7 +190,7 @@ def deprecate(
             logger.warning(f"Unable to deprecate {file.name}. There are still KB keys remaining.")
             continue
 
-        replacement_oid = find_replacement_oid(file, oid_mapping)
+        replacement_oid = find_replacement_oid(file, oid_mapping, oid_index)
 
         file.content = update_summary(file, deprecation_reason, replacement_oid)
         file.content = _finalize_content(file.content)
@@ -279,6 +289,24 @@ def parse_args(args: Iterable[str] | None = None) -> Namespace:
             "Found in notus/generator/nasl/transition_layer."
         ),
     )
+    oid_index_group = parser.add_mutually_exclusive_group()
+    oid_index_group.add_argument(
+        "--oid-index",
+        metavar="<oid_index>",
+        default=None,
+        type=file_type_existing,
+        help=(
+            "Path to an OID index written by troubadix --oid-index, to check "
+            "that the replacement OIDs of the transition file exist."
+        ),
+    )
+    oid_index_group.add_argument(
+        "--feed-index",
+        metavar="<feed_index>",
+        default=None,
+        type=file_type_existing,
+        help="Path to a feed index written by troubadix --feed-index, used like --oid-index.",
+    )
     return parser.parse_args(args)
 
 
@@ -300,11 +328,19 @@ def main():
     if args.transition_file:
         oid_mapping = load_transition_oid_mapping(args.transition_file)
 
+    oid_index = None
+    if args.oid_index:
+        oid_index = OIDIndex.read(args.oid_index)
+    elif args.feed_index:
+        with FeedIndexFile(args.feed_index, read_only=True) as feed_index:
+            oid_index = feed_index.oid_index()
+
     deprecate(
         args.output_path,
         parse_files(files),
         args.deprecation_reason,
         oid_mapping,
+        oid_index,
     )
 
 
@@ -29,6 +29,7 @@ from pontos.terminal.terminal import ConsoleTerminal
 
 from troubadix.argparser import directory_type_existing
 from troubadix.helper import CURRENT_ENCODING
+from troubadix.helper.feed_index import FEED_INDEX_FILE, FeedIndexFile
 from troubadix.helper.patterns import (
     ScriptTag,
     SpecialScriptTag,
@@ -112,9 +113,26 @@ def parse_args() -> Namespace:
         "on the date stated in the solution text.",
     )
 
+    parser.add_argument(
+        "--feed-index",
+        action="store_true",
+        help="Only read the VTs without a solution according to the feed index "
+        "within the directory, which is refreshed before",
+    )
+
     return parser.parse_args()
 
 
+def get_files_from_feed_index(root: Path) -> list[Path]:
+    """The VTs, which may have no solution according to the feed index
+    within the root, to not read all VTs"""
+    with FeedIndexFile(root / FEED_INDEX_FILE) as feed_index:
+        feed_index.refresh()
+        return [
+            vt.path for vt in feed_index if vt.solution_type in (None, SOLUTION_TYPE_NONE_AVAILABLE)
+        ]
+
+
 def check_skip_script(file_content: str) -> bool:
     solution_type = SOLUTION_TYPE_PATTERN.search(file_content)
     if solution_type and solution_type.group("value") != SOLUTION_TYPE_NONE_AVAILABLE:
@@ -260,7 +278,7 @@ def main():
 
         root = arguments.directory or Path.cwd()
 
-        files = root.rglob("*.nasl")
+        files = get_files_from_feed_index(root) if arguments.feed_index else root.rglob("*.nasl")
 
         milestones = sorted(arguments.milestones)
 
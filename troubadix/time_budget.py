@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Time budget of the plugins.
+
+Kept apart from the worker, so that e.g. the argument parser can use the
+default budget without importing the plugins.
+"""
+
+import signal
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Seconds a single plugin may spend on a single file
+DEFAULT_PLUGIN_TIMEOUT = 60.0
+
+
+class PluginTimeoutError(BaseException):
+    """A plugin exceeded its time budget
+
+    Derived from BaseException like KeyboardInterrupt, so plugins catching
+    Exception don't swallow it and keep running past their budget.
+    """
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise PluginTimeoutError()
+
+
+@contextmanager
+def time_budget(seconds: float | None) -> Iterator[None]:
+    """Raise a PluginTimeoutError if the code within takes longer than the
+    given seconds, e.g. a regex backtracking on a malformed file.
+
+    The budget relies on SIGALRM and is only enforced in the main thread,
+    which is where the pool processes run their tasks. No budget is
+    enforced for None or 0 seconds.
+    """
+    if not seconds or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
@@ -17,7 +17,10 @@
 
 """Main module for troubadix"""
 
+import sqlite3
+import subprocess
 import sys
+from argparse import Namespace
 from collections.abc import Iterable
 from pathlib import Path
 
@@ -26,9 +29,15 @@ from pontos.terminal.terminal import ConsoleTerminal
 
 from troubadix.__version__ import __version__
 from troubadix.argparser import parse_args
-from troubadix.helper import get_root
+from troubadix.helper import CURRENT_ENCODING, get_root
+from troubadix.helper.feed_index import FEED_INDEX_FILE, FeedIndexFile
+from troubadix.plugins.dependencies import get_dependency_paths
 from troubadix.reporter import Reporter
 from troubadix.runner import Runner
+from troubadix.server import Server, run_client
+from troubadix.standalone_plugins.common import git
+
+NASL_SUFFIXES = (".nasl", ".inc")
 
 
 def generate_file_list(
@@ -95,6 +104,60 @@ def generate_patterns(
     return include_patterns, exclude_patterns
 
 
+def get_changed_files(revision: str) -> list[Path]:
+    """Get the nasl and inc files below the current directory, which changed
+    since the given git revision, including uncommitted and untracked files
+
+    Deleted files are part of the returned list, as the files depending on
+    them need to be checked as well.
+
+    Raises:
+        subprocess.CalledProcessError: if git fails, e.g. for an unknown
+        revision
+    """
+    output = git("diff", "--name-only", "--relative", revision) + git(
+        "ls-files", "--others", "--exclude-standard"
+    )
+    cwd = Path.cwd()
+    return sorted({cwd / name for name in output.splitlines() if name.endswith(NASL_SUFFIXES)})
+
+
+def get_dependent_files(root: Path, files: Iterable[Path]) -> list[Path]:
+    """Get the VTs below root, which list one of the given files in their
+    script_dependencies
+
+    Only direct dependents are returned, as the plugins only look at the
+    direct dependencies of a VT.
+
+    Raises:
+        subprocess.CalledProcessError: if git fails
+    """
+    root = root.resolve()
+    files = {file.resolve() for file in files}
+    if not files:
+        return []
+
+    # let git preselect the VTs mentioning one of the file names, to avoid
+    # reading the whole feed
+    patterns = [arg for name in sorted({file.name for file in files}) for arg in ("-e", name)]
+    try:
+        output = git("-C", str(root), "grep", "-l", "-F", "--untracked", *patterns, "--", "*.nasl")
+    except subprocess.CalledProcessError as e:
+        # no match
+        if e.returncode == 1:
+            return []
+        raise
+
+    dependents = []
+    for name in output.splitlines():
+        candidate = root / name
+        content = candidate.read_text(encoding=CURRENT_ENCODING)
+        if files.intersection(get_dependency_paths(root, content)):
+            dependents.append(candidate)
+
+    return dependents
+
+
 def from_file(include_file: Path, term: Terminal) -> Iterable[Path]:
     """Parse the given file containing a list of files into"""
     try:
@@ -104,6 +167,36 @@ def from_file(include_file: Path, term: Terminal) -> Iterable[Path]:
         sys.exit(1)
 
 
+def serve(parsed_args: Namespace, term: Terminal) -> None:
+    """Run a server for the requests of `troubadix --connect`"""
+    try:
+        server = Server(
+            parsed_args.serve,
+            root=parsed_args.root,
+            n_jobs=parsed_args.n_jobs,
+            feed_index_file=(
+                parsed_args.root / FEED_INDEX_FILE if parsed_args.feed_index else None
+            ),
+            excluded_plugins=parsed_args.excluded_plugins,
+            included_plugins=parsed_args.included_plugins,
+            fix=parsed_args.fix,
+            ignore_warnings=parsed_args.ignore_warnings,
+            cache_dir=parsed_args.cache_dir,
+            cache_max_bytes=parsed_args.cache_max_size * 1024 * 1024,
+            plugin_timeout=parsed_args.plugin_timeout,
+        )
+    except OSError as e:
+        term.error(f"Unable to listen on {parsed_args.serve}: {e}")
+        sys.exit(1)
+
+    term.info(f"Listening on {parsed_args.serve}")
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
 def main(args=None):
     """Main process of greenbone-docker"""
     term = ConsoleTerminal()
@@ -117,6 +210,10 @@ def main(args=None):
         term.info(f"troubadix version {__version__}")
         sys.exit(1)
 
+    if parsed_args.serve:
+        serve(parsed_args, term)
+        return
+
     # Full will run in the root directory of executing. (Like pwd)
     if parsed_args.full:
         cwd = Path.cwd()
@@ -146,6 +243,16 @@ def main(args=None):
     elif parsed_args.files:
         files = parsed_args.files
 
+    elif parsed_args.changed_since:
+        try:
+            files = get_changed_files(parsed_args.changed_since)
+        except subprocess.CalledProcessError as e:
+            term.error(
+                f"Unable to get the files changed since {parsed_args.changed_since}: "
+                f"{e.stderr.strip()}"
+            )
+            sys.exit(1)
+
     if not files:
         term.warning("No files given/found.")
         sys.exit(1)
@@ -160,6 +267,37 @@ def main(args=None):
         first_file = files[0].resolve()
         root = get_root(first_file)
 
+    if parsed_args.changed_since:
+        try:
+            dependents = get_dependent_files(root, files)
+        except subprocess.CalledProcessError as e:
+            term.error(f"Unable to get the dependent files: {e.stderr.strip()}")
+            sys.exit(1)
+
+        term.info(
+            f"{len(files)} files changed since {parsed_args.changed_since}, "
+            f"{len(dependents)} files depend on them"
+        )
+        files = list({file for file in files if file.is_file()} | set(dependents))
+        if not files:
+            term.warning("No files given/found.")
+            sys.exit(1)
+
+    feed_index_file = None
+    if parsed_args.feed_index:
+        feed_index_file = root / FEED_INDEX_FILE
+        try:
+            with FeedIndexFile(feed_index_file, root) as feed_index:
+                statistic = feed_index.refresh(parsed_args.n_jobs)
+        except sqlite3.Error as e:
+            term.error(f"Unable to refresh the feed index {feed_index_file}: {e}")
+            sys.exit(1)
+
+        term.info(
+            f"Feed index: {statistic.parsed} of {statistic.total} VTs parsed, "
+            f"{statistic.removed} removed"
+        )
+
     reporter = Reporter(
         term=term,
         fix=parsed_args.fix,
@@ -171,6 +309,25 @@ def main(args=None):
         ignore_warnings=parsed_args.ignore_warnings,
     )
 
+    if parsed_args.connect:
+        term.info(f"Start linting {len(files)} files on {parsed_args.connect} ... ")
+        try:
+            success = run_client(
+                parsed_args.connect,
+                files,
+                log_file=parsed_args.log_file,
+                log_file_statistic=parsed_args.log_file_statistic,
+                statistic=not parsed_args.no_statistic,
+                verbose=parsed_args.verbose,
+            )
+        except (OSError, RuntimeError) as e:
+            term.error(f"Unable to lint on {parsed_args.connect}: {e}")
+            sys.exit(1)
+
+        if not success:
+            sys.exit(1)
+        return
+
     runner = Runner(
         reporter=reporter,
         n_jobs=parsed_args.n_jobs,
@@ -179,12 +336,40 @@ def main(args=None):
         fix=parsed_args.fix,
         ignore_warnings=parsed_args.ignore_warnings,
         root=root,
+        profile=bool(parsed_args.profile),
+        cache_dir=parsed_args.cache_dir,
+        cache_max_bytes=parsed_args.cache_max_size * 1024 * 1024,
+        shard=parsed_args.shard,
+        plugin_timeout=parsed_args.plugin_timeout,
+        oid_index=bool(parsed_args.oid_index),
+        feed_index_file=feed_index_file,
     )
 
     term.info(f"Start linting {len(files)} files ... ")
 
+    success = runner.run(files)
+
+    if parsed_args.profile:
+        runner.profile.write(parsed_args.profile)
+        term.info(f"Profile written to {parsed_args.profile}")
+
+    if parsed_args.oid_index:
+        if runner.oid_index is not None:
+            runner.oid_index.write(parsed_args.oid_index)
+            term.info(f"OID index written to {parsed_args.oid_index}")
+        else:
+            term.warning("The OID index of a shard is written by troubadix-merge-shards")
+
+    if parsed_args.shard:
+        index, count = parsed_args.shard
+        shard_results = parsed_args.shard_results or Path(
+            f"troubadix-shard-{index}-{count}.results"
+        )
+        runner.shard.write(shard_results)
+        term.info(f"Shard results written to {shard_results}")
+
     # Return exit with 1 if error exist
-    if not runner.run(files):
+    if not success:
         sys.exit(1)
 
 
@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+
+"""Execution of plugins inside the processes of the runner pool.
+
+A `Worker` is created once per pool process by `initializer` and keeps the
+plugin classes, the compiled patterns and the run configuration for all
+tasks of that process. Tasks therefore only carry the paths of the files to
+check instead of pickling the whole `Runner` for every single file.
+"""
+
+import os
+import signal
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from troubadix.cache import ResultCache, plugins_fingerprint
+from troubadix.helper.content_store import ContentStore
+from troubadix.helper.feed_index import FeedIndex
+from troubadix.helper.patterns import (
+    init_script_tag_patterns,
+    init_special_script_tag_patterns,
+)
+from troubadix.plugin import (
+    FilePlugin,
+    FilePluginContext,
+    FilesPlugin,
+    FilesPluginContext,
+    LinterError,
+    MapReducePlugin,
+    Plugin,
+)
+from troubadix.profiling import measure
+from troubadix.results import BatchResults, FileResults, FilesResults, Results
+from troubadix.time_budget import DEFAULT_PLUGIN_TIMEOUT, PluginTimeoutError, time_budget
+
+
+class Worker:
+    """Runs the plugins on the files handed over by the runner"""
+
+    def __init__(
+        self,
+        file_plugins: Iterable[type[FilePlugin]],
+        map_reduce_plugins: Iterable[type[MapReducePlugin]] = (),
+        *,
+        root: Path,
+        fix: bool = False,
+        ignore_warnings: bool = False,
+        profile: bool = False,
+        cache: ResultCache | None = None,
+        plugin_timeout: float | None = DEFAULT_PLUGIN_TIMEOUT,
+        feed_index_file: Path | None = None,
+    ) -> None:
+        self.file_plugins = tuple(file_plugins)
+        self.map_reduce_plugins = tuple(map_reduce_plugins)
+        self.root = root
+        self.fix = fix
+        self.ignore_warnings = ignore_warnings
+        self.profile = profile
+        self.cache = cache
+        self.plugin_timeout = plugin_timeout
+        self.content_store = ContentStore()
+        self.feed_index = FeedIndex(root, self.content_store, feed_index_file)
+        self.fingerprint = (
+            plugins_fingerprint(
+                self.file_plugins + self.map_reduce_plugins,
+                ignore_warnings=ignore_warnings,
+            )
+            if cache
+            else None
+        )
+
+    def setup(self) -> None:
+        """Prepare the process for running the plugins"""
+        init_script_tag_patterns()
+        init_special_script_tag_patterns()
+
+    def check(self, plugin: Plugin, results: Results, timeout: float | None = None) -> Results:
+        """Run a single plugin and collect the results and, if profiling,
+        the time spent in the plugin. The checks of the plugin are run
+        within the time budget of timeout seconds, but not its fix, which
+        must not be interrupted while it rewrites a file."""
+        if not self.profile:
+            return self._check(plugin, results, timeout)
+
+        with measure() as timing:
+            self._check(plugin, results, timeout)
+
+        return results.add_plugin_timing(plugin.name, timing)
+
+    def _check(self, plugin: Plugin, results: Results, timeout: float | None) -> Results:
+        with time_budget(timeout):
+            results.add_plugin_results(plugin.name, plugin.run())
+
+        if self.fix:
+            results.add_plugin_results(plugin.name, plugin.fix())
+
+        return results
+
+    def check_files(
+        self, plugin_class: type[FilesPlugin], context: FilesPluginContext
+    ) -> FilesResults:
+        """Run a files plugin on the files of the context and collect the
+        results together with the time spent. The plugin reads the files
+        from the content store of the worker."""
+        start = time.time()
+        context = FilesPluginContext(
+            root=context.root, nasl_files=context.nasl_files, content_store=self.content_store
+        )
+        results = Results(ignore_warnings=self.ignore_warnings)
+        self.check(plugin_class(context), results)
+        return FilesResults(results, worker=os.getpid(), start=start, end=time.time())
+
+    def check_file(self, file_path: Path) -> FileResults:
+        """Run all file plugins on a single file and collect the results
+        and the facts for the map reduce plugins. The results are taken from
+        the cache if the file and its inputs did not change."""
+        context = FilePluginContext(
+            root=self.root,
+            nasl_file=file_path.resolve(),
+            content_store=self.content_store,
+            feed_index=self.feed_index,
+        )
+
+        if self.cache:
+            key = self.cache.key(
+                self.fingerprint, context, self.file_plugins + self.map_reduce_plugins
+            )
+            results = self.cache.get(key, file_path)
+            if results is not None:
+                return results
+
+        results = FileResults(file_path, ignore_warnings=self.ignore_warnings)
+        timed_out = False
+
+        for plugin_class in self.file_plugins:
+            try:
+                self.check(plugin_class(context), results, self.plugin_timeout)
+            except PluginTimeoutError:
+                self._report_timeout(plugin_class.name, file_path, results)
+                timed_out = True
+
+            if self.fix:
+                # the fix may have rewritten the file
+                self.content_store.release(context.nasl_file)
+
+        for plugin_class in self.map_reduce_plugins:
+            try:
+                with time_budget(self.plugin_timeout), measure() as timing:
+                    results.add_plugin_facts(plugin_class.name, plugin_class.map(context))
+            except PluginTimeoutError:
+                self._report_timeout(plugin_class.name, file_path, results)
+                timed_out = True
+                continue
+
+            if self.profile:
+                results.add_plugin_timing(plugin_class.name, timing)
+
+        # a timeout may depend on the load of the machine, so don't keep it
+        if self.cache and not timed_out:
+            self.cache.put(key, results)
+
+        return results
+
+    def _report_timeout(self, plugin_name: str, file_path: Path, results: Results) -> None:
+        error = LinterError(
+            f"Plugin {plugin_name} exceeded {self.plugin_timeout:g} seconds on file {file_path}",
+            file=file_path,
+            plugin=plugin_name,
+        )
+        results.add_plugin_results(plugin_name, iter([error]))
+
+    def check_file_batch(self, file_paths: Iterable[Path]) -> BatchResults:
+        """Run all file plugins on a batch of files and collect the results"""
+        start = time.time()
+        file_results = [self.check_file(file_path) for file_path in file_paths]
+        return BatchResults(file_results, worker=os.getpid(), start=start, end=time.time())
+
+
+# pylint: disable=invalid-name
+_worker: Worker | None = None
+
+
+def initializer(worker: Worker) -> None:
+    """Set up a pool process: Ignore CTRL+C and keep the worker for all
+    tasks executed by this process."""
+    # pylint: disable=global-statement
+    global _worker
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _worker = worker
+    _worker.setup()
+
+
+def check_files(plugin_class: type[FilesPlugin], context: FilesPluginContext) -> FilesResults:
+    """Pool task: Run a files plugin in the worker of this process"""
+    return _worker.check_files(plugin_class, context)
+
+
+def check_file(file_path: Path) -> FileResults:
+    """Pool task: Run all file plugins on a file in the worker of this
+    process"""
+    return _worker.check_file(file_path)
+
+
+def check_file_batch(file_paths: list[Path]) -> BatchResults:
+    """Pool task: Run all file plugins on a batch of files in the worker of
+    this process"""
+    return _worker.check_file_batch(file_paths)